@@ -0,0 +1,74 @@
+# apps/common/canonical_json.py
+"""
+Streaming canonical-JSON hashing.
+
+``json.dumps(obj, ensure_ascii=False, sort_keys=True)`` 와 바이트 단위로 동일한
+출력을 전체 문자열로 만들지 않고 hashlib 객체에 ``chunk_size`` 단위로 흘려보낸다.
+
+- 상위 ``_MAX_DEPTH`` 단계의 dict 는 정렬된 키 단위로, 긴 list 는 ``_LIST_CHUNK``
+  원소 단위로 나눠 C 인코더(``JSONEncoder.encode``)로 직렬화한다.
+- 그보다 깊은 값은 한 번에 C 인코더로 직렬화 (순수 Python ``iterencode`` 대비 빠름).
+- 일시 할당은 문서 전체가 아니라 가장 큰 조각 + ``chunk_size`` 로 제한된다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Callable, List
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+_MAX_DEPTH = 3
+_LIST_CHUNK = 256
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, sort_keys=True)
+
+
+def _stream(obj: Any, write: Callable[[str], None], depth: int) -> None:
+    encode = _ENCODER.encode
+    if depth < _MAX_DEPTH and isinstance(obj, dict) and obj and all(isinstance(k, str) for k in obj):
+        write("{")
+        for n, key in enumerate(sorted(obj)):
+            if n:
+                write(", ")
+            write(encode(key))
+            write(": ")
+            _stream(obj[key], write, depth + 1)
+        write("}")
+    elif depth < _MAX_DEPTH and isinstance(obj, (list, tuple)) and len(obj) > _LIST_CHUNK:
+        write("[")
+        for start in range(0, len(obj), _LIST_CHUNK):
+            if start:
+                write(", ")
+            # "[a, b, c]" 에서 괄호만 떼어내면 dumps 의 원소 구분자와 동일
+            write(encode(list(obj[start : start + _LIST_CHUNK]))[1:-1])
+        write("]")
+    else:
+        write(encode(obj))
+
+
+def update_canonical(hasher: Any, obj: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    """``obj`` 의 canonical JSON(UTF-8)을 ``hasher.update`` 로 스트리밍."""
+    buf: List[str] = []
+    size = 0
+
+    def write(piece: str) -> None:
+        nonlocal size
+        buf.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            hasher.update("".join(buf).encode("utf-8"))
+            buf.clear()
+            size = 0
+
+    _stream(obj, write, 0)
+    if buf:
+        hasher.update("".join(buf).encode("utf-8"))
+    return hasher
+
+
+def canonical_sha256(obj: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """``sha256(json.dumps(obj, ensure_ascii=False, sort_keys=True).encode())`` 와 동일한 hex digest."""
+    return update_canonical(hashlib.sha256(), obj, chunk_size).hexdigest()
+
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "canonical_sha256", "update_canonical"]
@@ -7,6 +7,7 @@ Features (v0.5.11u-7):
 - gzip encoding with configurable level
 - Accept-Encoding negotiation
 - Metrics tracking (bytes saved)
+- Per-namespace codec/threshold policy for cache values (CompressionPolicy)
 """
 from __future__ import annotations
 
@@ -14,6 +15,7 @@ import gzip
 import io
 import os
 import logging
+from dataclasses import dataclass
 from typing import Tuple
 
 log = logging.getLogger(__name__)
@@ -23,6 +25,9 @@ _COMPRESS_ENABLE = os.getenv("DECISIONOS_COMPRESS_ENABLE", "1") in ("1", "true",
 _MIN_BYTES = int(os.getenv("DECISIONOS_COMPRESS_MIN_BYTES", "4096"))
 _GZIP_LEVEL = int(os.getenv("DECISIONOS_GZIP_LEVEL", "6"))
 
+_GZIP_MAGIC = b"\x1f\x8b"
+CODECS = ("gzip", "none")
+
 
 def should_compress(length: int) -> bool:
     """
@@ -143,3 +148,90 @@ def bytes_saved(original_size: int, compressed_size: int) -> int:
         Bytes saved (can be negative if compression increases size)
     """
     return original_size - compressed_size
+
+
+def is_gzip(data: bytes) -> bool:
+    """
+    Check for the gzip magic header.
+
+    Args:
+        data: Stored bytes
+
+    Returns:
+        True if data looks gzip-compressed
+    """
+    return data[:2] == _GZIP_MAGIC
+
+
+def maybe_gunzip(data: bytes) -> bytes:
+    """
+    Decompress data only if it carries the gzip header (values below the threshold are stored raw).
+
+    Args:
+        data: Stored bytes
+
+    Returns:
+        Decompressed or unchanged bytes
+    """
+    return gunzip_bytes(data) if is_gzip(data) else data
+
+
+@dataclass(frozen=True)
+class CompressionPolicy:
+    """
+    Codec and size threshold for one cache namespace.
+
+    Attributes:
+        codec: "gzip" or "none"
+        min_bytes: Values shorter than this are stored raw
+        level: gzip level (1-9)
+    """
+
+    codec: str = "gzip"
+    min_bytes: int = _MIN_BYTES
+    level: int = _GZIP_LEVEL
+
+    def encode(self, data: bytes) -> bytes:
+        """
+        Compress data if the policy applies to its size.
+
+        Args:
+            data: Raw bytes
+
+        Returns:
+            gzip bytes or the input unchanged
+        """
+        if self.codec == "gzip" and _COMPRESS_ENABLE and len(data) >= self.min_bytes:
+            return gzip_bytes(data, level=self.level)
+        return data
+
+    @staticmethod
+    def decode(data: bytes) -> bytes:
+        return maybe_gunzip(data)
+
+
+def policy_for(namespace: str) -> CompressionPolicy:
+    """
+    Compression policy for a cache namespace.
+
+    Reads DECISIONOS_COMPRESS_<NS>_CODEC / _MIN_BYTES / _LEVEL (NS upper-cased,
+    non-alphanumerics as "_"), falling back to the global settings.
+
+    Args:
+        namespace: Cache namespace, e.g. "snapshot" or "etag"
+
+    Returns:
+        CompressionPolicy
+
+    Examples:
+        >>> policy_for("etag").codec in CODECS
+        True
+    """
+    ns = "".join(ch if ch.isalnum() else "_" for ch in namespace.upper())
+    codec = os.getenv(f"DECISIONOS_COMPRESS_{ns}_CODEC", "gzip").strip().lower()
+    if codec not in CODECS:
+        log.warning("unknown compression codec %r for %s, using gzip", codec, namespace)
+        codec = "gzip"
+    min_bytes = int(os.getenv(f"DECISIONOS_COMPRESS_{ns}_MIN_BYTES", str(_MIN_BYTES)))
+    level = int(os.getenv(f"DECISIONOS_COMPRESS_{ns}_LEVEL", str(_GZIP_LEVEL)))
+    return CompressionPolicy(codec=codec, min_bytes=min_bytes, level=level)
@@ -1,37 +1,144 @@
 """Lightweight in-memory Prometheus-compatible metrics registry.
 
 No external dependencies (no redis, no prometheus_client).
-Thread-safe counters, gauges, and info metrics.
+Thread-safe counters, gauges, histograms, summaries and info metrics.
+
+- 라벨 벡터: ``REG.counter("x", labelnames=("route", "status")).labels(route="/j", status="200")``
+- hot path 갱신은 스레드별 stripe 락으로 분산 (단일 락 경합 없음)
+- ``render_text`` 는 값이 바뀐 시계열만 다시 포맷 (나머지는 캐시 재사용)
 """
 from __future__ import annotations
 
+import bisect
+import itertools
+import math
 import threading
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from apps.common.quantile import DDSketch
+
+_STRIPES = 8
+_stripe_seq = itertools.count()
+_stripe_local = threading.local()
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0,
+)
+DEFAULT_QUANTILES: Tuple[float, ...] = (0.5, 0.9, 0.99)
+
+
+def _stripe() -> int:
+    """현재 스레드에 고정 배정된 stripe 인덱스 (라운드로빈)."""
+    idx = getattr(_stripe_local, "idx", None)
+    if idx is None:
+        idx = next(_stripe_seq) % _STRIPES
+        _stripe_local.idx = idx
+    return idx
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt_labels(pairs: Iterable[Tuple[str, Any]]) -> str:
+    body = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+    return f"{{{body}}}" if body else ""
+
+
+def _fmt_value(val: float) -> str:
+    if isinstance(val, float):
+        if math.isinf(val):
+            return "+Inf" if val > 0 else "-Inf"
+        if math.isnan(val):
+            return "NaN"
+    return str(val)
+
 
+class _LabeledMixin:
+    """``labels()`` 로 자식 시계열을 만드는 공통 로직."""
 
-class Counter:
-    def __init__(self, name: str, help_text: str = ""):
+    name: str
+    labelnames: Tuple[str, ...]
+
+    def _init_labels(self, labelnames: Sequence[str]) -> None:
+        self.labelnames = tuple(labelnames)
+        self.labelvalues: Tuple[str, ...] = ()
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._children_lock = threading.Lock()
+
+    def _new_child(self, labelvalues: Tuple[str, ...]) -> Any:  # pragma: no cover - abstract
+        raise NotImplementedError
+
+    def labels(self, *values: Any, **kwargs: Any):
+        if not self.labelnames:
+            raise ValueError(f"metric {self.name} has no labels")
+        if values and kwargs:
+            raise ValueError("pass label values positionally or by name, not both")
+        if kwargs:
+            if set(kwargs) != set(self.labelnames):
+                raise ValueError(f"metric {self.name} expects labels {self.labelnames}")
+            values = tuple(kwargs[n] for n in self.labelnames)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"metric {self.name} expects labels {self.labelnames}")
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._children_lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child(key)
+                    child.labelvalues = key
+                    self._children[key] = child
+        return child
+
+    def _series(self) -> List[Any]:
+        """렌더링 대상 시계열 (라벨이 있으면 자식들, 없으면 자기 자신)."""
+        if not self.labelnames:
+            return [self]
+        with self._children_lock:
+            return list(self._children.values())
+
+    def _check_unlabeled(self) -> None:
+        if self.labelnames and not self.labelvalues:
+            raise ValueError(f"metric {self.name} requires labels(); call .labels(...) first")
+
+
+class Counter(_LabeledMixin):
+    def __init__(self, name: str, help_text: str = "", labelnames: Sequence[str] = ()):
         self.name = name
         self.help = help_text
-        self._value = 0
-        self._lock = threading.Lock()
+        self._init_labels(labelnames)
+        self._values = [0] * _STRIPES
+        self._locks = [threading.Lock() for _ in range(_STRIPES)]
+
+    def _new_child(self, labelvalues: Tuple[str, ...]) -> "Counter":
+        return Counter(self.name, self.help)
 
     def inc(self, amount: int = 1):
-        with self._lock:
-            self._value += amount
+        self._check_unlabeled()
+        idx = _stripe()
+        with self._locks[idx]:
+            self._values[idx] += amount
 
     def get(self) -> int:
-        with self._lock:
-            return self._value
+        total = 0
+        for idx in range(_STRIPES):
+            with self._locks[idx]:
+                total += self._values[idx]
+        return total
 
 
-class Gauge:
-    def __init__(self, name: str, help_text: str = ""):
+class Gauge(_LabeledMixin):
+    def __init__(self, name: str, help_text: str = "", labelnames: Sequence[str] = ()):
         self.name = name
         self.help = help_text
+        self._init_labels(labelnames)
         self._value = 0.0
         self._lock = threading.Lock()
 
+    def _new_child(self, labelvalues: Tuple[str, ...]) -> "Gauge":
+        return Gauge(self.name, self.help)
+
     def set(self, val: float):
         with self._lock:
             self._value = val
@@ -49,6 +156,91 @@ class Gauge:
             return self._value
 
 
+class Histogram(_LabeledMixin):
+    """고정 버킷 히스토그램 (``le`` 누적 버킷 + ``_sum`` + ``_count``)."""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str = "",
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help = help_text
+        self._init_labels(labelnames)
+        bounds = sorted(float(b) for b in buckets if not math.isinf(float(b)))
+        self.buckets: Tuple[float, ...] = tuple(bounds)
+        width = len(self.buckets) + 1  # 마지막 칸은 +Inf
+        self._counts = [[0] * width for _ in range(_STRIPES)]
+        self._sums = [0.0] * _STRIPES
+        self._locks = [threading.Lock() for _ in range(_STRIPES)]
+
+    def _new_child(self, labelvalues: Tuple[str, ...]) -> "Histogram":
+        return Histogram(self.name, self.help, buckets=self.buckets)
+
+    def observe(self, value: float):
+        self._check_unlabeled()
+        pos = bisect.bisect_left(self.buckets, value)
+        idx = _stripe()
+        with self._locks[idx]:
+            self._counts[idx][pos] += 1
+            self._sums[idx] += value
+
+    def get(self) -> Tuple[Tuple[int, ...], float, int]:
+        """(누적 버킷 카운트, 합계, 총 개수)."""
+        width = len(self.buckets) + 1
+        counts = [0] * width
+        total_sum = 0.0
+        for idx in range(_STRIPES):
+            with self._locks[idx]:
+                row = self._counts[idx]
+                for i in range(width):
+                    counts[i] += row[i]
+                total_sum += self._sums[idx]
+        cumulative = tuple(itertools.accumulate(counts))
+        return cumulative, total_sum, cumulative[-1]
+
+
+class Summary(_LabeledMixin):
+    """``_sum``/``_count`` + DDSketch 기반 분위수 (프로세스 시작 이후 누적)."""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str = "",
+        labelnames: Sequence[str] = (),
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    ):
+        self.name = name
+        self.help = help_text
+        self._init_labels(labelnames)
+        self.quantiles: Tuple[float, ...] = tuple(quantiles)
+        self._sketches = [DDSketch() for _ in range(_STRIPES)]
+        self._sums = [0.0] * _STRIPES
+        self._locks = [threading.Lock() for _ in range(_STRIPES)]
+
+    def _new_child(self, labelvalues: Tuple[str, ...]) -> "Summary":
+        return Summary(self.name, self.help, quantiles=self.quantiles)
+
+    def observe(self, value: float):
+        self._check_unlabeled()
+        idx = _stripe()
+        with self._locks[idx]:
+            self._sketches[idx].add(value)
+            self._sums[idx] += value
+
+    def get(self) -> Tuple[Tuple[Optional[float], ...], float, int]:
+        """(분위수 값들, 합계, 총 개수)."""
+        merged = DDSketch()
+        total_sum = 0.0
+        for idx in range(_STRIPES):
+            with self._locks[idx]:
+                merged.merge(self._sketches[idx])
+                total_sum += self._sums[idx]
+        return tuple(merged.quantiles(self.quantiles)), total_sum, merged.count
+
+
 class Info:
     """Info metric: labels only, value always 1."""
 
@@ -68,55 +260,119 @@ class Info:
             return self._label_values, 1
 
 
+def _render_series(kind: str, metric: Any, labelnames: Tuple[str, ...], state: Any) -> List[str]:
+    name = metric.name
+    base = list(zip(labelnames, getattr(metric, "labelvalues", ())))
+    if kind in ("counter", "gauge"):
+        return [f"{name}{_fmt_labels(base)} {_fmt_value(state)}"]
+    if kind == "histogram":
+        cumulative, total_sum, count = state
+        lines = [
+            f"{name}_bucket{_fmt_labels(base + [('le', _fmt_value(bound))])} {cumulative[i]}"
+            for i, bound in enumerate(metric.buckets)
+        ]
+        lines.append(f"{name}_bucket{_fmt_labels(base + [('le', '+Inf')])} {count}")
+        lines.append(f"{name}_sum{_fmt_labels(base)} {_fmt_value(total_sum)}")
+        lines.append(f"{name}_count{_fmt_labels(base)} {count}")
+        return lines
+    if kind == "summary":
+        values, total_sum, count = state
+        lines = [
+            f"{name}{_fmt_labels(base + [('quantile', _fmt_value(q))])} {_fmt_value(v if v is not None else float('nan'))}"
+            for q, v in zip(metric.quantiles, values)
+        ]
+        lines.append(f"{name}_sum{_fmt_labels(base)} {_fmt_value(total_sum)}")
+        lines.append(f"{name}_count{_fmt_labels(base)} {count}")
+        return lines
+    label_values, val = state  # info
+    if label_values:
+        return [f"{name}{_fmt_labels(zip(metric.labels, label_values))} {val}"]
+    return [f"{name} {val}"]
+
+
 class Registry:
     def __init__(self):
         self._counters: Dict[str, Counter] = {}
         self._gauges: Dict[str, Gauge] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._summaries: Dict[str, Summary] = {}
         self._infos: Dict[str, Info] = {}
         self._lock = threading.Lock()
+        # (kind, name, labelvalues) -> (state, rendered lines)
+        self._render_cache: Dict[Tuple[str, str, Tuple[str, ...]], Tuple[Any, List[str]]] = {}
 
-    def counter(self, name: str, help_text: str = "") -> Counter:
+    def counter(self, name: str, help_text: str = "", labelnames: Sequence[str] = ()) -> Counter:
         with self._lock:
             if name not in self._counters:
-                self._counters[name] = Counter(name, help_text)
+                self._counters[name] = Counter(name, help_text, labelnames)
             return self._counters[name]
 
-    def gauge(self, name: str, help_text: str = "") -> Gauge:
+    def gauge(self, name: str, help_text: str = "", labelnames: Sequence[str] = ()) -> Gauge:
         with self._lock:
             if name not in self._gauges:
-                self._gauges[name] = Gauge(name, help_text)
+                self._gauges[name] = Gauge(name, help_text, labelnames)
             return self._gauges[name]
 
+    def histogram(
+        self,
+        name: str,
+        help_text: str = "",
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(name, help_text, labelnames, buckets)
+            return self._histograms[name]
+
+    def summary(
+        self,
+        name: str,
+        help_text: str = "",
+        labelnames: Sequence[str] = (),
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    ) -> Summary:
+        with self._lock:
+            if name not in self._summaries:
+                self._summaries[name] = Summary(name, help_text, labelnames, quantiles)
+            return self._summaries[name]
+
     def info(self, name: str, labels: Tuple[str, ...] = (), help_text: str = "") -> Info:
         with self._lock:
             if name not in self._infos:
                 self._infos[name] = Info(name, labels, help_text)
             return self._infos[name]
 
+    def _cached_lines(self, kind: str, metric: Any, labelnames: Tuple[str, ...]) -> List[str]:
+        state = metric.get()
+        key = (kind, metric.name, getattr(metric, "labelvalues", ()))
+        hit = self._render_cache.get(key)
+        if hit is not None and hit[0] == state:
+            return hit[1]
+        lines = _render_series(kind, metric, labelnames, state)
+        self._render_cache[key] = (state, lines)
+        return lines
+
     def render_text(self) -> str:
         """Render all metrics in Prometheus text exposition format."""
         lines = []
         with self._lock:
-            for c in self._counters.values():
-                if c.help:
-                    lines.append(f"# HELP {c.name} {c.help}")
-                lines.append(f"# TYPE {c.name} counter")
-                lines.append(f"{c.name} {c.get()}")
-            for g in self._gauges.values():
-                if g.help:
-                    lines.append(f"# HELP {g.name} {g.help}")
-                lines.append(f"# TYPE {g.name} gauge")
-                lines.append(f"{g.name} {g.get()}")
+            families: List[Tuple[str, Any]] = []
+            families.extend(("counter", m) for m in self._counters.values())
+            families.extend(("gauge", m) for m in self._gauges.values())
+            families.extend(("histogram", m) for m in self._histograms.values())
+            families.extend(("summary", m) for m in self._summaries.values())
+            for kind, metric in families:
+                if metric.help:
+                    lines.append(f"# HELP {metric.name} {metric.help}")
+                lines.append(f"# TYPE {metric.name} {kind}")
+                for series in metric._series():
+                    lines.extend(self._cached_lines(kind, series, metric.labelnames))
             for info in self._infos.values():
                 if info.help:
                     lines.append(f"# HELP {info.name} {info.help}")
                 lines.append(f"# TYPE {info.name} gauge")
-                label_values, val = info.get()
-                if label_values:
-                    label_str = ",".join(f'{k}="{v}"' for k, v in zip(info.labels, label_values))
-                    lines.append(f"{info.name}{{{label_str}}} {val}")
-                else:
-                    lines.append(f"{info.name} {val}")
+                lines.extend(self._cached_lines("info", info, info.labels))
         return "\n".join(lines) + "\n"
 
 
@@ -124,4 +380,4 @@ class Registry:
 REG = Registry()
 
 
-__all__ = ["Counter", "Gauge", "Info", "Registry", "REG"]
+__all__ = ["Counter", "Gauge", "Histogram", "Summary", "Info", "Registry", "REG"]
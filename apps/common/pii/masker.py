@@ -1,29 +1,120 @@
 from __future__ import annotations
 
-import copy
 import os
 import re
-from typing import Any, Dict, Iterable
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple
 
 from .patterns import load_profile
 
+_LEADING_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+
+def _scoped(pattern: str) -> str:
+    """선두 전역 플래그 ``(?i)...`` → 지역 플래그 ``(?i:...)`` (alternation 결합용)."""
+    m = _LEADING_FLAGS.match(pattern)
+    if not m:
+        return f"(?:{pattern})"
+    return f"(?{m.group(1)}:{pattern[m.end():]})"
+
+
+def _context_sensitive(pattern: str) -> bool:
+    """문자 클래스 밖에 앵커(``^ $ \\A \\Z``)나 전후방 탐색이 있는 패턴인지.
+
+    이런 패턴은 값 문자열 단독으로는 매치돼도 JSON 본문 전체(따옴표/키 사이)에서는 매치되지 않을 수 있다.
+    """
+    i, in_class = 0, False
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            if not in_class and pattern[i + 1 : i + 2] in ("A", "Z"):
+                return True
+            i += 2
+            continue
+        if in_class:
+            if ch == "]":
+                in_class = False
+        elif ch == "[":
+            in_class = True
+            i += 2 if pattern[i + 1 : i + 2] == "^" else 1  # 부정 클래스의 ^ 와 선두 ] 는 리터럴
+            continue
+        elif ch in "^$":
+            return True
+        elif pattern.startswith(("(?=", "(?!", "(?<=", "(?<!"), i):
+            return True
+        i += 1
+    return False
+
+
+def _combine(regex: List[Tuple[str, Pattern[str]]]) -> Optional[Pattern[str]]:
+    """패턴들을 이름 그룹 alternation 하나로 결합. 결합 불가(역참조 등)면 None."""
+    parts = []
+    for idx, (name, rx) in enumerate(regex):
+        if rx.groups or "(?P=" in rx.pattern:
+            return None  # 그룹 번호/이름이 섞이면 의미가 달라질 수 있음
+        group = name if name.isidentifier() and not name.startswith("_") else f"_p{idx}"
+        parts.append(f"(?P<{group}>{_scoped(rx.pattern)})")
+    if not parts:
+        return None
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
 
 class PIIMasker:
+    """프로파일 정규식 기반 마스커.
+
+    패턴은 가능하면 이름 그룹 alternation 하나로 결합되어 문자열당 한 번만 스캔한다
+    (겹치는 매치는 왼쪽 우선, 같은 위치면 프로파일 순서 우선). 결합할 수 없는 패턴
+    (캡처 그룹/역참조 포함)이 있으면 기존처럼 패턴별 ``sub`` 를 순차 적용한다.
+    """
+
     def __init__(
         self,
         *,
         allowlist: Iterable[str] | None = None,
         mask_token: str | None = None,
+        profile: Dict[str, Any] | None = None,
     ) -> None:
-        profile = load_profile()
+        profile = profile if profile is not None else load_profile()
         self._mask = mask_token or os.getenv("DECISIONOS_PII_MASK_TOKEN", profile.get("strategy", {}).get("mask", "[REDACTED]"))
         self._allow = {k.strip() for k in (allowlist or []) if k.strip()}
         patterns = profile.get("patterns", {})
         self._regex = [(name, re.compile(pattern)) for name, pattern in patterns.items() if pattern]
+        # 마스크 토큰에 템플릿 이스케이프가 있으면 re.sub 템플릿 의미를 유지하려 순차 경로 사용
+        self._combined = _combine(self._regex) if "\\" not in self._mask else None
+        # 앵커/전후방 탐색 패턴은 본문 전체 탐색으로 "후보 없음"을 보장할 수 없음
+        self._prefilter_safe = not any(_context_sensitive(rx.pattern) for _, rx in self._regex)
+
+    @property
+    def mask_token(self) -> str:
+        return self._mask
+
+    @property
+    def allowlist(self) -> frozenset:
+        return frozenset(self._allow)
+
+    def has_candidates(self, text: str) -> bool:
+        """``text`` 안에 마스킹 대상 패턴이 하나라도 있을 수 있는지 (치환 없이 탐색만).
+
+        False 는 ``text`` 의 어떤 부분 문자열에도 매치가 없다는 뜻. 앵커/전후방 탐색 패턴이 있는
+        프로파일은 부분 문자열 매치를 전체 탐색으로 판정할 수 없으므로 항상 True.
+        """
+        if not self._prefilter_safe:
+            return True
+        if self._combined is not None:
+            return self._combined.search(text) is not None
+        return any(regex.search(text) for _, regex in self._regex)
 
     def mask_text(self, text: str) -> str:
         if not isinstance(text, str):
             return text
+        if self._combined is not None:
+            if self._combined.search(text) is None:
+                return text
+            mask = self._mask
+            return self._combined.sub(lambda _m: mask, text)
         out = text
         for _, regex in self._regex:
             out = regex.sub(self._mask, out)
@@ -35,22 +126,61 @@ class PIIMasker:
         return self.mask_event(value)
 
     def mask_event(self, obj: Any) -> Any:
+        """copy-on-write 마스킹: 값이 바뀐 컨테이너만 새로 만들고, 그대로인 하위 트리는 공유."""
         if isinstance(obj, dict):
-            masked: Dict[str, Any] = {}
+            masked: Optional[Dict[str, Any]] = None
             for k, v in obj.items():
-                masked[k] = self._mask_value(k, v)
-            return masked
+                nv = self._mask_value(k, v)
+                if nv is not v and masked is None:
+                    masked = dict(obj)
+                if masked is not None:
+                    masked[k] = nv
+            return obj if masked is None else masked
         if isinstance(obj, list):
-            return [self.mask_event(v) for v in obj]
+            out: Optional[List[Any]] = None
+            for i, v in enumerate(obj):
+                nv = self.mask_event(v)
+                if nv is not v and out is None:
+                    out = list(obj)
+                if out is not None:
+                    out[i] = nv
+            return obj if out is None else out
         if isinstance(obj, str):
             return self.mask_text(obj)
         return obj
 
 
+_CACHE_LOCK = threading.Lock()
+_CACHE: Tuple[Optional[tuple], Optional[PIIMasker]] = (None, None)
+
+
+def _cache_key() -> tuple:
+    profile_path = os.getenv("DECISIONOS_PII_PROFILE", "configs/pii/profile.json")
+    try:
+        st = os.stat(profile_path)
+        file_id: Optional[Tuple[int, int, int]] = (st.st_ino, st.st_mtime_ns, st.st_size)
+    except OSError:
+        file_id = None
+    return (
+        profile_path,
+        file_id,
+        os.getenv("DECISIONOS_PII_MASK_TOKEN"),
+        os.getenv("DECISIONOS_PII_ALLOWLIST", ""),
+    )
+
+
 def build_masker() -> PIIMasker:
-    allow = os.getenv("DECISIONOS_PII_ALLOWLIST", "")
-    allowlist = [tok.strip() for tok in allow.split(",") if tok.strip()]
-    return PIIMasker(allowlist=allowlist)
+    """프로세스 공유 마스커. 프로파일 파일(mtime/inode/size)이나 관련 env 가 바뀌면 재구성."""
+    global _CACHE
+    key = _cache_key()
+    cached_key, masker = _CACHE
+    if masker is not None and cached_key == key:
+        return masker
+    allowlist = [tok.strip() for tok in key[3].split(",") if tok.strip()]
+    masker = PIIMasker(allowlist=allowlist, profile=load_profile(key[0]))
+    with _CACHE_LOCK:
+        _CACHE = (key, masker)
+    return masker
 
 
 def mask_text(text: str) -> str:
@@ -58,4 +188,5 @@ def mask_text(text: str) -> str:
 
 
 def mask_event(event: Dict[str, Any]) -> Dict[str, Any]:
-    return build_masker().mask_event(copy.deepcopy(event))
+    # 입력은 변경하지 않는다; 마스킹되지 않은 하위 트리는 입력과 공유될 수 있음
+    return build_masker().mask_event(event)
@@ -0,0 +1,171 @@
+"""JSON 바이트 스트림용 증분 PII 마스킹.
+
+``json.loads`` → walk → ``json.dumps`` 없이 청크 단위로 JSON 토큰(문자열/구조 문자)만
+정규식으로 훑어, *값* 문자열에만 ``PIIMasker.mask_text`` 를 적용한다. 키, 숫자,
+공백과 바뀌지 않은 문자열은 원본 바이트 그대로 흘려보낸다.
+
+- ``PIIMasker.mask_event`` / ``PIIMiddleware(response_fields=...)`` 와 동일한 allowlist 범위
+- 청크 경계에 걸린 문자열만 다음 청크까지 보관하며, 보관 크기가 ``max_buffer`` 를 넘는
+  문자열은 통째로 마스크 토큰으로 대체한다 (fail-closed, 메모리 상한)
+- ``mask_once`` 는 후보 패턴이 없는 본문을 토큰화 없이 그대로 반환하는 빠른 경로
+"""
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Iterable, List, Optional, Tuple
+
+from .masker import PIIMasker
+
+DEFAULT_MAX_BUFFER = 1024 * 1024
+
+# 완결 문자열 | 닫히지 않은 문자열 시작 | 구조 문자
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|"|[{}\[\]:,]', re.DOTALL)
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+
+class _Frame:
+    __slots__ = ("is_object", "skip", "in_field", "expect_key", "key")
+
+    def __init__(self, is_object: bool, skip: bool, in_field: bool) -> None:
+        self.is_object = is_object
+        self.skip = skip
+        self.in_field = in_field
+        self.expect_key = is_object
+        self.key: Optional[str] = None
+
+
+class JSONStreamMasker:
+    """한 개 JSON 본문을 청크 단위로 마스킹하는 상태 기계 (본문마다 새로 생성)."""
+
+    def __init__(
+        self,
+        masker: PIIMasker,
+        *,
+        response_fields: Iterable[str] = (),
+        max_buffer: int = DEFAULT_MAX_BUFFER,
+    ) -> None:
+        self._masker = masker
+        self._allow = masker.allowlist
+        self._fields = frozenset(response_fields)
+        self._max_buffer = max_buffer
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="surrogateescape")
+        self._stack: List[_Frame] = []
+        self._carry = ""
+        self._discarding = False  # 상한 초과 문자열의 나머지를 버리는 중
+        self._escaped = False
+
+    # -- 값 위치 속성 --------------------------------------------------
+    def _child(self) -> Tuple[bool, bool]:
+        """다음 값의 (skip, in_field). mask_event/response_fields walk 의 allowlist 범위와 동일."""
+        if not self._stack:
+            return False, False
+        top = self._stack[-1]
+        if not top.is_object:
+            return top.skip, top.in_field
+        key = top.key
+        allow_applies = not self._fields or top.in_field
+        skip = top.skip or (allow_applies and key in self._allow)
+        return skip, top.in_field or key in self._fields
+
+    def _string(self, token: str) -> str:
+        top = self._stack[-1] if self._stack else None
+        if top is not None and top.is_object and top.expect_key:
+            top.key = json.loads(token) if "\\" in token else token[1:-1]
+            return token
+        skip, _ = self._child()
+        if skip:
+            return token
+        value = json.loads(token) if "\\" in token else token[1:-1]
+        masked = self._masker.mask_text(value)
+        return token if masked is value or masked == value else json.dumps(masked, ensure_ascii=False)
+
+    def _structural(self, ch: str) -> None:
+        if ch == "{" or ch == "[":
+            skip, in_field = self._child()
+            self._stack.append(_Frame(ch == "{", skip, in_field))
+        elif ch == "}" or ch == "]":
+            if self._stack:
+                self._stack.pop()
+        elif ch == ":":
+            if self._stack:
+                self._stack[-1].expect_key = False
+        elif ch == ",":
+            top = self._stack[-1] if self._stack else None
+            if top is not None and top.is_object:
+                top.expect_key = True
+                top.key = None
+
+    # -- 상한 초과 문자열 처리 --------------------------------------------
+    def _oversized(self) -> str:
+        """보관 중인 문자열이 상한을 넘음 → 마스크 토큰으로 대체하고 닫는 따옴표까지 버린다."""
+        top = self._stack[-1] if self._stack else None
+        if top is not None and top.is_object and top.expect_key:
+            top.key = None
+        body = self._carry[1:]
+        self._carry = ""
+        self._discarding, self._escaped = True, False
+        self._discard(body)
+        return json.dumps(self._masker.mask_token, ensure_ascii=False)
+
+    def _discard(self, text: str) -> int:
+        """버리기 모드에서 문자열 끝 위치(다음 토큰 시작)를 반환. 끝이 없으면 -1."""
+        start = 0
+        if self._escaped:
+            if not text:
+                return -1
+            start = 1
+        m = _STRING_REST.match(text, start)
+        if m:
+            self._discarding = self._escaped = False
+            return m.end()
+        tail = text[start:]
+        self._escaped = (len(tail) - len(tail.rstrip("\\"))) % 2 == 1
+        return -1
+
+    # -- 공개 API --------------------------------------------------------
+    def feed(self, chunk: bytes, final: bool = False) -> bytes:
+        return self._feed_text(self._decoder.decode(chunk, final), final)
+
+    def _feed_text(self, text: str, final: bool) -> bytes:
+        out: List[str] = []
+        if self._discarding:
+            end = self._discard(text)
+            if end < 0:
+                return b""
+            text = text[end:]
+        text = self._carry + text
+        self._carry = ""
+        pos = 0
+        for m in _TOKEN.finditer(text):
+            tok = m.group()
+            if tok == '"':
+                out.append(text[pos : m.start()])
+                self._carry = text[m.start() :]
+                pos = len(text)
+                if len(self._carry) > self._max_buffer:
+                    out.append(self._oversized())
+                break
+            out.append(text[pos : m.start()])
+            if tok[0] == '"':
+                out.append(self._string(tok))
+            else:
+                self._structural(tok)
+                out.append(tok)
+            pos = m.end()
+        out.append(text[pos:])
+        if final and self._carry:
+            out.append(self._masker.mask_text(self._carry))  # 닫히지 않은 꼬리(잘못된 JSON)
+            self._carry = ""
+        return "".join(out).encode("utf-8", "surrogateescape")
+
+    def mask_once(self, body: bytes) -> bytes:
+        """완결 본문 한 번에 처리. 후보 패턴이 없으면 원본 바이트를 그대로 반환."""
+        text = body.decode("utf-8", "surrogateescape")
+        if "\\" not in text and not self._masker.has_candidates(text):
+            return body
+        return self._feed_text(text, True)
+
+
+__all__ = ["DEFAULT_MAX_BUFFER", "JSONStreamMasker"]
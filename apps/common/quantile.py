@@ -0,0 +1,81 @@
+"""Mergeable streaming quantile sketch (DDSketch 방식).
+
+값 x (>0) 를 ``ceil(log_gamma(x))`` 인덱스의 로그 버킷에 센다
+(``gamma = (1 + alpha) / (1 - alpha)``). 버킷 대표값 ``2 * gamma**i / (gamma + 1)`` 은
+버킷 내 모든 값에 대해 상대 오차 ``alpha`` 이하이므로, ``quantile(q)`` 는 정확한
+rank ``floor(q * (n - 1))`` 표본값 대비 상대 오차 ``alpha`` 이내를 보장한다.
+
+- ``add`` O(1), ``merge`` O(bins), ``quantiles`` O(bins log bins)
+- bin 수는 값의 동적 범위에만 의존 (alpha=0.01 에서 1us~1000s 구간 약 1,000개)
+- 0 이하 값은 ``zero_count`` 로 별도 집계
+"""
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Optional, Sequence
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+
+class DDSketch:
+    __slots__ = ("alpha", "_gamma", "_log_gamma", "bins", "zero_count", "count")
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.alpha = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value <= 0:
+            self.zero_count += 1
+            return
+        idx = math.ceil(math.log(value) / self._log_gamma)
+        self.bins[idx] = self.bins.get(idx, 0) + 1
+
+    def merge(self, other: "DDSketch") -> None:
+        if other.alpha != self.alpha:
+            raise ValueError("cannot merge sketches with different relative accuracy")
+        for idx, cnt in other.bins.items():
+            self.bins[idx] = self.bins.get(idx, 0) + cnt
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def clear(self) -> None:
+        self.bins.clear()
+        self.zero_count = 0
+        self.count = 0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """rank ``floor(q * (n - 1))`` 의 근사값 (비어 있으면 None)."""
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Sequence[float]) -> List[Optional[float]]:
+        """여러 분위수를 bin 정렬 한 번으로 계산."""
+        if self.count == 0:
+            return [None] * len(qs)
+        ranks = [int(min(max(q, 0.0), 1.0) * (self.count - 1)) for q in qs]
+        order = sorted(range(len(qs)), key=lambda i: ranks[i])
+        out: List[Optional[float]] = [None] * len(qs)
+        pos = 0
+        seen = self.zero_count
+        while pos < len(order) and ranks[order[pos]] < seen:
+            out[order[pos]] = 0.0
+            pos += 1
+        for idx in sorted(self.bins):
+            if pos >= len(order):
+                break
+            seen += self.bins[idx]
+            value = 2.0 * self._gamma**idx / (self._gamma + 1)
+            while pos < len(order) and ranks[order[pos]] < seen:
+                out[order[pos]] = value
+                pos += 1
+        return out
+
+
+__all__ = ["DDSketch", "DEFAULT_RELATIVE_ACCURACY"]
@@ -1,12 +1,14 @@
 from __future__ import annotations
+import queue
 import threading
 import time
-from typing import Optional
+from typing import Any, List, Optional
 
 class InMemoryRedis:
     def __init__(self) -> None:
         self._data: dict[str, tuple[int | str, Optional[float]]] = {}
         self._lock = threading.Lock()
+        self._subs: dict[str, list["_PubSub"]] = {}
 
     def _cleanup(self) -> None:
         now = time.time()
@@ -14,15 +16,34 @@ class InMemoryRedis:
         for k in expired:
             self._data.pop(k, None)
 
+    def ping(self) -> bool:
+        return True
+
     def get(self, key: str):
         with self._lock:
             self._cleanup()
             return self._data.get(key, (None, None))[0]
 
+    def mget(self, keys, *args):
+        keys = list(keys) if isinstance(keys, (list, tuple)) else [keys, *args]
+        with self._lock:
+            self._cleanup()
+            return [self._data.get(k, (None, None))[0] for k in keys]
+
+    def set(self, key: str, value, ex: Optional[int] = None) -> bool:
+        with self._lock:
+            self._data[key] = (value, time.time() + ex if ex else None)
+        return True
+
     def setex(self, key: str, ttl: int, value) -> None:
         with self._lock:
             self._data[key] = (value, time.time() + ttl if ttl else None)
 
+    def exists(self, *keys: str) -> int:
+        with self._lock:
+            self._cleanup()
+            return sum(1 for k in keys if k in self._data)
+
     def incrby(self, key: str, amount: int = 1) -> int:
         with self._lock:
             self._cleanup()
@@ -50,9 +71,9 @@ class InMemoryRedis:
                 val, _ = self._data[key]
                 self._data[key] = (val, time.time() + ttl if ttl else None)
 
-    def delete(self, key: str) -> None:
+    def delete(self, *keys: str) -> int:
         with self._lock:
-            self._data.pop(key, None)
+            return sum(1 for k in keys if self._data.pop(k, None) is not None)
 
     def scan_iter(self, match: str):
         prefix = match.rstrip("*")
@@ -62,11 +83,76 @@ class InMemoryRedis:
                 if key.startswith(prefix):
                     yield key
 
-    def pipeline(self):  # minimal pipeline stub
+    def pipeline(self, transaction: bool = True) -> "_Pipeline":
+        return _Pipeline(self)
+
+    # pub/sub: 같은 InMemoryRedis 를 공유하는 구독자에게만 전달 (프로세스 내)
+    def publish(self, channel: str, message) -> int:
+        with self._lock:
+            subs = list(self._subs.get(channel, []))
+        for sub in subs:
+            sub._queue.put({"type": "message", "channel": channel, "data": message})
+        return len(subs)
+
+    def pubsub(self, ignore_subscribe_messages: bool = True) -> "_PubSub":
+        return _PubSub(self)
+
+
+class _Pipeline:
+    """명령을 모았다가 execute() 에서 순서대로 실행 (원자성은 흉내내지 않음)."""
+
+    def __init__(self, client: InMemoryRedis) -> None:
+        self._client = client
+        self._calls: List[tuple] = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self._client, name)
+
+        def queued(*args: Any, **kwargs: Any) -> "_Pipeline":
+            self._calls.append((method, args, kwargs))
+            return self
+
+        return queued
+
+    def execute(self) -> list:
+        calls, self._calls = self._calls, []
+        return [m(*a, **kw) for m, a, kw in calls]
+
+    def reset(self) -> None:
+        self._calls = []
+
+    def __enter__(self) -> "_Pipeline":
         return self
 
-    def hset(self, key, mapping):  # type: ignore[override]
-        super().hset(key, mapping)  # pragma: no cover
+    def __exit__(self, *exc) -> None:
+        self.reset()
+
+
+class _PubSub:
+    def __init__(self, client: InMemoryRedis) -> None:
+        self._client = client
+        self._queue: "queue.Queue[dict]" = queue.Queue()
+        self._channels: List[str] = []
+
+    def subscribe(self, *channels: str) -> None:
+        with self._client._lock:
+            for ch in channels:
+                self._client._subs.setdefault(ch, []).append(self)
+                self._channels.append(ch)
+
+    def get_message(self, ignore_subscribe_messages: bool = True, timeout: float = 0.0):
+        try:
+            return self._queue.get(timeout=timeout) if timeout else self._queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        with self._client._lock:
+            for ch in self._channels:
+                subs = self._client._subs.get(ch, [])
+                if self in subs:
+                    subs.remove(self)
+        self._channels = []
 
 class RedisFacade:
     def __init__(self, client):
@@ -0,0 +1,94 @@
+"""
+apps/judge/drift_state.py
+
+posterior_drift.json 공유 캐시.
+
+- 파일 식별자 (inode, mtime_ns, size) 가 바뀔 때만 다시 읽고 파싱
+- 평가기에는 불변 스냅샷(``DriftSnapshot``)만 전달
+- 파일 없음 → ``drift.source_missing``, 읽기/파싱 실패 → ``drift.source_unreadable`` (fail-closed)
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+REASON_MISSING = "drift.source_missing"
+REASON_UNREADABLE = "drift.source_unreadable"
+
+_FileId = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class DriftSnapshot:
+    """파싱된 drift 상태 (읽기 전용)."""
+
+    severity: str
+    abs_diff: float
+    kl: float
+    raw: Mapping[str, Any]
+
+
+class DriftStateCache:
+    """경로별 drift 스냅샷 캐시 (stat 기반 무효화)."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[_FileId, Union[DriftSnapshot, str]]] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def get(self, path: str) -> Union[DriftSnapshot, str]:
+        """스냅샷 또는 실패 reason code 를 반환."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._entries.pop(path, None)
+            return REASON_MISSING
+        except OSError:
+            return REASON_UNREADABLE
+        file_id: _FileId = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            cached = self._entries.get(path)
+        if cached is not None and cached[0] == file_id:
+            return cached[1]
+
+        result = self._load(path)
+        with self._lock:
+            self._entries[path] = (file_id, result)
+        return result
+
+    def _load(self, path: str) -> Union[DriftSnapshot, str]:
+        self.loads += 1
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                return REASON_UNREADABLE
+            return DriftSnapshot(
+                severity=str(data.get("severity", "info")),
+                abs_diff=float(data.get("abs_diff", 0.0)),
+                kl=float(data.get("kl", 0.0)),
+                raw=MappingProxyType(data),
+            )
+        except FileNotFoundError:
+            return REASON_MISSING
+        except Exception:
+            return REASON_UNREADABLE
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+
+DRIFT_STATE = DriftStateCache()
+
+
+__all__ = ["DRIFT_STATE", "DriftSnapshot", "DriftStateCache", "REASON_MISSING", "REASON_UNREADABLE"]
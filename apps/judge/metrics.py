@@ -1,19 +1,73 @@
 from __future__ import annotations
 
+import math
+import os
 import time
 from collections import deque
 from statistics import median
 from threading import Lock
-from typing import Deque, Dict, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
+
+from apps.common.quantile import DEFAULT_RELATIVE_ACCURACY, DDSketch
+
+
+class _Bucket:
+    """시간 버킷 하나: 지연 sketch + 상태 카운터."""
+
+    __slots__ = ("epoch", "sketch", "total", "five_xx", "errorish", "sig_err")
+
+    def __init__(self, relative_accuracy: float) -> None:
+        self.epoch = -1
+        self.sketch = DDSketch(relative_accuracy)
+        self.total = 0
+        self.five_xx = 0
+        self.errorish = 0
+        self.sig_err = 0
+
+    def reset(self, epoch: int) -> None:
+        self.epoch = epoch
+        self.sketch.clear()
+        self.total = 0
+        self.five_xx = 0
+        self.errorish = 0
+        self.sig_err = 0
 
 
 class JudgeMetrics:
-    """Sliding-window metrics for Judge infra."""
+    """Sliding-window metrics for Judge infra.
+
+    ``mode="sketch"`` (기본): ``bucket_seconds`` 단위 링 버퍼에 버킷별 DDSketch 와
+    카운터를 두어 ``observe`` O(1), ``summary`` O(buckets), 메모리는 QPS 와 무관.
+    백분위는 정확한 rank 값 대비 상대 오차 ``relative_accuracy`` (기본 1%) 이내이며,
+    윈도우 경계는 버킷 단위로 맞춰진다 (최대 ``bucket_seconds`` 만큼 오래된 표본 포함).
 
-    def __init__(self, window_seconds: int = 600) -> None:
+    ``mode="exact"``: 기존 방식 (전체 기록 보관 후 정렬, 선형 보간 백분위). 테스트용.
+    """
+
+    def __init__(
+        self,
+        window_seconds: int = 600,
+        *,
+        mode: Optional[str] = None,
+        bucket_seconds: Optional[float] = None,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ) -> None:
         self.window_seconds = window_seconds
+        self.mode = (mode or os.getenv("DECISIONOS_JUDGE_METRIC_MODE", "sketch")).lower()
+        if self.mode not in {"sketch", "exact"}:
+            raise ValueError(f"unknown JudgeMetrics mode: {self.mode}")
         self._records: Deque[Tuple[float, float, int, bool]] = deque()
         self._lock = Lock()
+        self.bucket_seconds = float(
+            bucket_seconds or os.getenv("DECISIONOS_JUDGE_METRIC_BUCKET_SEC", "10")
+        )
+        self.relative_accuracy = relative_accuracy
+        self._bucket_count = max(1, math.ceil(window_seconds / self.bucket_seconds))
+        self._buckets: List[_Bucket] = (
+            [_Bucket(relative_accuracy) for _ in range(self._bucket_count)]
+            if self.mode == "sketch"
+            else []
+        )
 
     def _trim(self, now: float) -> None:
         cutoff = now - self.window_seconds
@@ -22,24 +76,55 @@ class JudgeMetrics:
 
     def observe(self, latency_ms: float, status_code: int, signature_error: bool) -> None:
         now = time.time()
+        if self.mode == "exact":
+            with self._lock:
+                self._records.append((now, latency_ms, status_code, signature_error))
+                self._trim(now)
+            return
+        epoch = int(now // self.bucket_seconds)
+        bucket = self._buckets[epoch % self._bucket_count]
         with self._lock:
-            self._records.append((now, latency_ms, status_code, signature_error))
-            self._trim(now)
+            if bucket.epoch != epoch:
+                bucket.reset(epoch)
+            bucket.sketch.add(latency_ms)
+            bucket.total += 1
+            if status_code >= 500:
+                bucket.five_xx += 1
+                bucket.errorish += 1
+            elif status_code == 429:
+                bucket.errorish += 1
+            if signature_error:
+                bucket.sig_err += 1
 
     def summary(self) -> Dict[str, object]:
+        if self.mode == "exact":
+            return self._summary_exact()
+        now_epoch = int(time.time() // self.bucket_seconds)
+        oldest = now_epoch - self._bucket_count + 1
+        merged = DDSketch(self.relative_accuracy)
+        total = five_xx = errorish = sig_err = 0
+        with self._lock:
+            for bucket in self._buckets:
+                if bucket.epoch < oldest or bucket.epoch > now_epoch or not bucket.total:
+                    continue
+                merged.merge(bucket.sketch)
+                total += bucket.total
+                five_xx += bucket.five_xx
+                errorish += bucket.errorish
+                sig_err += bucket.sig_err
+        if not total:
+            return self._empty()
+        p50, p95, p99 = (v or 0.0 for v in merged.quantiles((0.50, 0.95, 0.99)))
+        return self._build(p50, p95, p99, total, five_xx, errorish, sig_err)
+
+    def _summary_exact(self) -> Dict[str, object]:
         with self._lock:
+            self._trim(time.time())
             records = list(self._records)
 
         total = len(records)
         if not records:
-            return {
-                "latency_ms": {"p50": 0.0, "p95": 0.0, "p99": 0.0},
-                "availability": 1.0,
-                "error_rate": 0.0,
-                "signature_error_rate": 0.0,
-                "count": 0,
-                "window": {"seconds": self.window_seconds},
-            }
+            return self._empty()
 
         latencies = sorted(r[1] for r in records)
         p50 = float(median(latencies))
@@ -49,7 +134,28 @@ class JudgeMetrics:
         five_xx = sum(1 for _, _, status, _ in records if status >= 500)
         errorish = sum(1 for _, _, status, _ in records if status >= 500 or status == 429)
         sig_err = sum(1 for _, _, _, sig in records if sig)
+        return self._build(p50, p95, p99, total, five_xx, errorish, sig_err)
+
+    def _empty(self) -> Dict[str, object]:
+        return {
+            "latency_ms": {"p50": 0.0, "p95": 0.0, "p99": 0.0},
+            "availability": 1.0,
+            "error_rate": 0.0,
+            "signature_error_rate": 0.0,
+            "count": 0,
+            "window": {"seconds": self.window_seconds},
+        }
 
+    def _build(
+        self,
+        p50: float,
+        p95: float,
+        p99: float,
+        total: int,
+        five_xx: int,
+        errorish: int,
+        sig_err: int,
+    ) -> Dict[str, object]:
         availability = 1.0 - (five_xx / total)
         error_rate = errorish / total
         sig_rate = sig_err / total
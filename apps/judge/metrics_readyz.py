@@ -2,12 +2,63 @@
 from __future__ import annotations
 import threading
 import time
-from collections import deque
-from typing import Dict
+from typing import Dict, Optional
 
 from apps.common.metrics import REG
 
 
+class _SecondRing:
+    """초 단위 슬롯 링 버퍼: 슬롯별 (ok, total) 카운터 + 러닝 합계.
+
+    observe/ratio 는 상수 시간 (만료 슬롯 정리는 경과 초 수만큼, 최대 윈도우 크기).
+    메모리는 윈도우 초 수에 고정되며 probe 빈도와 무관하다.
+    """
+
+    __slots__ = ("size", "_ok", "_total", "_epoch", "ok", "total")
+
+    def __init__(self, seconds: int) -> None:
+        self.size = max(1, int(seconds))
+        self._ok = [0] * self.size
+        self._total = [0] * self.size
+        self._epoch: Optional[int] = None
+        self.ok = 0
+        self.total = 0
+
+    def _advance(self, epoch: int) -> int:
+        if self._epoch is None:
+            self._epoch = epoch
+            return epoch
+        gap = epoch - self._epoch
+        if gap <= 0:  # 같은 초 또는 시계 역행: 현재 슬롯 유지
+            return self._epoch
+        if gap >= self.size:
+            self._ok = [0] * self.size
+            self._total = [0] * self.size
+            self.ok = 0
+            self.total = 0
+        else:
+            for e in range(self._epoch + 1, epoch + 1):
+                idx = e % self.size
+                self.ok -= self._ok[idx]
+                self.total -= self._total[idx]
+                self._ok[idx] = 0
+                self._total[idx] = 0
+        self._epoch = epoch
+        return epoch
+
+    def add(self, now: float, ok: bool) -> None:
+        idx = self._advance(int(now)) % self.size
+        self._total[idx] += 1
+        self.total += 1
+        if ok:
+            self._ok[idx] += 1
+            self.ok += 1
+
+    def ratio(self, now: float) -> float:
+        self._advance(int(now))
+        return self.ok / self.total if self.total > 0 else 1.0
+
+
 class ReadyzMetrics:
     def __init__(self, window_1m: int = 60, window_5m: int = 300):
         self._lock = threading.Lock()
@@ -15,9 +66,9 @@ class ReadyzMetrics:
         self.fail = 0
         self.last_status = "unknown"
         self.last_ts = 0
-        # Sliding windows: (timestamp, ok)
-        self._window_1m: deque = deque()
-        self._window_5m: deque = deque()
+        # Sliding windows: per-second ring counters
+        self._window_1m = _SecondRing(window_1m)
+        self._window_5m = _SecondRing(window_5m)
         self._window_1m_sec = window_1m
         self._window_5m_sec = window_5m
 
@@ -28,16 +79,8 @@ class ReadyzMetrics:
             self.fail += 0 if ok else 1
             self.last_status = "ready" if ok else "degraded"
             self.last_ts = int(now)
-            # Append to sliding windows
-            self._window_1m.append((now, ok))
-            self._window_5m.append((now, ok))
-            # Trim old entries
-            self._trim_window(self._window_1m, now - self._window_1m_sec)
-            self._trim_window(self._window_5m, now - self._window_5m_sec)
-
-    def _trim_window(self, win: deque, cutoff: float):
-        while win and win[0][0] < cutoff:
-            win.popleft()
+            self._window_1m.add(now, ok)
+            self._window_5m.add(now, ok)
 
     def snapshot(self) -> Dict[str, int | str]:
         with self._lock:
@@ -51,31 +94,19 @@ class ReadyzMetrics:
     def ratios(self) -> Dict[str, float]:
         now = time.time()
         with self._lock:
-            self._trim_window(self._window_1m, now - self._window_1m_sec)
-            self._trim_window(self._window_5m, now - self._window_5m_sec)
-            total_1m = len(self._window_1m)
-            total_5m = len(self._window_5m)
-            ok_1m = sum(1 for _, ok in self._window_1m if ok)
-            ok_5m = sum(1 for _, ok in self._window_5m if ok)
-            ratio_1m = ok_1m / total_1m if total_1m > 0 else 1.0
-            ratio_5m = ok_5m / total_5m if total_5m > 0 else 1.0
+            ratio_1m = self._window_1m.ratio(now)
+            ratio_5m = self._window_5m.ratio(now)
         return {"success_ratio_1m": ratio_1m, "success_ratio_5m": ratio_5m}
 
     def export_gauges(self):
         """Export sliding window success ratios to global metrics registry."""
-        now = time.time()
-        with self._lock:
-            self._trim_window(self._window_1m, now - self._window_1m_sec)
-            self._trim_window(self._window_5m, now - self._window_5m_sec)
-            total_1m = len(self._window_1m)
-            total_5m = len(self._window_5m)
-            ok_1m = sum(1 for _, ok in self._window_1m if ok)
-            ok_5m = sum(1 for _, ok in self._window_5m if ok)
-            ratio_1m = ok_1m / total_1m if total_1m > 0 else 1.0
-            ratio_5m = ok_5m / total_5m if total_5m > 0 else 1.0
-        # Set gauges
-        REG.gauge("readyz_success_ratio_1m", "Readyz success ratio over 1 minute").set(ratio_1m)
-        REG.gauge("readyz_success_ratio_5m", "Readyz success ratio over 5 minutes").set(ratio_5m)
+        ratios = self.ratios()
+        REG.gauge("readyz_success_ratio_1m", "Readyz success ratio over 1 minute").set(
+            ratios["success_ratio_1m"]
+        )
+        REG.gauge("readyz_success_ratio_5m", "Readyz success ratio over 5 minutes").set(
+            ratios["success_ratio_5m"]
+        )
 
 
 READYZ_METRICS = ReadyzMetrics()
@@ -0,0 +1,65 @@
+"""Judge 요청 경로의 동기 작업을 이벤트 루프 밖으로 오프로드.
+
+- 서명 검증 / SLO 평가 등 CPU 작업은 고정 크기 스레드 풀에서 실행
+- replay store 는 ``aseen_or_insert`` (async-native) 를 우선 사용
+- ``DECISIONOS_JUDGE_OFFLOAD=0`` 이면 기존처럼 루프 위에서 인라인 실행
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class JudgeOffload:
+    """동시성이 제한된 judge 전용 워커 풀."""
+
+    def __init__(self, max_workers: Optional[int] = None, enabled: Optional[bool] = None) -> None:
+        if enabled is None:
+            enabled = os.getenv("DECISIONOS_JUDGE_OFFLOAD", "1") == "1"
+        self.enabled = enabled
+        self.max_workers = max(1, int(max_workers or os.getenv("DECISIONOS_JUDGE_WORKERS", "8")))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="judge-offload"
+                    )
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """``fn`` 을 워커 풀에서 실행 (contextvars 유지)."""
+        if not self.enabled:
+            return fn(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        call = functools.partial(ctx.run, fn, *args, **kwargs)
+        return await loop.run_in_executor(self._get_executor(), call)
+
+    async def seen_or_insert(self, store: Any, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        """replay store 조회. async-native 구현이 있으면 스레드 홉 없이 await."""
+        if not self.enabled:
+            return store.seen_or_insert(key_id, nonce, ts_epoch)
+        native = getattr(store, "aseen_or_insert", None)
+        if native is not None:
+            return await native(key_id, nonce, ts_epoch)
+        return await self.run(store.seen_or_insert, key_id, nonce, ts_epoch)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+__all__ = ["JudgeOffload"]
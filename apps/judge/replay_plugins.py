@@ -1,19 +1,36 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import queue
 import sqlite3
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+from apps.common.metrics import REG
 
 try:  # optional dependency
     import redis  # type: ignore
 except Exception:  # pragma: no cover
     redis = None
 
+try:  # optional dependency (redis>=4.2 의 asyncio 클라이언트)
+    import redis.asyncio as aioredis  # type: ignore
+except Exception:  # pragma: no cover
+    aioredis = None
+
 TTL_SEC = 600
 SKEW_SEC = 120
 
 
+class ReplayStoreError(RuntimeError):
+    """backend 장애로 nonce 판정을 내리지 못함 (``check_nonce`` 계열만 발생)."""
+
+
 class ReplayStoreABC(ABC):
     """Replay store 인터페이스."""
 
@@ -21,6 +38,26 @@ class ReplayStoreABC(ABC):
     def seen_or_insert(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
         """True 반환 시 재생/무효이므로 fail-closed."""
 
+    async def aseen_or_insert(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        """async 버전. 기본 구현은 동기 호출을 스레드로 오프로드."""
+        return await asyncio.to_thread(self.seen_or_insert, key_id, nonce, ts_epoch)
+
+    def check_nonce(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        """``seen_or_insert`` 와 같지만 장애 시 fail-closed(True) 대신 ``ReplayStoreError``.
+
+        기본 구현은 ``seen_or_insert`` 결과를 그대로 확정 판정으로 취급한다.
+        """
+        return self.seen_or_insert(key_id, nonce, ts_epoch)
+
+    async def acheck_nonce(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        """``check_nonce`` 의 async 버전.
+
+        기본 구현: ``check_nonce`` 를 재정의했으면 스레드로 오프로드, 아니면 ``aseen_or_insert`` 결과를 확정 판정으로 취급.
+        """
+        if type(self).check_nonce is not ReplayStoreABC.check_nonce:
+            return await asyncio.to_thread(self.check_nonce, key_id, nonce, ts_epoch)
+        return await self.aseen_or_insert(key_id, nonce, ts_epoch)
+
     def purge_expired(self) -> None:  # pragma: no cover - optional
         """만료 엔트리 삭제."""
 
@@ -31,13 +68,42 @@ class ReplayStoreABC(ABC):
         return True, "ok"
 
 
+_PendingNonce = Tuple[str, str, int, "Future[bool]"]
+
+
 class SQLiteReplayStore(ReplayStoreABC):
-    def __init__(self, path: str = "var/judge/replay.sqlite") -> None:
+    """SQLite 기반 replay store (group commit).
+
+    동시 호출자의 nonce 를 단일 writer 스레드가 모아 하나의 트랜잭션으로 커밋한다
+    (최대 ``batch_max`` 건 또는 ``flush_ms`` 대기). 만료 삭제는 호출마다가 아니라
+    ``sweep_interval`` 주기로 ts 인덱스를 통해 수행한다. 중복 판정은 PRIMARY KEY 에
+    대한 ``INSERT OR IGNORE`` 결과로 하므로 배치 내 중복도 정확히 거부된다.
+    """
+
+    def __init__(
+        self,
+        path: str = "var/judge/replay.sqlite",
+        *,
+        batch_max: Optional[int] = None,
+        flush_ms: Optional[float] = None,
+        sweep_interval: Optional[float] = None,
+    ) -> None:
         if path != ":memory:":
             dir_name = os.path.dirname(path)
             if dir_name:
                 os.makedirs(dir_name, exist_ok=True)
+        self._batch_max = max(1, int(batch_max or os.getenv("DECISIONOS_REPLAY_BATCH_MAX", "256")))
+        self._flush_sec = (
+            float(flush_ms if flush_ms is not None else os.getenv("DECISIONOS_REPLAY_FLUSH_MS", "1"))
+            / 1000.0
+        )
+        self._sweep_interval = float(
+            sweep_interval
+            if sweep_interval is not None
+            else os.getenv("DECISIONOS_REPLAY_SWEEP_SEC", "30")
+        )
         self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn_lock = threading.Lock()
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute(
             """
@@ -49,25 +115,150 @@ class SQLiteReplayStore(ReplayStoreABC):
             )
             """
         )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_nonce_log_ts ON nonce_log(ts)")
         self._conn.commit()
+        self._queue: "queue.Queue[_PendingNonce]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._closed = False
+        self._last_sweep = time.monotonic()
 
     def seen_or_insert(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        try:
+            return self.check_nonce(key_id, nonce, ts_epoch)
+        except ReplayStoreError:
+            return True  # fail-closed
+
+    async def aseen_or_insert(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        try:
+            return await self.acheck_nonce(key_id, nonce, ts_epoch)
+        except ReplayStoreError:
+            return True  # fail-closed
+
+    def check_nonce(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
         now = int(time.time())
         if abs(now - ts_epoch) > SKEW_SEC + TTL_SEC:
             return True
-        try:
-            self._conn.execute(
-                "INSERT INTO nonce_log(key_id, nonce, ts) VALUES (?,?,?)",
-                (key_id, nonce, ts_epoch),
-            )
-            self._conn.commit()
-        except sqlite3.IntegrityError:
+        if self._closed:
+            raise ReplayStoreError("replay store closed")
+        return self._submit(key_id, nonce, ts_epoch).result()
+
+    async def acheck_nonce(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        # writer 스레드의 Future 를 그대로 await (이벤트 루프 블로킹 없음)
+        now = int(time.time())
+        if abs(now - ts_epoch) > SKEW_SEC + TTL_SEC:
             return True
-        self._conn.execute("DELETE FROM nonce_log WHERE ? - ts > ?", (now, TTL_SEC))
-        self._conn.commit()
-        return False
+        if self._closed:
+            raise ReplayStoreError("replay store closed")
+        return await asyncio.wrap_future(self._submit(key_id, nonce, ts_epoch))
+
+    def _submit(self, key_id: str, nonce: str, ts_epoch: int) -> "Future[bool]":
+        fut: "Future[bool]" = Future()
+        self._ensure_writer()
+        self._queue.put((key_id, nonce, ts_epoch, fut))
+        return fut
+
+    def purge_expired(self) -> None:
+        # SKEW 를 포함한 수락 가능 구간이 지난 nonce 만 삭제 (재생 판정 정확성 유지)
+        cutoff = int(time.time()) - (TTL_SEC + SKEW_SEC)
+        with self._conn_lock:
+            self._conn.execute("DELETE FROM nonce_log WHERE ts < ?", (cutoff,))
+            self._conn.commit()
+        self._last_sweep = time.monotonic()
+
+    def _ensure_writer(self) -> None:
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name="replay-sqlite-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _writer_loop(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=min(1.0, self._sweep_interval or 1.0))
+            except queue.Empty:
+                if self._closed:
+                    return
+                self._maybe_sweep()
+                continue
+            if first is None:  # close() sentinel
+                return
+            batch: List[_PendingNonce] = [first]
+            deadline = time.monotonic() + self._flush_sec
+            stop = False
+            while len(batch) < self._batch_max:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._commit_batch(batch)
+            if stop:
+                return
+            self._maybe_sweep()
+
+    def _commit_batch(self, batch: List[_PendingNonce]) -> None:
+        results: List[bool] = []
+        error: Optional[Exception] = None
+        try:
+            with self._conn_lock:
+                cur = self._conn.cursor()
+                for key_id, nonce, ts_epoch, _ in batch:
+                    cur.execute(
+                        "INSERT OR IGNORE INTO nonce_log(key_id, nonce, ts) VALUES (?,?,?)",
+                        (key_id, nonce, ts_epoch),
+                    )
+                    results.append(cur.rowcount == 0)
+                self._conn.commit()
+        except Exception as exc:
+            try:
+                self._conn.rollback()
+            except Exception:
+                pass
+            # 커밋 실패: 판정 불가 (seen_or_insert 가 fail-closed 로 바꿈)
+            error = exc
+        if error is not None:
+            for _, _, _, fut in batch:
+                fut.set_exception(ReplayStoreError(f"sqlite commit failed: {error}"))
+            return
+        for (_, _, _, fut), seen in zip(batch, results):
+            fut.set_result(seen)
+
+    def _maybe_sweep(self) -> None:
+        if time.monotonic() - self._last_sweep < self._sweep_interval:
+            return
+        try:
+            self.purge_expired()
+        except Exception:  # pragma: no cover
+            pass
 
     def close(self) -> None:  # pragma: no cover
+        self._closed = True
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            self._queue.put(None)  # type: ignore[arg-type]
+            writer.join(timeout=5)
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[3].set_exception(ReplayStoreError("replay store closed"))
         try:
             self._conn.close()
         except Exception:
@@ -75,7 +266,8 @@ class SQLiteReplayStore(ReplayStoreABC):
 
     def health_check(self) -> tuple[bool, str]:
         try:
-            self._conn.execute("SELECT 1")
+            with self._conn_lock:
+                self._conn.execute("SELECT 1")
             return True, "ok"
         except Exception as exc:  # pragma: no cover
             return False, f"sqlite:{exc}"
@@ -85,17 +277,46 @@ class RedisReplayStore(ReplayStoreABC):
     def __init__(self, url: str = "redis://localhost:6379/0") -> None:
         if redis is None:
             raise RuntimeError("redis package not installed")
+        self._url = url
         self._client = redis.from_url(url)
+        self._aclient = None
 
     def seen_or_insert(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        try:
+            return self.check_nonce(key_id, nonce, ts_epoch)
+        except ReplayStoreError:
+            return True  # fail-closed
+
+    async def aseen_or_insert(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        try:
+            return await self.acheck_nonce(key_id, nonce, ts_epoch)
+        except ReplayStoreError:
+            return True  # fail-closed
+
+    def check_nonce(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
         now = int(time.time())
         if abs(now - ts_epoch) > SKEW_SEC + TTL_SEC:
             return True
         key = f"judge:nonce:{key_id}:{nonce}"
         try:
             inserted = self._client.set(key, ts_epoch, nx=True, ex=TTL_SEC)
-        except Exception:
+        except Exception as exc:
+            raise ReplayStoreError(f"redis: {exc}") from exc
+        return not bool(inserted)
+
+    async def acheck_nonce(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        if aioredis is None:
+            return await asyncio.to_thread(self.check_nonce, key_id, nonce, ts_epoch)
+        now = int(time.time())
+        if abs(now - ts_epoch) > SKEW_SEC + TTL_SEC:
             return True
+        if self._aclient is None:
+            self._aclient = aioredis.from_url(self._url)
+        key = f"judge:nonce:{key_id}:{nonce}"
+        try:
+            inserted = await self._aclient.set(key, ts_epoch, nx=True, ex=TTL_SEC)
+        except Exception as exc:
+            raise ReplayStoreError(f"redis: {exc}") from exc
         return not bool(inserted)
 
     def health_check(self) -> tuple[bool, str]:  # pragma: no cover
@@ -106,23 +327,151 @@ class RedisReplayStore(ReplayStoreABC):
             return False, f"redis:{exc}"
 
 
+class CachedReplayStore(ReplayStoreABC):
+    """최근 nonce 를 프로세스 내에 보관하는 write-through 래퍼.
+
+    ``(key_id, nonce)`` 를 shard 별 LRU(OrderedDict)에 ``ts + TTL + SKEW`` 까지 보관한다.
+    캐시에 있으면 backing store 조회 없이 재생으로 거부하고, 없으면 backing store 의
+    ``check_nonce`` 에 위임해 확정 판정(신규 삽입 또는 이미 있음)이 나온 경우에만 캐시에
+    기록한다. backend 장애(``ReplayStoreError``)는 fail-closed 로 거부하되 기록하지 않으므로
+    장애 복구 후 같은 nonce 의 정당한 재시도는 backend 가 다시 판정한다. 캐시는 "이미 본
+    nonce" 만 담으므로 신규 판정(False)은 항상 backing store 가 내린다.
+    """
+
+    def __init__(
+        self,
+        backend: ReplayStoreABC,
+        *,
+        max_entries: Optional[int] = None,
+        shards: int = 16,
+    ) -> None:
+        self._backend = backend
+        self._shard_count = max(1, int(shards))
+        total = int(max_entries or os.getenv("DECISIONOS_REPLAY_CACHE_MAX", "100000"))
+        self._shard_max = max(1, total // self._shard_count)
+        self._shards: List["OrderedDict[Tuple[str, str], int]"] = [
+            OrderedDict() for _ in range(self._shard_count)
+        ]
+        self._locks = [threading.Lock() for _ in range(self._shard_count)]
+        self._hits = REG.counter(
+            "decisionos_replay_cache_hits_total", "Replay nonces rejected from local cache"
+        )
+        self._misses = REG.counter(
+            "decisionos_replay_cache_misses_total", "Replay nonces forwarded to backing store"
+        )
+
+    @property
+    def backend(self) -> ReplayStoreABC:
+        return self._backend
+
+    def _shard(self, key: Tuple[str, str]) -> int:
+        return hash(key) % self._shard_count
+
+    def _lookup(self, key: Tuple[str, str], idx: int, now: int) -> bool:
+        shard = self._shards[idx]
+        with self._locks[idx]:
+            expires = shard.get(key)
+            if expires is not None:
+                if expires >= now:
+                    shard.move_to_end(key)
+                    self._hits.inc()
+                    return True
+                del shard[key]
+        self._misses.inc()
+        return False
+
+    def _remember(self, key: Tuple[str, str], idx: int, ts_epoch: int) -> None:
+        shard = self._shards[idx]
+        with self._locks[idx]:
+            shard[key] = ts_epoch + TTL_SEC + SKEW_SEC
+            shard.move_to_end(key)
+            while len(shard) > self._shard_max:
+                shard.popitem(last=False)
+
+    def seen_or_insert(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        try:
+            return self.check_nonce(key_id, nonce, ts_epoch)
+        except ReplayStoreError:
+            return True  # fail-closed, 캐시에는 남기지 않음
+
+    async def aseen_or_insert(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        try:
+            return await self.acheck_nonce(key_id, nonce, ts_epoch)
+        except ReplayStoreError:
+            return True  # fail-closed, 캐시에는 남기지 않음
+
+    def check_nonce(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        now = int(time.time())
+        if abs(now - ts_epoch) > SKEW_SEC + TTL_SEC:
+            return True
+        key = (key_id, nonce)
+        idx = self._shard(key)
+        if self._lookup(key, idx, now):
+            return True
+        check = getattr(self._backend, "check_nonce", None)  # ABC 를 상속하지 않은 backend 는 seen_or_insert
+        seen = check(key_id, nonce, ts_epoch) if check is not None else self._backend.seen_or_insert(key_id, nonce, ts_epoch)
+        self._remember(key, idx, ts_epoch)
+        return seen
+
+    async def acheck_nonce(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        now = int(time.time())
+        if abs(now - ts_epoch) > SKEW_SEC + TTL_SEC:
+            return True
+        key = (key_id, nonce)
+        idx = self._shard(key)
+        if self._lookup(key, idx, now):
+            return True
+        acheck = getattr(self._backend, "acheck_nonce", None) or self._backend.aseen_or_insert
+        seen = await acheck(key_id, nonce, ts_epoch)
+        self._remember(key, idx, ts_epoch)
+        return seen
+
+    def purge_expired(self) -> None:
+        now = int(time.time())
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                stale = [k for k, exp in shard.items() if exp < now]
+                for k in stale:
+                    del shard[k]
+        self._backend.purge_expired()
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self._shards)
+
+    def close(self) -> None:  # pragma: no cover
+        self._backend.close()
+
+    def health_check(self) -> tuple[bool, str]:
+        return self._backend.health_check()
+
+
 __all__ = [
     "ReplayStoreABC",
+    "ReplayStoreError",
     "SQLiteReplayStore",
     "RedisReplayStore",
+    "CachedReplayStore",
     "TTL_SEC",
     "SKEW_SEC",
     "build_replay_store",
+    "maybe_cached",
 ]
 
 
+def maybe_cached(store: ReplayStoreABC) -> ReplayStoreABC:
+    """``DECISIONOS_REPLAY_CACHE=1`` (기본) 이면 ``CachedReplayStore`` 로 감싼다."""
+    if os.getenv("DECISIONOS_REPLAY_CACHE", "1") != "1":
+        return store
+    return CachedReplayStore(store)
+
+
 def build_replay_store() -> ReplayStoreABC:
     backend = os.getenv("DECISIONOS_REPLAY_BACKEND", "redis").lower()
     if backend == "redis" and redis is not None:
         url = os.getenv("DECISIONOS_REDIS_URL", "redis://localhost:6379/0")
         try:
-            return RedisReplayStore(url=url)
+            return maybe_cached(RedisReplayStore(url=url))
         except Exception:
             pass
     path = os.getenv("DECISIONOS_REPLAY_SQLITE", "var/judge/replay.sqlite")
-    return SQLiteReplayStore(path=path)
+    return maybe_cached(SQLiteReplayStore(path=path))
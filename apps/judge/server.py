@@ -17,8 +17,14 @@ from apps.judge import slo_judge
 from apps.judge.metrics import JudgeMetrics
 from apps.judge.metrics_readyz import READYZ_METRICS
 from apps.judge.middleware.security import JudgeSecurityMiddleware
+from apps.judge.offload import JudgeOffload
 from apps.judge.readyz import build_readyz_router, default_readyz_checks
-from apps.judge.replay_plugins import RedisReplayStore, ReplayStoreABC, SQLiteReplayStore
+from apps.judge.replay_plugins import (
+    RedisReplayStore,
+    ReplayStoreABC,
+    SQLiteReplayStore,
+    maybe_cached,
+)
 from apps.policy.pep import require
 from apps.policy.rbac_enforce import RbacMapMiddleware
 from apps.security.pii_middleware import PIIMiddleware
@@ -26,20 +32,29 @@ from apps.security.pii_middleware import PIIMiddleware
 _DEFAULT_WINDOW = int(os.getenv("DECISIONOS_JUDGE_METRIC_WINDOW", "600"))
 _metrics = JudgeMetrics(window_seconds=_DEFAULT_WINDOW)
 _key_loader = MultiKeyLoader()
+_offload = JudgeOffload()
+_REQUEST_SECONDS = REG.histogram(
+    "decisionos_judge_request_seconds",
+    "Judge HTTP request latency",
+    labelnames=("route", "status"),
+)
 
 def _build_replay_store() -> ReplayStoreABC:
     backend = os.getenv("DECISIONOS_REPLAY_BACKEND", "sqlite").lower()
     if backend == "redis":
         url = os.getenv("DECISIONOS_REDIS_URL", "redis://localhost:6379/0")
-        return RedisReplayStore(url=url)
+        return maybe_cached(RedisReplayStore(url=url))
     path = os.getenv("DECISIONOS_REPLAY_SQLITE", "var/judge/replay.sqlite")
-    return SQLiteReplayStore(path=path)
+    return maybe_cached(SQLiteReplayStore(path=path))
 
 
-def create_app(replay_store: Optional[ReplayStoreABC] = None) -> FastAPI:
+def create_app(
+    replay_store: Optional[ReplayStoreABC] = None, offload: Optional[JudgeOffload] = None
+) -> FastAPI:
     app = FastAPI(title="DecisionOS Judge", version="0.5.11j")
     app.state.metrics = _metrics
     app.state.replay_store = replay_store or _build_replay_store()
+    app.state.offload = offload or _offload
     response_fields_env = os.getenv("DECISIONOS_PII_RESPONSE_FIELDS", "")
     response_fields = [field.strip() for field in response_fields_env.split(",") if field.strip()]
     app.add_middleware(JudgeSecurityMiddleware)
@@ -58,6 +73,7 @@ def create_app(replay_store: Optional[ReplayStoreABC] = None) -> FastAPI:
     async def post_judge(request: Request) -> JSONResponse:
         request.state.sig_error = False
         metrics: JudgeMetrics = request.app.state.metrics
+        offload: JudgeOffload = request.app.state.offload
         status_code = 200
 
         try:
@@ -85,7 +101,7 @@ def create_app(replay_store: Optional[ReplayStoreABC] = None) -> FastAPI:
 
         # Security (v0.5.11u-5): use safe verification with generic error message
         try:
-            verify_signature_safe(payload, signature, key_id, _key_loader)
+            await offload.run(verify_signature_safe, payload, signature, key_id, _key_loader)
         except SignatureInvalid:
             status_code = 401
             request.state.sig_error = True
@@ -98,7 +114,7 @@ def create_app(replay_store: Optional[ReplayStoreABC] = None) -> FastAPI:
             raise HTTPException(status_code=401, detail="timestamp skew exceeded")
 
         store: ReplayStoreABC = request.app.state.replay_store
-        if store.seen_or_insert(key_id, nonce, ts_epoch):
+        if await offload.seen_or_insert(store, key_id, nonce, ts_epoch):
             status_code = 401
             request.state.sig_error = True
             raise HTTPException(status_code=401, detail="replay detected")
@@ -115,7 +131,7 @@ def create_app(replay_store: Optional[ReplayStoreABC] = None) -> FastAPI:
             status_code = 403
             raise HTTPException(status_code=403, detail="rbac denied")
 
-        decision, reasons = slo_judge.evaluate(evidence, slo)
+        decision, reasons = await offload.run(slo_judge.evaluate, evidence, slo)
         resp = {
             "decision": decision,
             "reasons": reasons,
@@ -143,6 +159,11 @@ def create_app(replay_store: Optional[ReplayStoreABC] = None) -> FastAPI:
             latency_ms = (time.perf_counter() - start) * 1000
             sig_flag = getattr(request.state, "sig_error", False)
             request.app.state.metrics.observe(latency_ms, status_code, sig_flag)
+            # 라벨 cardinality 제한: 매칭된 라우트 템플릿만 사용
+            route = getattr(request.scope.get("route"), "path", "unmatched")
+            _REQUEST_SECONDS.labels(route=route, status=str(status_code)).observe(
+                latency_ms / 1000.0
+            )
         return response
 
     @app.get("/healthz")
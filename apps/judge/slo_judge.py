@@ -5,20 +5,26 @@ Evidence JSON과 SLO JSON을 비교해 pass/fail을 판정한다.
 """
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
-from typing import Any, Dict, List, Optional, Tuple
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from pydantic import ValidationError
 
-from apps.judge.slo_schema import SLOCanary, SLOJudgeInfra, SLOSpec
+from apps.common.canonical_json import canonical_sha256
+from apps.common.metrics import REG
+from apps.judge.drift_state import DRIFT_STATE
+from apps.judge.slo_schema import SLOCanary, SLODrift, SLOJudgeInfra, SLOSpec
 
 REQUIRED_BLOCKS = ["meta", "witness", "usage", "rating", "quota", "budget", "anomaly", "integrity"]
 
 
 def _recalc_signature(core: Dict[str, Any]) -> str:
-    payload = json.dumps(core, ensure_ascii=False, sort_keys=True).encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+    return canonical_sha256(core)
 
 
 def _check_perf_min_samples(perf: Dict[str, Any], spec: SLOSpec, reasons: List[str]) -> bool:
@@ -35,47 +41,141 @@ def _check_perf_min_samples(perf: Dict[str, Any], spec: SLOSpec, reasons: List[s
     return ok
 
 
-def evaluate(evidence: Dict[str, Any], slo: Dict[str, Any]) -> Tuple[str, List[str]]:
-    reasons: List[str] = []
-    try:
-        spec = SLOSpec.model_validate(slo)
-    except ValidationError as exc:
-        return "fail", [f"slo-parse:{exc}"]
+Check = Callable[[Dict[str, Any], List[str]], None]
+
+_CACHE_SIZE = int(os.getenv("DECISIONOS_SLO_CACHE_SIZE", "128"))
+_CACHE: "OrderedDict[str, CompiledSLO]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_CACHE_HITS = REG.counter("decisionos_slo_cache_hits_total", "Compiled SLO cache hits")
+_CACHE_MISSES = REG.counter("decisionos_slo_cache_misses_total", "Compiled SLO cache misses")
+
+
+class CompiledSLO:
+    """검증된 SLOSpec + 해당 SLO에 필요한 검사만 담은 평면 체크 목록."""
 
-    for key in REQUIRED_BLOCKS:
-        if key not in evidence:
-            reasons.append(f"evidence.missing:{key}")
-    if reasons:
-        return "fail", reasons
+    __slots__ = ("spec", "checks", "parse_error")
 
-    if spec.witness.require_csv_sha256 and not evidence["witness"].get("csv_sha256"):
+    def __init__(
+        self,
+        spec: Optional[SLOSpec],
+        checks: List[Check],
+        parse_error: Optional[str] = None,
+    ) -> None:
+        self.spec = spec
+        self.checks = checks
+        self.parse_error = parse_error
+
+    def evaluate(self, evidence: Dict[str, Any]) -> Tuple[str, List[str]]:
+        if self.parse_error is not None:
+            return "fail", [self.parse_error]
+
+        reasons: List[str] = []
+        for key in REQUIRED_BLOCKS:
+            if key not in evidence:
+                reasons.append(f"evidence.missing:{key}")
+        if reasons:
+            return "fail", reasons
+
+        for check in self.checks:
+            check(evidence, reasons)
+        return ("pass" if not reasons else "fail"), reasons
+
+
+def _check_witness(evidence: Dict[str, Any], reasons: List[str]) -> None:
+    if not evidence["witness"].get("csv_sha256"):
         reasons.append("witness.no_csv_sha256")
 
-    if spec.integrity.require_signature:
-        core = {key: evidence[key] for key in REQUIRED_BLOCKS if key != "integrity"}
-        for block in ("perf", "perf_judge", "judges", "canary"):
-            if block in evidence and evidence[block] is not None:
-                core[block] = evidence[block]
-        expected = evidence["integrity"].get("signature_sha256")
-        actual = _recalc_signature(core)
-        if expected != actual:
-            reasons.append("integrity.signature_mismatch")
-
-    budget = evidence["budget"]
-    if budget.get("level") not in spec.budget.allow_levels:
-        reasons.append(f"budget.level_forbidden:{budget.get('level')}")
-    if spec.budget.max_spent is not None and budget.get("spent", 0) > spec.budget.max_spent:
-        reasons.append(f"budget.spent_over:{budget.get('spent')}>{spec.budget.max_spent}")
-
-    quota = evidence["quota"].get("decisions", {})
-    for metric, forbids in spec.quota.forbid_actions.items():
-        action = quota.get(metric, {}).get("action")
-        if action in forbids:
-            reasons.append(f"quota.forbid:{metric}:{action}")
-
-    if not spec.anomaly.allow_spike and evidence["anomaly"].get("is_spike", False):
+
+def _check_integrity(evidence: Dict[str, Any], reasons: List[str]) -> None:
+    core = {key: evidence[key] for key in REQUIRED_BLOCKS if key != "integrity"}
+    for block in ("perf", "perf_judge", "judges", "canary"):
+        if block in evidence and evidence[block] is not None:
+            core[block] = evidence[block]
+    expected = evidence["integrity"].get("signature_sha256")
+    actual = _recalc_signature(core)
+    if expected != actual:
+        reasons.append("integrity.signature_mismatch")
+
+
+def _compile_budget(spec: SLOSpec) -> Check:
+    allow_levels = tuple(spec.budget.allow_levels)  # evidence 의 level 이 unhashable 일 수 있어 set 대신 tuple
+    max_spent = spec.budget.max_spent
+
+    def check(evidence: Dict[str, Any], reasons: List[str]) -> None:
+        budget = evidence["budget"]
+        if budget.get("level") not in allow_levels:
+            reasons.append(f"budget.level_forbidden:{budget.get('level')}")
+        if max_spent is not None and budget.get("spent", 0) > max_spent:
+            reasons.append(f"budget.spent_over:{budget.get('spent')}>{max_spent}")
+
+    return check
+
+
+def _compile_quota(spec: SLOSpec) -> Check:
+    forbid_actions = list(spec.quota.forbid_actions.items())
+
+    def check(evidence: Dict[str, Any], reasons: List[str]) -> None:
+        quota = evidence["quota"].get("decisions", {})
+        for metric, forbids in forbid_actions:
+            action = quota.get(metric, {}).get("action")
+            if action in forbids:
+                reasons.append(f"quota.forbid:{metric}:{action}")
+
+    return check
+
+
+def _check_anomaly(evidence: Dict[str, Any], reasons: List[str]) -> None:
+    if evidence["anomaly"].get("is_spike", False):
         reasons.append("anomaly.spike_forbidden")
 
+
+def _compile_perf(spec: SLOSpec) -> Check:
+    max_p95 = spec.latency.max_p95_ms
+    max_p99 = spec.latency.max_p99_ms
+    max_err = spec.error.max_error_rate
+
+    def check(evidence: Dict[str, Any], reasons: List[str]) -> None:
+        perf = evidence.get("perf")
+        if not isinstance(perf, dict):
+            reasons.append("perf.missing")
+            return
+        if not _check_perf_min_samples(perf, spec, reasons):
+            return
+        latency_data = perf.get("latency_ms", {})
+        if max_p95 is not None:
+            p95 = latency_data.get("p95", 0)
+            if p95 > max_p95:
+                reasons.append(f"latency.p95_over:{p95}>{max_p95}")
+        if max_p99 is not None:
+            p99 = latency_data.get("p99", 0)
+            if p99 > max_p99:
+                reasons.append(f"latency.p99_over:{p99}>{max_p99}")
+        if max_err is not None:
+            err_rate = perf.get("error_rate", 0)
+            if err_rate > max_err:
+                reasons.append(f"error.rate_over:{err_rate}>{max_err}")
+
+    return check
+
+
+def compile_slo(slo: Dict[str, Any]) -> CompiledSLO:
+    """SLO dict 를 검증하고, 존재하는 블록에 대한 검사만 순서대로 묶는다."""
+    try:
+        spec = SLOSpec.model_validate(slo)
+    except ValidationError as exc:
+        return CompiledSLO(None, [], parse_error=f"slo-parse:{exc}")
+
+    checks: List[Check] = []
+    if spec.witness.require_csv_sha256:
+        checks.append(_check_witness)
+    if spec.integrity.require_signature:
+        checks.append(_check_integrity)
+    checks.append(_compile_budget(spec))
+    if spec.quota.forbid_actions:
+        checks.append(_compile_quota(spec))
+    if not spec.anomaly.allow_spike:
+        checks.append(_check_anomaly)
+
     perf_required = any(
         [
             spec.latency.max_p95_ms is not None,
@@ -86,31 +186,54 @@ def evaluate(evidence: Dict[str, Any], slo: Dict[str, Any]) -> Tuple[str, List[s
         ]
     )
     if perf_required:
-        perf = evidence.get("perf")
-        if not isinstance(perf, dict):
-            reasons.append("perf.missing")
-        else:
-            if _check_perf_min_samples(perf, spec, reasons):
-                latency_data = perf.get("latency_ms", {})
-                if spec.latency.max_p95_ms is not None:
-                    p95 = latency_data.get("p95", 0)
-                    if p95 > spec.latency.max_p95_ms:
-                        reasons.append(f"latency.p95_over:{p95}>{spec.latency.max_p95_ms}")
-                if spec.latency.max_p99_ms is not None:
-                    p99 = latency_data.get("p99", 0)
-                    if p99 > spec.latency.max_p99_ms:
-                        reasons.append(f"latency.p99_over:{p99}>{spec.latency.max_p99_ms}")
-                if spec.error.max_error_rate is not None:
-                    err_rate = perf.get("error_rate", 0)
-                    if err_rate > spec.error.max_error_rate:
-                        reasons.append(f"error.rate_over:{err_rate}>{spec.error.max_error_rate}")
-
-    _evaluate_infra(spec.judge_infra, evidence, reasons)
-    _evaluate_canary(spec.canary, evidence, reasons)
-    _evaluate_drift(spec.drift, evidence, reasons)
-    _check_saturation(evidence, spec, reasons)
-
-    return ("pass" if not reasons else "fail"), reasons
+        checks.append(_compile_perf(spec))
+    if spec.judge_infra is not None:
+        checks.append(functools.partial(_evaluate_infra, spec.judge_infra))
+    if spec.canary is not None:
+        checks.append(functools.partial(_evaluate_canary, spec.canary))
+    if isinstance(spec.drift, SLODrift):
+        checks.append(functools.partial(_evaluate_drift, spec.drift))
+    if spec.saturation:
+        checks.append(lambda evidence, reasons: _check_saturation(evidence, spec, reasons))
+    return CompiledSLO(spec, checks)
+
+
+def get_compiled_slo(slo: Dict[str, Any]) -> CompiledSLO:
+    """내용 해시 기반 LRU 캐시에서 컴파일된 SLO 를 조회 (없으면 컴파일)."""
+    try:
+        key = hashlib.sha256(
+            json.dumps(slo, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+    except (TypeError, ValueError):
+        # JSON 직렬화 불가 SLO 는 캐시하지 않는다
+        _CACHE_MISSES.inc()
+        return compile_slo(slo)
+
+    with _CACHE_LOCK:
+        compiled = _CACHE.get(key)
+        if compiled is not None:
+            _CACHE.move_to_end(key)
+    if compiled is not None:
+        _CACHE_HITS.inc()
+        return compiled
+
+    _CACHE_MISSES.inc()
+    compiled = compile_slo(slo)
+    with _CACHE_LOCK:
+        _CACHE[key] = compiled
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return compiled
+
+
+def clear_slo_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def evaluate(evidence: Dict[str, Any], slo: Dict[str, Any]) -> Tuple[str, List[str]]:
+    return get_compiled_slo(slo).evaluate(evidence)
 
 
 def _evaluate_infra(spec: Optional[SLOJudgeInfra], evidence: Dict[str, Any], reasons: List[str]) -> None:
@@ -181,33 +304,23 @@ def _evaluate_canary(spec: Optional[SLOCanary], evidence: Dict[str, Any], reason
 def _evaluate_drift(spec: Optional[Any], evidence: Dict[str, Any], reasons: List[str]) -> None:
     """
     Drift SLO 검증
-    posterior_drift.json 파일을 읽어서 severity, abs_diff, kl 검사
+    posterior_drift.json 스냅샷(mtime/inode 기반 캐시)으로 severity, abs_diff, kl 검사
     """
     if spec is None:
         return
 
-    import os
-    from apps.judge.slo_schema import SLODrift
-
     # SLODrift 타입 검증
     if not isinstance(spec, SLODrift):
         return
 
-    path = spec.source
-    if not os.path.exists(path):
-        reasons.append("drift.source_missing")
-        return
-
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            d = json.load(f)
-    except Exception:
-        reasons.append("drift.source_unreadable")
+    snapshot = DRIFT_STATE.get(spec.source)
+    if isinstance(snapshot, str):
+        reasons.append(snapshot)
         return
 
-    sev = str(d.get("severity", "info"))
-    abs_diff = float(d.get("abs_diff", 0.0))
-    kl = float(d.get("kl", 0.0))
+    sev = snapshot.severity
+    abs_diff = snapshot.abs_diff
+    kl = snapshot.kl
 
     # Severity 검사
     if sev in set(spec.forbid_severity):
@@ -7,6 +7,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from apps.common.canonical_json import canonical_sha256
+
+from .reason_summary import update_summary
+
 REQUIRED_KEYS = ["meta", "witness", "usage", "rating", "quota", "budget", "anomaly", "integrity"]
 CORE_KEYS = ["meta", "witness", "usage", "rating", "quota", "budget", "anomaly"]
 OPTIONAL_BLOCKS = ["perf", "perf_judge", "judges", "canary"]
@@ -29,8 +33,7 @@ def _core_signature(data: Dict[str, Any]) -> str:
     for block in OPTIONAL_BLOCKS:
         if block in data and data[block] is not None:
             core[block] = data[block]
-    payload = json.dumps(core, ensure_ascii=False, sort_keys=True).encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+    return canonical_sha256(core)
 
 
 def _tier_for(path: Path) -> str:
@@ -182,6 +185,8 @@ def write_index(root: str = "var/evidence", out: str | None = None, redact_confi
     """
     Write evidence index to file
 
+    Also refreshes the reason summary sidecar next to it (see reason_summary).
+
     Args:
         root: Evidence directory path
         out: Output path (default: {root}/index.json)
@@ -195,6 +200,7 @@ def write_index(root: str = "var/evidence", out: str | None = None, redact_confi
     out_path = Path(out) if out else Path(root) / "index.json"
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_text(json.dumps(index, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+    update_summary(index, root, out_path)
     return str(out_path)
 
 
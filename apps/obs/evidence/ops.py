@@ -4,7 +4,7 @@ import json
 from pathlib import Path
 from typing import Any, Dict
 
-from .snapshot import sha256_text
+from apps.common.canonical_json import canonical_sha256
 
 CORE_KEYS = ["meta", "witness", "usage", "rating", "quota", "budget", "anomaly"]
 OPTIONAL_KEYS = ["perf", "perf_judge", "judges", "canary"]
@@ -15,8 +15,7 @@ def recompute_integrity(evidence: Dict[str, Any]) -> Dict[str, Any]:
     for key in OPTIONAL_KEYS:
         if key in evidence and evidence[key] is not None:
             core[key] = evidence[key]
-    core_json = json.dumps(core, ensure_ascii=False, sort_keys=True)
-    evidence.setdefault("integrity", {})["signature_sha256"] = sha256_text(core_json)
+    evidence.setdefault("integrity", {})["signature_sha256"] = canonical_sha256(core)
     return evidence
 
 
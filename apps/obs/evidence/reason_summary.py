@@ -0,0 +1,181 @@
+"""
+Evidence reason summary sidecar
+
+The reason-trend report only needs, per evidence file, when it was generated
+and which judge reason codes it carries. Re-reading every evidence file for
+that on each query is wasteful, so the indexer keeps one compact row per file
+next to the index (``index.json.reasons``):
+
+    {"version": 1, "epoch": "...", "revision": 3, "last_updated": "...",
+     "index": [ino, size, mtime_ns],                    # index.json this mirrors
+     "rows": {"evidence-a.json": {"sha256", "tier", "ts", "day", "codes"}},
+     "by_day": {"2025-11-10": {"min_ts", "max_ts", "codes"}}}
+
+Rows are reused while a file's sha256 is unchanged, so only new or modified
+evidence is parsed. ``revision`` is bumped whenever the rows or
+``last_updated`` change and, together with ``epoch``, serves as a cheap index
+signature for caches.
+"""
+from __future__ import annotations
+
+import json
+import os
+import secrets
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+SIDECAR_SUFFIX = ".reasons"
+VERSION = 1
+TIERS = {"WIP", "LOCKED"}
+
+_Stamp = Tuple[int, int, int]
+_CACHE: Dict[str, Tuple[_Stamp, Dict[str, Any]]] = {}
+
+
+def sidecar_path(index_path: str | Path) -> Path:
+    index_path = Path(index_path)
+    return index_path.with_name(index_path.name + SIDECAR_SUFFIX)
+
+
+def _stamp(path: Path) -> Optional[_Stamp]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _load_json(path: Path) -> Dict[str, Any]:
+    try:
+        with path.open("r", encoding="utf-8") as fh:
+            return json.load(fh) or {}
+    except Exception:
+        return {}
+
+
+def reason_codes(evidence: Dict[str, Any]) -> Dict[str, int]:
+    """Judge reason code -> occurrences, in first-seen order."""
+    codes: Dict[str, int] = {}
+    for judge in evidence.get("judges") or []:
+        for reason in judge.get("reasons") or []:
+            code = reason.get("code")
+            if code:
+                codes[code] = codes.get(code, 0) + 1
+    return codes
+
+
+def build_row(evidence: Dict[str, Any], sha256: str, tier: str) -> Dict[str, Any]:
+    """Summary row for one evidence document (``ts``/``day`` are None without a parseable ``meta.generated_at``)."""
+    ts: Optional[float] = None
+    day: Optional[str] = None
+    iso_ts = (evidence.get("meta") or {}).get("generated_at")
+    if iso_ts:
+        try:
+            stamp = datetime.fromisoformat(iso_ts.replace("Z", "+00:00"))
+            if stamp.tzinfo is None:
+                stamp = stamp.replace(tzinfo=timezone.utc)
+            ts, day = stamp.timestamp(), stamp.date().isoformat()
+        except Exception:
+            pass
+    return {"sha256": sha256, "tier": tier, "ts": ts, "day": day, "codes": reason_codes(evidence)}
+
+
+def _by_day(rows: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    out: Dict[str, Dict[str, Any]] = {}
+    for row in rows.values():
+        if row["ts"] is None:
+            continue
+        agg = out.get(row["day"])
+        if agg is None:
+            agg = out[row["day"]] = {"min_ts": row["ts"], "max_ts": row["ts"], "codes": {}}
+        agg["min_ts"] = min(agg["min_ts"], row["ts"])
+        agg["max_ts"] = max(agg["max_ts"], row["ts"])
+        for code, count in row["codes"].items():
+            agg["codes"][code] = agg["codes"].get(code, 0) + count
+    return dict(sorted(out.items()))
+
+
+def update_summary(index: Dict[str, Any], root: str | Path, index_path: str | Path) -> Dict[str, Any]:
+    """
+    Refresh the sidecar of ``index_path`` so it mirrors ``index["files"]``
+
+    Call after ``index_path`` has been written. Rows whose sha256 still
+    matches are kept; other files are read once.
+
+    Args:
+        index: Index dictionary as returned by ``scan_dir``
+        root: Evidence directory the index paths are relative to
+        index_path: Path of the written index file
+
+    Returns:
+        The sidecar document that was written
+    """
+    root_path = Path(root)
+    out_path = sidecar_path(index_path)
+    previous = _load_json(out_path)
+    if previous.get("version") != VERSION:
+        previous = {}
+    prev_rows: Dict[str, Dict[str, Any]] = previous.get("rows") or {}
+
+    rows: Dict[str, Dict[str, Any]] = {}
+    for item in index.get("files") or []:
+        rel, tier, sha = item.get("path"), item.get("tier"), item.get("sha256") or ""
+        if not rel or tier not in TIERS:
+            continue
+        old = prev_rows.get(rel)
+        if old is not None and sha and old.get("sha256") == sha:
+            rows[rel] = {**old, "tier": tier}
+            continue
+        rows[rel] = build_row(_load_json(root_path / rel), sha, tier)
+
+    last_updated = index.get("last_updated") or index.get("generated_at")
+    changed = rows != prev_rows or last_updated != previous.get("last_updated")
+    revision = int(previous.get("revision") or 0) + (1 if changed else 0)
+    doc = {
+        "version": VERSION,
+        "epoch": previous.get("epoch") or secrets.token_hex(4),
+        "revision": revision,
+        "last_updated": last_updated,
+        "index": _stamp(Path(index_path)),
+        "rows": rows,
+        "by_day": _by_day(rows),
+    }
+    tmp = out_path.with_name(out_path.name + ".tmp")
+    tmp.write_text(json.dumps(doc, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, out_path)
+    return doc
+
+
+def load_summary(index_path: str | Path) -> Optional[Dict[str, Any]]:
+    """
+    Sidecar of ``index_path`` if it was written for the current index file
+
+    Returns None when the sidecar is missing, unreadable or stale (the index
+    was rewritten without refreshing it). Parsed sidecars are memoised by
+    file stat, so a hit costs two ``stat`` calls.
+    """
+    index_path = Path(index_path)
+    path = sidecar_path(index_path)
+    stamp = _stamp(path)
+    if stamp is None:
+        return None
+    cached = _CACHE.get(str(path))
+    if cached is not None and cached[0] == stamp:
+        doc = cached[1]
+    else:
+        doc = _load_json(path)
+        if doc.get("version") != VERSION:
+            return None
+        _CACHE[str(path)] = (stamp, doc)
+    index_stamp = _stamp(index_path)
+    if index_stamp is None or list(index_stamp) != list(doc.get("index") or []):
+        return None
+    return doc
+
+
+def summary_signature(doc: Dict[str, Any]) -> str:
+    return f"r{doc['revision']}-{doc['epoch']}"
+
+
+__all__ = ["build_row", "load_summary", "reason_codes", "sidecar_path", "summary_signature", "update_summary"]
@@ -11,6 +11,7 @@ import os
 from typing import Dict, Any, List
 from dataclasses import dataclass, asdict
 
+from apps.common.canonical_json import canonical_sha256
 from apps.common.timeutil import time_utcnow
 from apps.rating.engine import RatingResult
 from apps.limits.quota import QuotaDecision
@@ -174,8 +175,7 @@ def build_snapshot(
     if canary is not None:
         core["canary"] = canary
     payload = pii_mask_event(core) if os.getenv("DECISIONOS_PII_ENABLE", "0") == "1" else core
-    core_json = json.dumps(payload, ensure_ascii=False, sort_keys=True)
-    integrity = {"signature_sha256": sha256_text(core_json)}
+    integrity = {"signature_sha256": canonical_sha256(payload)}
 
     return Evidence(
         meta=payload["meta"],
@@ -1,62 +1,37 @@
 from __future__ import annotations
 
-import hashlib
-import json
-import time
-from dataclasses import dataclass
 from typing import Any, Tuple
 
+from apps.ops.cache.lru import BoundedCache, CacheEntry, encode_html, encode_json, env_int
 
-@dataclass
-class CacheEntry:
-    etag: str
-    expires_at: float
-    payload: Any  # JSON dict or HTML string/bytes
-    last_modified: str | None = None
 
+class InMemoryCache(BoundedCache):
+    """
+    ops API 응답 캐시. 키에 index_sig 가 들어가므로 증거가 바뀔 때마다 옛 엔트리가 남는데,
+    BoundedCache 의 엔트리/바이트 상한(LRU)과 스위퍼가 이를 정리함.
+    """
 
-class InMemoryCache:
     def __init__(self) -> None:
-        self._store: dict[str, CacheEntry] = {}
+        super().__init__(
+            max_entries=env_int("DECISIONOS_OPS_CACHE_MAX_ENTRIES", 1024),
+            max_bytes=env_int("DECISIONOS_OPS_CACHE_MAX_BYTES", 32 * 1024 * 1024),
+            sweep_interval_s=env_int("DECISIONOS_OPS_CACHE_SWEEP_SEC", 30),
+        )
 
-    def _now(self) -> float:
-        return time.time()
-
-    def peek(self, key: str) -> Optional[CacheEntry]:
-        entry = self._store.get(key)
-        if not entry:
-            return None
-        if entry.expires_at < self._now():
-            self._store.pop(key, None)
-            return None
-        return entry
-
-    def put(self, key: str, etag: str, payload: Any, ttl_sec: int, last_modified: str | None = None) -> CacheEntry:
-        entry = CacheEntry(etag=etag, expires_at=self._now() + ttl_sec, payload=payload, last_modified=last_modified)
-        self._store[key] = entry
-        return entry
-
-    def clear(self) -> None:
-        self._store.clear()
+    def put(  # type: ignore[override]
+        self, key: str, etag: str, payload: Any, ttl_sec: int, last_modified: str | None = None, body: bytes | None = None
+    ) -> CacheEntry:
+        if body is None:
+            _, body = encode_html(payload) if isinstance(payload, (str, bytes)) else encode_json(payload)
+        return self.put_entry(key, self.entry(payload, ttl_sec, etag=etag, body=body, last_modified=last_modified))
 
 
 cache = InMemoryCache()
 
 
-def _sha256_hex(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
-
-
 def compute_etag_for_json(obj: Any) -> Tuple[str, bytes]:
-    blob = json.dumps(
-        obj,
-        sort_keys=True,
-        ensure_ascii=False,
-        separators=(",", ":"),
-    ).encode("utf-8")
-    return f"\"{_sha256_hex(blob)}\"", blob
+    return encode_json(obj)
 
 
 def compute_etag_for_html(data: str | bytes) -> Tuple[str, bytes]:
-    blob = data if isinstance(data, (bytes, bytearray)) else data.encode("utf-8")
-    return f"\"{_sha256_hex(blob)}\"", bytes(blob)
+    return encode_html(data)
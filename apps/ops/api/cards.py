@@ -59,7 +59,7 @@ def reason_trends(request: Request, response: Response, period: str = "7d", buck
     body = payload
     is_delta = False
     if delta_base:
-        prev = _STORE.get(key)
+        prev = _STORE.get_entry(key)
         if prev and prev[0] == delta_base:
             body = _delta(prev[1], payload)
             is_delta = True
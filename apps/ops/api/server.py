@@ -8,8 +8,9 @@ from typing import Dict, List
 from fastapi import Depends, FastAPI, Header, HTTPException, Query, Response
 from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
 
-from apps.ops.api.cache import cache, compute_etag_for_html, compute_etag_for_json
+from apps.ops.api.cache import cache
 from apps.ops.api.cards_delta import router as cards_delta_router
+from apps.ops.cache.lru import CacheEntry
 from apps.ops.reports.reason_trend import aggregate_reason_trend, get_index_signature
 from apps.policy import pep
 
@@ -85,16 +86,13 @@ def _cache_key(prefix: str, *parts: str) -> str:
     return f"{prefix}:{suffix}"
 
 
-def _handle_cache_hit(entry, ttl: int, last_modified_hint: str | None, if_none_match: str | None) -> Response | None:
-    if not entry:
-        return None
+def _respond(entry: CacheEntry, ttl: int, last_modified_hint: str | None, if_none_match: str | None) -> Response:
+    # 캐시에 저장된 인코딩 바이트를 그대로 전송 (히트 시 JSON 재인코딩 없음)
     headers = _cache_headers(entry.etag, ttl, entry.last_modified or last_modified_hint)
     if if_none_match and if_none_match == entry.etag:
         return Response(status_code=304, headers=headers)
-    payload = entry.payload
-    if isinstance(payload, str):
-        return HTMLResponse(payload, headers=headers)
-    return JSONResponse(payload, headers=headers)
+    media_type = "text/html; charset=utf-8" if isinstance(entry.payload, str) else "application/json"
+    return Response(content=entry.body, media_type=media_type, headers=headers)
 
 
 @app.get("/healthz")
@@ -110,16 +108,13 @@ def reason_trend(
     ttl = _ttl_sec()
     index_sig, index_last_updated = get_index_signature(EVIDENCE_ROOT)
     key = _cache_key("trend", str(days), index_sig)
-    entry = cache.peek(key)
-    cached = _handle_cache_hit(entry, ttl, index_last_updated, if_none_match)
-    if cached:
-        return cached
 
-    trend = aggregate_reason_trend(EVIDENCE_ROOT, days)
-    etag, _ = compute_etag_for_json(trend)
-    last_modified_value = trend.get("last_updated") or index_last_updated or trend.get("generated_at")
-    entry = cache.put(key, etag, trend, ttl, last_modified_value)
-    return JSONResponse(trend, headers=_cache_headers(entry.etag, ttl, entry.last_modified))
+    def build() -> CacheEntry:
+        trend = aggregate_reason_trend(EVIDENCE_ROOT, days)
+        last_modified_value = trend.get("last_updated") or index_last_updated or trend.get("generated_at")
+        return cache.entry(trend, ttl, last_modified=last_modified_value)
+
+    return _respond(cache.get_or_compute(key, build), ttl, index_last_updated, if_none_match)
 
 
 @app.get("/ops/reason-trend/card", dependencies=[Depends(rbac_ops_read)])
@@ -131,24 +126,21 @@ def reason_trend_card(
     ttl = _ttl_sec()
     index_sig, index_last_updated = get_index_signature(EVIDENCE_ROOT)
     key = _cache_key("trend_card", str(days), str(topK), index_sig)
-    entry = cache.peek(key)
-    cached = _handle_cache_hit(entry, ttl, index_last_updated, if_none_match)
-    if cached:
-        return cached
-
-    trend = aggregate_reason_trend(EVIDENCE_ROOT, days)
-    top = (trend.get("total_top") or [])[:topK]
-    payload = {
-        "window_days": trend.get("window_days"),
-        "generated_at": trend.get("generated_at"),
-        "top": top,
-        "count_evidence": trend.get("count_evidence"),
-        "last_updated": trend.get("last_updated"),
-    }
-    etag, _ = compute_etag_for_json(payload)
-    last_modified_value = payload.get("last_updated") or index_last_updated or trend.get("generated_at")
-    entry = cache.put(key, etag, payload, ttl, last_modified_value)
-    return JSONResponse(payload, headers=_cache_headers(entry.etag, ttl, entry.last_modified))
+
+    def build() -> CacheEntry:
+        trend = aggregate_reason_trend(EVIDENCE_ROOT, days)
+        top = (trend.get("total_top") or [])[:topK]
+        payload = {
+            "window_days": trend.get("window_days"),
+            "generated_at": trend.get("generated_at"),
+            "top": top,
+            "count_evidence": trend.get("count_evidence"),
+            "last_updated": trend.get("last_updated"),
+        }
+        last_modified_value = payload.get("last_updated") or index_last_updated or trend.get("generated_at")
+        return cache.entry(payload, ttl, last_modified=last_modified_value)
+
+    return _respond(cache.get_or_compute(key, build), ttl, index_last_updated, if_none_match)
 
 
 @app.get("/ops/reason-trend/card.html", response_class=HTMLResponse, dependencies=[Depends(rbac_ops_read)])
@@ -160,29 +152,25 @@ def reason_trend_card_html(
     ttl = _ttl_sec()
     index_sig, index_last_updated = get_index_signature(EVIDENCE_ROOT)
     key = _cache_key("trend_card_html", str(days), str(topK), index_sig)
-    entry = cache.peek(key)
-    cached = _handle_cache_hit(entry, ttl, index_last_updated, if_none_match)
-    if cached:
-        return cached
-
-    trend = aggregate_reason_trend(EVIDENCE_ROOT, days)
-    top = (trend.get("total_top") or [])[:topK]
-    list_items = "".join(f"<li><code>{code}</code> x {count}</li>" for code, count in top)
-    html = (
-        "<html>"
-        "<head><meta charset=\"utf-8\" /><title>Reason Trend</title></head>"
-        "<body>"
-        f"<h3>Reason Trend (last {trend.get('window_days')} days)</h3>"
-        f"<p>generated_at: {trend.get('generated_at')}</p>"
-        f"<p>total reason count: {trend.get('count_evidence')}</p>"
-        f"<ul>{list_items}</ul>"
-        "</body></html>"
-    )
-    etag, _ = compute_etag_for_html(html)
-    last_modified_value = trend.get("last_updated") or index_last_updated or trend.get("generated_at")
-    entry = cache.put(key, etag, html, ttl, last_modified_value)
-    headers = _cache_headers(entry.etag, ttl, entry.last_modified)
-    return HTMLResponse(html, headers=headers)
+
+    def build() -> CacheEntry:
+        trend = aggregate_reason_trend(EVIDENCE_ROOT, days)
+        top = (trend.get("total_top") or [])[:topK]
+        list_items = "".join(f"<li><code>{code}</code> x {count}</li>" for code, count in top)
+        html = (
+            "<html>"
+            "<head><meta charset=\"utf-8\" /><title>Reason Trend</title></head>"
+            "<body>"
+            f"<h3>Reason Trend (last {trend.get('window_days')} days)</h3>"
+            f"<p>generated_at: {trend.get('generated_at')}</p>"
+            f"<p>total reason count: {trend.get('count_evidence')}</p>"
+            f"<ul>{list_items}</ul>"
+            "</body></html>"
+        )
+        last_modified_value = trend.get("last_updated") or index_last_updated or trend.get("generated_at")
+        return cache.entry(html, ttl, last_modified=last_modified_value)
+
+    return _respond(cache.get_or_compute(key, build), ttl, index_last_updated, if_none_match)
 
 
 @app.get("/metrics")
@@ -197,6 +185,11 @@ def metrics() -> Response:
     except Exception:
         lines.append('decisionos_cards_etag_total{result="hit"} 0')
         lines.append('decisionos_cards_etag_total{result="miss"} 0')
+    stats = cache.stats()
+    for result in ("hits", "misses", "evictions", "expirations", "coalesced"):
+        lines.append(f'decisionos_ops_cache_total{{result="{result}"}} {stats[result]}')
+    lines.append(f"decisionos_ops_cache_entries {stats['entries']}")
+    lines.append(f"decisionos_ops_cache_bytes {stats['bytes']}")
     body = "\n".join(lines) + "\n"
     return PlainTextResponse(body, media_type="text/plain")
 
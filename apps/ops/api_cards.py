@@ -7,9 +7,8 @@ import os, json
 
 router = APIRouter()
 
-# ETag 스냅샷 저장소 (프로세스 단일톤)
-from .cache.etag_store import build_etag_store
-_ETAG_STORE = build_etag_store()
+# ETag 스냅샷 저장소 (프로세스 단일톤, api_health 와 공유)
+from .cache.etag_store import _ETAG_STORE
 
 # Mock RBAC for now - will integrate with existing RBAC system
 def require_scope(scope: str):
@@ -182,7 +181,7 @@ def get_summary(
         palette_with_desc, aggregate_reasons, label_catalog_hash,
         make_snapshot_payload, snapshot_etag, snapshot_token, try_decode_token, diff_counts
     )
-    from .cards.events import load_reason_events
+    from .cards.events import load_reason_pairs, reason_events_revision
     from .cards.etag_v2 import build_cards_etag_key, compute_cards_etag
     from .cards.delta import compute_delta_summary, same_window
 
@@ -194,13 +193,16 @@ def get_summary(
         raise HTTPException(status_code=400, detail="invalid start/end")
     if not (dt_end > dt_start):
         raise HTTPException(status_code=400, detail="end must be after start")
+    if bucket:
+        if bucket not in ("hour", "day"):
+            raise HTTPException(status_code=400, detail="bucket must be 'hour' or 'day'")
+        if bucket_limit < 1 or bucket_limit > 1000:
+            raise HTTPException(status_code=400, detail="bucket_limit must be 1..1000")
 
     ev_path = os.environ.get("REASON_EVENTS_PATH", "var/evidence/reasons.jsonl")
-    reasons = load_reason_events(dt_start, dt_end, ev_path)
-    agg = aggregate_reasons(reasons, top=top)
     window = {"start": dt_start.isoformat(), "end": dt_end.isoformat()}
 
-    # ETag v2: comprehensive cache key
+    # ETag v2: 설정 파일 해시(stat 캐시) + 요청 윈도 + 이벤트 저장소 리비전 → 이벤트를 읽기 전에 계산
     label_cat_path = os.environ.get("LABEL_CATALOG_PATH", "configs/ops/label_catalog.json")
     group_weights_path = os.environ.get("GROUP_WEIGHTS_PATH", "configs/ops/group_weights.json")
     seasonal_path = os.environ.get("SEASONAL_THRESHOLDS_PATH", "configs/ops/seasonal_thresholds.json")
@@ -216,15 +218,20 @@ def get_summary(
         label_catalog_path=label_cat_path,
         group_weights_path=group_weights_path,
         seasonal_thresholds_path=seasonal_path,
-        data_revision_token=data_rev
+        data_revision_token=data_rev,
+        events_revision=reason_events_revision(ev_path),
     )
     current_etag = compute_cards_etag(etag_key)
 
-    # 304 처리 (If-None-Match 우선: delta 무시)
+    # 304 처리 (If-None-Match 우선: delta 무시) — 이벤트 데이터는 건드리지 않음
     if if_none_match and if_none_match == current_etag:
         response.status_code = 304
         return None
 
+    # 이벤트는 한 번만 조회: 같은 (ts, reason) 목록으로 합계와 버킷을 모두 계산
+    pairs = load_reason_pairs(dt_start, dt_end, ev_path)
+    agg = aggregate_reasons([reason for _, reason in pairs], top=top)
+
     # Legacy payload for delta token (backwards compat)
     payload = make_snapshot_payload(window, agg["raw"], label_catalog_hash())
 
@@ -246,32 +253,7 @@ def get_summary(
         from .cards.bucketing import bucketize_counts_by_time, apply_bucket_scores, pick_top_buckets
         from .cards.grouping import group_of, load_group_weights
 
-        if bucket not in ("hour", "day"):
-            raise HTTPException(status_code=400, detail="bucket must be 'hour' or 'day'")
-        if bucket_limit < 1 or bucket_limit > 1000:
-            raise HTTPException(status_code=400, detail="bucket_limit must be 1..1000")
-
-        # Load rows with ts + reason
-        rows = []
-        from .cards.events import load_reason_events
-        ev_path2 = os.environ.get("REASON_EVENTS_PATH", "var/evidence/reasons.jsonl")
-        if os.path.exists(ev_path2):
-            with open(ev_path2, "r", encoding="utf-8") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    obj = json.loads(line)
-                    ts_str = obj.get("ts", "")
-                    reason = obj.get("reason", "")
-                    if ts_str and reason:
-                        # Parse and filter by window
-                        try:
-                            ts = _parse_iso(ts_str)
-                            if ts >= dt_start and ts < dt_end:
-                                rows.append({"ts": ts_str, "reason": reason})
-                        except Exception:
-                            pass
-
+        rows = [{"ts": ts_raw, "reason": reason} for ts_raw, reason in pairs if ts_raw and reason]
         all_buckets = bucketize_counts_by_time(rows, bucket)
 
         # continuity offset
@@ -26,7 +26,7 @@ def get_etag_store_health() -> Dict[str, Any]:
             info = _ETAG_STORE._r.info("stats")
             backend_config = {
                 "url": os.environ.get("DECISIONOS_REDIS_URL", "redis://localhost:6379/0"),
-                "prefix": os.environ.get("DECISIONOS_ETAG_REDIS_PREFIX", "dos:cards:etag"),
+                "prefix": _ETAG_STORE.prefix,
                 "healthy": True,
                 "keyspace_hits": info.get("keyspace_hits", 0),
                 "keyspace_misses": info.get("keyspace_misses", 0),
@@ -46,6 +46,7 @@ def get_etag_store_health() -> Dict[str, Any]:
             backend_config = {
                 "healthy": True,
                 "entries": data_size,
+                "cache": _ETAG_STORE.stats(),  # 바이트/축출/만료 카운터
             }
         except Exception as e:
             backend_config = {
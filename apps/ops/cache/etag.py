@@ -1,15 +1,33 @@
 from __future__ import annotations
-import hashlib, json, os, pathlib
-from typing import Any, Dict, Optional
+import hashlib, json, os, pathlib, stat, threading
+from typing import Any, Dict, Optional, Tuple
+
+_FILE_SHA: Dict[str, Tuple[Tuple[int, int, int], str]] = {}  # path -> ((ino, size, mtime_ns), sha)
+_FILE_SHA_MAX = 256
+_FILE_SHA_LOCK = threading.Lock()
 
 def _sha256_bytes(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
 def sha256_file(path: str) -> Optional[str]:
-    p = pathlib.Path(path)
-    if not p.exists() or not p.is_file():
+    """파일 sha256. 같은 (inode, 크기, mtime) 이면 이전 해시를 재사용해 요청마다 다시 읽지 않음."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
         return None
-    return _sha256_bytes(p.read_bytes())
+    key = (st.st_ino, st.st_size, st.st_mtime_ns)
+    with _FILE_SHA_LOCK:
+        hit = _FILE_SHA.get(path)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    digest = _sha256_bytes(pathlib.Path(path).read_bytes())
+    with _FILE_SHA_LOCK:
+        if len(_FILE_SHA) >= _FILE_SHA_MAX:
+            _FILE_SHA.clear()
+        _FILE_SHA[path] = (key, digest)
+    return digest
 
 def make_etag(key: Dict[str, Any]) -> str:
     # 안정적 직렬화
@@ -2,18 +2,49 @@ from __future__ import annotations
 
 import hashlib
 import json
+import math
 import os
 import time
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from apps.common.compress import CompressionPolicy
+
+from .lru import BoundedCache, encode_json, env_int
+from .metrics import get_metrics
+from .tiered import TieredCache
 
 
 class ETagStore:
-    def get(self, key: str) -> Optional[Tuple[str, dict, float]]:
+    """
+    ETag → 스냅샷 저장소.
+
+    - ``put(key, payload, ttl_sec)`` / ``get(key) -> payload``: 카드 스냅샷·델타 베이스용
+    - ``set(key, etag, payload, ttl_sec)`` / ``get_entry(key) -> (etag, payload, exp)``: 키별 최신 ETag 보관용
+    """
+
+    default_ttl: int = 300
+
+    def put(self, key: str, payload: dict, ttl_sec: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    def get(self, key: str) -> Optional[dict]:
         raise NotImplementedError
 
     def set(self, key: str, etag: str, payload: dict, ttl_sec: int = 300) -> None:
         raise NotImplementedError
 
+    def get_entry(self, key: str) -> Optional[Tuple[str, dict, float]]:
+        raise NotImplementedError
+
+    def invalidate(self, prefix: str = "") -> int:
+        raise NotImplementedError
+
+    def clear_expired(self) -> int:
+        return 0
+
+    def stats(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
     def compute_etag(self, payload: dict, extra: str = "") -> str:
         h = hashlib.sha256()
         h.update(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode())
@@ -23,25 +54,54 @@ class ETagStore:
 
 
 class InMemoryETagStore(ETagStore):
-    def __init__(self):
-        self._m = {}  # key -> (etag, payload_json_str, exp_ts)
+    """
+    프로세스 내 저장소 (BoundedCache: 엔트리/바이트 상한 LRU + TTL + 스위퍼).
+
+    스냅샷은 put 시점에 한 번 인코딩해 두고, get 은 저장된 객체를 그대로 반환(읽기 전용으로 취급).
+    """
+
+    def __init__(self, default_ttl: int = 300, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.default_ttl = default_ttl
+        self._data = BoundedCache(
+            max_entries=max_entries or env_int("DECISIONOS_ETAG_MAX_ENTRIES", 4096),
+            max_bytes=max_bytes or env_int("DECISIONOS_ETAG_MAX_BYTES", 64 * 1024 * 1024),
+            sweep_interval_s=env_int("DECISIONOS_ETAG_SWEEP_SEC", 30),
+        )
 
-    def get(self, key: str):
-        v = self._m.get(key)
-        if not v:
+    def put(self, key: str, payload: dict, ttl_sec: Optional[int] = None) -> None:
+        self._data.put(key, payload, self.default_ttl if ttl_sec is None else ttl_sec)
+        get_metrics().record_put()
+
+    def get(self, key: str) -> Optional[dict]:
+        entry = self._data.get(key)
+        if entry is None:
+            get_metrics().record_miss()
             return None
-        etag, s, exp = v
-        if exp and exp < time.time():
-            self._m.pop(key, None)
+        get_metrics().record_hit()
+        return entry.payload
+
+    def set(self, key: str, etag: str, payload: dict, ttl_sec: int = 300) -> None:
+        # ttl_sec=0 → 만료 없음 (기존 동작)
+        _, body = encode_json(payload)
+        self._data.put(key, payload, ttl_sec or math.inf, etag=etag, body=body)
+        get_metrics().record_put()
+
+    def get_entry(self, key: str) -> Optional[Tuple[str, dict, float]]:
+        entry = self._data.get(key)
+        if entry is None:
             return None
-        return etag, json.loads(s), exp
+        return entry.etag, entry.payload, entry.expires_at if entry.expires_at != math.inf else 0
 
-    def set(self, key: str, etag: str, payload: dict, ttl_sec: int = 300):
-        self._m[key] = (
-            etag,
-            json.dumps(payload, separators=(",", ":"), sort_keys=True),
-            time.time() + ttl_sec if ttl_sec else 0,
-        )
+    def invalidate(self, prefix: str = "") -> int:
+        return self._data.invalidate(prefix)
+
+    def clear_expired(self) -> int:
+        return self._data.clear_expired()
+
+    def stats(self) -> Dict[str, Any]:
+        self._data.clear_expired()
+        cache_stats = self._data.stats()
+        return {"backend": "memory", "total_keys": cache_stats["entries"], "default_ttl": self.default_ttl, **cache_stats}
 
 
 def _try_import_redis():
@@ -54,34 +114,96 @@ def _try_import_redis():
 
 
 class RedisETagStore(ETagStore):
-    def __init__(self, url: str):
+    """
+    Redis 저장소 + 프로세스 내 L1 (TieredCache). 만료는 Redis TTL(SETEX)에 맡김.
+
+    값 형식은 기존과 같음: ``{"etag", "payload", "exp"}`` 키 정렬 평문 JSON (압축 없음).
+    """
+
+    def __init__(self, url: str, prefix: Optional[str] = None, default_ttl: int = 300):
         rmod = _try_import_redis()
         if not rmod:
             raise RuntimeError("redis-py not installed")
-        self.r = rmod.from_url(url, decode_responses=True)
-        self.prefix = os.getenv("DECISIONOS_ETAG_PREFIX", "decisionos:etag:")
+        self._r = rmod.from_url(url)
+        # 예전 DECISIONOS_ETAG_PREFIX("decisionos:etag:" 형식, 끝 콜론 포함)도 계속 인정
+        legacy = (os.getenv("DECISIONOS_ETAG_PREFIX") or "").rstrip(":")
+        self.prefix = prefix or os.getenv("DECISIONOS_ETAG_REDIS_PREFIX") or legacy or "dos:cards:etag"
+        self.default_ttl = default_ttl
+        self._cache = TieredCache(
+            "etag", self._r, key_prefix=f"{self.prefix}:", default_ttl=default_ttl,
+            policy=CompressionPolicy(codec="none"), sort_keys=True,
+        )
 
-    def _k(self, key: str) -> str:
-        return f"{self.prefix}{key}"
+    def _write(self, key: str, etag: str, payload: dict, ttl_sec: int) -> None:
+        exp = time.time() + ttl_sec if ttl_sec else 0
+        self._cache.set(key, {"etag": etag, "payload": payload, "exp": exp}, ttl_sec)
 
-    def get(self, key: str):
-        s = self.r.get(self._k(key))
-        if not s:
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        obj = self._cache.get(key)
+        if not obj:
             return None
-        obj = json.loads(s)
         if obj.get("exp") and obj["exp"] < time.time():
-            self.r.delete(self._k(key))
+            self._cache.delete(key)
+            return None
+        return obj
+
+    def put(self, key: str, payload: dict, ttl_sec: Optional[int] = None) -> None:
+        etag, _ = encode_json(payload)
+        self._write(key, etag, payload, self.default_ttl if ttl_sec is None else ttl_sec)
+        get_metrics().record_put()
+
+    def get(self, key: str) -> Optional[dict]:
+        obj = self._read(key)
+        if obj is None:
+            get_metrics().record_miss()
+            return None
+        get_metrics().record_hit()
+        return obj["payload"]
+
+    def get_many(self, keys: List[str]) -> Dict[str, dict]:
+        """여러 스냅샷을 MGET 한 번으로 (L1 히트분 제외)."""
+        now = time.time()
+        return {k: o["payload"] for k, o in self._cache.get_many(keys).items() if not (o.get("exp") and o["exp"] < now)}
+
+    def set(self, key: str, etag: str, payload: dict, ttl_sec: int = 300) -> None:
+        self._write(key, etag, payload, ttl_sec)
+        get_metrics().record_put()
+
+    def get_entry(self, key: str) -> Optional[Tuple[str, dict, float]]:
+        obj = self._read(key)
+        if obj is None:
             return None
         return obj["etag"], obj["payload"], obj.get("exp", 0)
 
-    def set(self, key: str, etag: str, payload: dict, ttl_sec: int = 300):
-        exp = time.time() + ttl_sec if ttl_sec else 0
-        body = {"etag": etag, "payload": payload, "exp": exp}
-        s = json.dumps(body, separators=(",", ":"), sort_keys=True)
-        if ttl_sec:
-            self.r.setex(self._k(key), ttl_sec, s)
-        else:
-            self.r.set(self._k(key), s)
+    def invalidate(self, prefix: str = "") -> int:
+        plen = len(self.prefix) + 1
+        keys = [k.decode() if isinstance(k, bytes) else k for k in self._r.scan_iter(match=f"{self.prefix}:{prefix}*")]
+        return self._cache.delete(*[k[plen:] for k in keys]) if keys else 0
+
+    def stats(self) -> Dict[str, Any]:
+        total = sum(1 for _ in self._r.scan_iter(match=f"{self.prefix}:*"))
+        return {
+            "backend": "redis",
+            "total_keys": total,
+            "default_ttl": self.default_ttl,
+            "prefix": self.prefix,
+            "tiers": self._cache.stats(),
+        }
+
+
+def build_etag_store() -> ETagStore:
+    """DECISIONOS_ETAG_BACKEND=memory|redis (redis 실패 시 memory 폴백), TTL 은 DECISIONOS_ETAG_TTL."""
+    ttl = env_int("DECISIONOS_ETAG_TTL", 300)
+    backend = os.getenv("DECISIONOS_ETAG_BACKEND", "memory").strip().lower()
+    url = os.getenv("DECISIONOS_REDIS_URL", "").strip()
+    if backend == "redis" and url:
+        try:
+            store = RedisETagStore(url, default_ttl=ttl)
+            store._r.ping()
+            return store
+        except Exception:
+            get_metrics().record_error()
+    return InMemoryETagStore(default_ttl=ttl)
 
 
 def get_store() -> ETagStore:
@@ -92,3 +214,7 @@ def get_store() -> ETagStore:
         except Exception:
             return InMemoryETagStore()
     return InMemoryETagStore()
+
+
+# 공유 인스턴스 (api_cards, api_health 가 사용)
+_ETAG_STORE: ETagStore = build_etag_store()
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+@dataclass
+class CacheEntry:
+    etag: str
+    expires_at: float  # 0 = 만료 없음
+    payload: Any  # 원본 객체(JSON dict 또는 HTML 문자열)
+    last_modified: str | None = None
+    body: bytes = b""  # 인코딩된 응답 바이트 (히트 시 재인코딩 없이 그대로 전송)
+    nbytes: Optional[int] = None  # body 없이 보관할 때 바이트 상한 집계에 쓸 크기
+
+    @property
+    def size(self) -> int:
+        return len(self.body) if self.nbytes is None else self.nbytes
+
+
+def encode_json(obj: Any) -> Tuple[str, bytes]:
+    """정규화 JSON 바이트와 강한 ETag("sha256")."""
+    blob = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return f"\"{hashlib.sha256(blob).hexdigest()}\"", blob
+
+
+def encode_html(data: str | bytes) -> Tuple[str, bytes]:
+    blob = bytes(data) if isinstance(data, (bytes, bytearray)) else data.encode("utf-8")
+    return f"\"{hashlib.sha256(blob).hexdigest()}\"", blob
+
+
+class _Flight:
+    __slots__ = ("done", "entry", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.entry: Optional[CacheEntry] = None
+        self.error: Optional[BaseException] = None
+
+
+class BoundedCache:
+    """
+    엔트리 수/바이트 상한이 있는 LRU + TTL 캐시 (스레드 안전).
+
+    - 조회 시 만료 검사 + LRU 갱신, 상한 초과 시 가장 오래 안 쓴 엔트리부터 축출
+    - 엔트리는 인코딩된 바이트와 ETag 를 함께 보관 → 히트 경로에서 JSON 인코딩 없음
+    - ``get_or_compute``: 같은 키의 동시 미스는 한 번만 계산(나머지는 결과 대기)
+    - 백그라운드 스위퍼가 ``sweep_interval_s`` 마다 만료 엔트리 정리
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: Optional[float] = None,
+        sweep_interval_s: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[str, _Flight] = {}
+        self._stats = {"hits": 0, "misses": 0, "puts": 0, "evictions": 0, "expirations": 0, "coalesced": 0}
+        if sweep_interval_s > 0:
+            _SWEEPER.register(self, sweep_interval_s)
+
+    # -- 조회 -----------------------------------------------------------------
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and self._expired(entry, self._clock()):
+                self._drop(key)
+                self._stats["expirations"] += 1
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._data.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry
+
+    peek = get
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    # -- 저장 -----------------------------------------------------------------
+    def entry(
+        self,
+        payload: Any,
+        ttl_sec: Optional[float] = None,
+        etag: Optional[str] = None,
+        body: Optional[bytes] = None,
+        last_modified: str | None = None,
+        size: Optional[int] = None,
+    ) -> CacheEntry:
+        """저장하지 않고 엔트리만 생성 (etag/body/size 가 모두 없으면 JSON/HTML 로 인코딩)."""
+        if body is None and size is None:
+            enc_etag, body = encode_html(payload) if isinstance(payload, (str, bytes)) else encode_json(payload)
+            etag = etag or enc_etag
+        ttl = self.default_ttl if ttl_sec is None else ttl_sec
+        expires_at = self._clock() + ttl if ttl is not None else 0.0
+        return CacheEntry(
+            etag=etag or "", expires_at=expires_at, payload=payload, last_modified=last_modified, body=body or b"", nbytes=size
+        )
+
+    def put(self, key: str, payload: Any, ttl_sec: Optional[float] = None, **kw: Any) -> CacheEntry:
+        return self.put_entry(key, self.entry(payload, ttl_sec, **kw))
+
+    def put_entry(self, key: str, entry: CacheEntry) -> CacheEntry:
+        with self._lock:
+            if key in self._data:
+                self._drop(key)
+            self._stats["puts"] += 1
+            if entry.size > self.max_bytes:
+                return entry  # 한 개가 상한보다 크면 저장하지 않음
+            self._data[key] = entry
+            self._bytes += entry.size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._data)))
+                self._stats["evictions"] += 1
+        return entry
+
+    def get_or_compute(self, key: str, compute: Callable[[], CacheEntry]) -> CacheEntry:
+        """히트면 바로 반환, 미스면 ``compute()`` 결과를 저장해 반환 (동시 미스는 한 번만 계산)."""
+        entry = self.get(key)
+        if entry is not None:
+            return entry
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                self._stats["coalesced"] += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.entry  # type: ignore[return-value]
+        try:
+            flight.entry = self.put_entry(key, compute())
+            return flight.entry
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    # -- 삭제 -----------------------------------------------------------------
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._data:
+                return False
+            self._drop(key)
+            return True
+
+    def invalidate(self, prefix: str = "") -> int:
+        """``prefix`` 로 시작하는 키 삭제 (빈 문자열이면 전체)."""
+        with self._lock:
+            keys = [k for k in self._data if k.startswith(prefix)]
+            for k in keys:
+                self._drop(k)
+            return len(keys)
+
+    def clear_expired(self) -> int:
+        now = self._clock()
+        with self._lock:
+            keys = [k for k, e in self._data.items() if self._expired(e, now)]
+            for k in keys:
+                self._drop(k)
+            self._stats["expirations"] += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                **self._stats,
+                "hit_rate_pct": round(self._stats["hits"] / lookups * 100, 2) if lookups else 0.0,
+            }
+
+    # -- 내부 -----------------------------------------------------------------
+    @staticmethod
+    def _expired(entry: CacheEntry, now: float) -> bool:
+        return bool(entry.expires_at) and entry.expires_at <= now
+
+    def _drop(self, key: str) -> None:
+        # 호출자가 self._lock 보유
+        entry = self._data.pop(key)
+        self._bytes -= entry.size
+
+
+class _Sweeper:
+    """모든 BoundedCache 의 만료 엔트리를 주기적으로 정리하는 데몬 스레드 하나 (캐시는 약참조)."""
+
+    def __init__(self) -> None:
+        # cache -> (다음 정리 시각(monotonic), 주기)
+        self._caches: "weakref.WeakKeyDictionary[BoundedCache, Tuple[float, float]]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+
+    def register(self, cache: BoundedCache, interval_s: float) -> None:
+        with self._lock:
+            self._caches[cache] = (time.monotonic() + interval_s, interval_s)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ops-cache-sweeper", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            # 한 바퀴는 별도 프레임에서 돌림 → 잠드는 동안 캐시 강참조(items, 루프 변수)가 남지 않음
+            next_due = self._sweep_due()
+            self._wake.wait(None if next_due == math.inf else max(0.05, next_due - time.monotonic()))
+
+    def _sweep_due(self) -> float:
+        """정리 시각이 된 캐시를 비우고 다음 정리 시각을 반환."""
+        with self._lock:
+            items = list(self._caches.items())
+        now = time.monotonic()
+        next_due = math.inf
+        for cache, (due, interval) in items:
+            if due <= now:
+                try:
+                    cache.clear_expired()
+                except Exception:
+                    pass
+                due = now + interval
+                with self._lock:
+                    if cache in self._caches:
+                        self._caches[cache] = (due, interval)
+            next_due = min(next_due, due)
+        return next_due
+
+
+_SWEEPER = _Sweeper()
+
+
+def env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+__all__ = ["BoundedCache", "CacheEntry", "encode_html", "encode_json", "env_int"]
@@ -1,71 +1,96 @@
 from __future__ import annotations
 
-import json
 import os
 import time
-from typing import Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-try:
-    import redis  # type: ignore
-except Exception:  # pragma: no cover
-    redis = None
+# v0.5.11u-7: Compression support (코덱/임계값은 네임스페이스 "snapshot" 정책)
+from apps.common.compress import CompressionPolicy, policy_for
 
-# v0.5.11u-7: Compression support
-from apps.common.compress import should_compress, gzip_bytes, gunzip_bytes
+from .lru import env_int
+from .tiered import TieredCache, redis_from_env
 
 _SNAPSHOT_COMPRESS = os.getenv("DECISIONOS_SNAPSHOT_COMPRESS", "1") in ("1", "true", "yes")
 
 
+def _policy() -> CompressionPolicy:
+    return policy_for("snapshot") if _SNAPSHOT_COMPRESS else CompressionPolicy(codec="none")
+
+
+def _l1_only_bounds() -> Dict[str, int]:
+    """Redis 없이 L1 이 곧 저장소일 때의 상한 (L1 캐시 기본값이 아닌 스냅샷 설정)."""
+    return {
+        "l1_max_entries": env_int("DECISIONOS_SNAPSHOT_MAX_ENTRIES", 4096),
+        "l1_max_bytes": env_int("DECISIONOS_SNAPSHOT_MAX_BYTES", 64 * 1024 * 1024),
+    }
+
+
 class SnapshotStore:
-    def __init__(self):
+    """
+    카드 응답 스냅샷 (key → (body, ts)).
+
+    DECISIONOS_REDIS_DSN 이 있으면 L1(프로세스) + L2(Redis) 2단, 없으면 L1 만 사용
+    (이때 상한은 DECISIONOS_SNAPSHOT_MAX_ENTRIES / DECISIONOS_SNAPSHOT_MAX_BYTES).
+    Redis 값 형식은 기존과 같음: ``{"body": ..., "ts": ...}`` JSON (임계값 이상이면 gzip).
+    """
+
+    def __init__(self, redis: Any = None):
         self._ttl = int(os.getenv("DECISIONOS_SNAPSHOT_TTL", "600"))
-        dsn = os.getenv("DECISIONOS_REDIS_DSN", "")
-        self._r = redis.Redis.from_url(dsn) if (dsn and redis) else None
-        self._mem = {}
+        self._r = redis if redis is not None else redis_from_env()
+        bounds = _l1_only_bounds() if self._r is None else {}
+        self._cache = TieredCache("snapshot", self._r, default_ttl=self._ttl, policy=_policy(), **bounds)
 
     def get(self, key: str) -> Optional[Tuple[str, float]]:
-        if self._r:
-            v = self._r.get(key)
-            if not v:
-                return None
-            try:
-                # v0.5.11u-7: Auto-decompress if compressed
-                if isinstance(v, bytes) and _SNAPSHOT_COMPRESS:
-                    try:
-                        v = gunzip_bytes(v).decode("utf-8")
-                    except Exception:
-                        # Not compressed or decompression failed, treat as JSON string
-                        if isinstance(v, bytes):
-                            v = v.decode("utf-8")
-
-                obj = json.loads(v)
-                return obj.get("body"), float(obj.get("ts", 0))
-            except Exception:
-                return None
-        row = self._mem.get(key)
-        if not row:
+        row = self._cache.get(key)
+        if not isinstance(row, dict):
             return None
-        body, ts = row
-        if time.time() - ts > self._ttl:
-            self._mem.pop(key, None)
-            return None
-        return body, ts
+        return row.get("body"), float(row.get("ts", 0))
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Tuple[str, float]]:
+        """여러 스냅샷을 한 번에 (L1 미스분은 MGET 한 번)."""
+        return {k: (row.get("body"), float(row.get("ts", 0))) for k, row in self._cache.get_many(keys).items() if isinstance(row, dict)}
 
     def set(self, key: str, body: str):
-        ts = time.time()
-        payload = json.dumps({"body": body, "ts": ts})
-
-        if self._r:
-            # v0.5.11u-7: Compress before storing in Redis
-            if _SNAPSHOT_COMPRESS and should_compress(len(payload)):
-                payload_bytes = gzip_bytes(payload.encode("utf-8"))
-            else:
-                payload_bytes = payload.encode("utf-8")
-            self._r.setex(key, self._ttl, payload_bytes)
-        else:
-            self._mem[key] = (body, ts)
+        self._cache.set(key, {"body": body, "ts": time.time()})
 
     def delete(self, key: str):
-        if self._r:
-            self._r.delete(key)
-        self._mem.pop(key, None)
+        self._cache.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+
+class AsyncSnapshotStore:
+    """ETag → 스냅샷 dict (델타 계산용, async 인터페이스)."""
+
+    def __init__(self, cache: TieredCache):
+        self._cache = cache
+
+    async def get(self, etag: str) -> Optional[dict]:
+        return self._cache.get(etag)
+
+    async def get_many(self, etags: Iterable[str]) -> Dict[str, dict]:
+        return self._cache.get_many(etags)
+
+    async def set(self, etag: str, payload: dict, ttl_sec: Optional[int] = None) -> None:
+        self._cache.set(etag, payload, ttl_sec)
+
+    async def delete(self, etag: str) -> None:
+        self._cache.delete(etag)
+
+
+class InMemorySnapshotStore(AsyncSnapshotStore):
+    def __init__(self, ttl_sec: Optional[int] = None):
+        ttl = ttl_sec or int(os.getenv("DECISIONOS_SNAPSHOT_TTL", "600"))
+        super().__init__(TieredCache("snapshot", None, default_ttl=ttl, policy=_policy(), **_l1_only_bounds()))
+
+
+class RedisSnapshotStore(AsyncSnapshotStore):
+    def __init__(self, redis: Any, ttl_sec: Optional[int] = None):
+        ttl = ttl_sec or int(os.getenv("DECISIONOS_SNAPSHOT_TTL", "600"))
+        super().__init__(TieredCache("snapshot", redis, key_prefix="dos:snap:", default_ttl=ttl, policy=_policy()))
+
+
+def build_snapshot_store() -> AsyncSnapshotStore:
+    r = redis_from_env()
+    return RedisSnapshotStore(r) if r is not None else InMemorySnapshotStore()
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import threading
+import uuid
+import weakref
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from apps.common.compress import CompressionPolicy, policy_for
+
+from .lru import BoundedCache, env_int
+
+log = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "dos:cache:inval:"
+
+
+class TieredCache:
+    """
+    L1(프로세스 내 BoundedCache, 짧은 TTL) + L2(Redis) 2단 캐시.
+
+    - 읽기: L1 → L2. L2 히트는 디코드(gunzip + JSON)해서 L1 에 채움 → 반복 조회는 네트워크/디코드 없음
+    - 다중 키: ``get_many``/``set_many`` 는 MGET / 파이프라인 한 번으로 처리
+    - 쓰기/삭제: L2 반영 후 ``dos:cache:inval:<namespace>`` 채널로 무효화 발행 → 다른 워커의 L1 에서 제거
+      (pub/sub 을 못 쓰는 클라이언트면 L1 TTL 만큼만 stale 허용)
+    - 압축 코덱/임계값은 네임스페이스별 (``apps.common.compress.policy_for``)
+    - ``redis=None`` 이면 L1 만 쓰는 인메모리 모드 (L1 TTL = 값 TTL, L1 max_bytes 를 넘는 값은 저장 안 됨 → 경고 로그)
+    - L1 에 못 넣은 큰 값은 ``stats()["l1_oversize"]`` 로 집계
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        redis: Any = None,
+        key_prefix: str = "",
+        default_ttl: Optional[int] = 300,
+        l1_ttl: Optional[float] = None,
+        l1_max_entries: Optional[int] = None,
+        l1_max_bytes: Optional[int] = None,
+        policy: Optional[CompressionPolicy] = None,
+        serializer: str = "json",
+        sort_keys: bool = False,
+    ) -> None:
+        self.namespace = namespace
+        self.key_prefix = key_prefix
+        self.default_ttl = default_ttl
+        self.l1_ttl = float(l1_ttl if l1_ttl is not None else env_int("DECISIONOS_CACHE_L1_TTL_SEC", 5))
+        self.policy = policy or policy_for(namespace)
+        self.serializer = serializer
+        self.sort_keys = sort_keys
+        self._r = redis
+        self._l1 = BoundedCache(
+            max_entries=l1_max_entries or env_int("DECISIONOS_CACHE_L1_MAX_ENTRIES", 1024),
+            max_bytes=l1_max_bytes or env_int("DECISIONOS_CACHE_L1_MAX_BYTES", 16 * 1024 * 1024),
+        )
+        self.channel = CHANNEL_PREFIX + namespace + (":" + key_prefix if key_prefix else "")
+        self._origin = uuid.uuid4().hex
+        self._closed = threading.Event()
+        self._stats = {
+            "l2_hits": 0, "l2_misses": 0, "l2_errors": 0, "mget": 0, "published": 0, "invalidations": 0, "l1_oversize": 0
+        }
+        self._listener: Optional[threading.Thread] = None
+        if redis is not None and hasattr(redis, "pubsub"):
+            self._start_listener()
+
+    # -- 인코딩 ---------------------------------------------------------------
+    def _encode(self, value: Any) -> bytes:
+        if self.serializer == "text":
+            raw = value.encode("utf-8") if isinstance(value, str) else bytes(value)
+        else:
+            raw = json.dumps(value, separators=(",", ":"), ensure_ascii=False, sort_keys=self.sort_keys).encode("utf-8")
+        return self.policy.encode(raw)
+
+    def _decode(self, blob: Any) -> Any:
+        if isinstance(blob, str):  # decode_responses=True 클라이언트 / 압축 안 된 기존 값
+            blob = blob.encode("utf-8")
+        raw = self.policy.decode(blob)
+        return raw.decode("utf-8") if self.serializer == "text" else json.loads(raw)
+
+    def _l1_ttl(self, ttl: Optional[float]) -> float:
+        if self._r is None:
+            return ttl if ttl else math.inf
+        return min(self.l1_ttl, ttl) if ttl else self.l1_ttl
+
+    def _l1_put(self, key: str, value: Any, ttl: float, size: int) -> None:
+        if size > self._l1.max_bytes:  # BoundedCache 는 말없이 버리므로 여기서 집계
+            self._stats["l1_oversize"] += 1
+            if self._r is None:
+                log.warning(
+                    "tiered cache %s: %d-byte value for %r exceeds L1 max_bytes %d, not stored",
+                    self.namespace, size, key, self._l1.max_bytes,
+                )
+            return
+        self._l1.put(key, value, ttl, size=size)
+
+    # -- 읽기 -----------------------------------------------------------------
+    def get(self, key: str) -> Any:
+        entry = self._l1.get(key)
+        if entry is not None:
+            return entry.payload
+        if self._r is None:
+            return None
+        try:
+            blob = self._r.get(self.key_prefix + key)
+        except Exception as exc:
+            self._stats["l2_errors"] += 1
+            log.warning("tiered cache %s: L2 get failed: %s", self.namespace, exc)
+            return None
+        return self._fill(key, blob)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """찾은 키만 담은 dict. L1 에 없는 키는 MGET 한 번으로 조회."""
+        out: Dict[str, Any] = {}
+        missing: List[str] = []
+        for key in keys:
+            entry = self._l1.get(key)
+            if entry is not None:
+                out[key] = entry.payload
+            else:
+                missing.append(key)
+        if not missing or self._r is None:
+            return out
+        try:
+            blobs = self._mget([self.key_prefix + k for k in missing])
+        except Exception as exc:
+            self._stats["l2_errors"] += 1
+            log.warning("tiered cache %s: L2 mget failed: %s", self.namespace, exc)
+            return out
+        self._stats["mget"] += 1
+        for key, blob in zip(missing, blobs):
+            value = self._fill(key, blob)
+            if value is not None:
+                out[key] = value
+        return out
+
+    def _mget(self, l2_keys: List[str]) -> List[Any]:
+        if hasattr(self._r, "mget"):
+            return list(self._r.mget(l2_keys))
+        pipe = self._r.pipeline()
+        for k in l2_keys:
+            pipe.get(k)
+        return pipe.execute()
+
+    def _fill(self, key: str, blob: Any) -> Any:
+        if blob is None:
+            self._stats["l2_misses"] += 1
+            return None
+        try:
+            value = self._decode(blob)
+        except Exception:
+            self._stats["l2_errors"] += 1
+            return None
+        self._stats["l2_hits"] += 1
+        self._l1_put(key, value, self._l1_ttl(self.l1_ttl), len(blob))
+        return value
+
+    # -- 쓰기 -----------------------------------------------------------------
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[int] = None) -> None:
+        """L2 에는 파이프라인 한 번, 무효화 메시지도 한 번."""
+        ttl = self.default_ttl if ttl is None else ttl
+        encoded = {k: self._encode(v) for k, v in items.items()}
+        if self._r is not None:
+            pipe = self._r.pipeline()
+            for k, blob in encoded.items():
+                if ttl:
+                    pipe.setex(self.key_prefix + k, int(math.ceil(ttl)), blob)
+                else:
+                    pipe.set(self.key_prefix + k, blob)
+            pipe.execute()
+            self._publish(list(encoded))
+        for k, v in items.items():
+            self._l1_put(k, v, self._l1_ttl(ttl), len(encoded[k]))
+
+    def delete(self, *keys: str) -> int:
+        removed = sum(1 for k in keys if self._l1.delete(k))
+        if self._r is not None and keys:
+            removed = int(self._r.delete(*[self.key_prefix + k for k in keys]) or 0)
+            self._publish(list(keys))
+        return removed
+
+    def evict(self, *keys: str) -> None:
+        """L2 는 그대로 두고 모든 워커의 L1 에서 제거 (L2 를 WATCH/Lua 등으로 직접 갱신한 뒤 호출)."""
+        self.invalidate_local(keys)
+        if self._r is not None and keys:
+            self._publish(list(keys))
+
+    def invalidate_local(self, keys: Optional[Iterable[str]] = None) -> None:
+        """이 프로세스의 L1 에서만 제거 (None 이면 전체)."""
+        if keys is None:
+            self._l1.clear()
+            return
+        for k in keys:
+            self._l1.delete(k)
+
+    # -- 무효화 채널 ----------------------------------------------------------
+    def _publish(self, keys: List[str]) -> None:
+        if not hasattr(self._r, "publish"):
+            return
+        try:
+            self._r.publish(self.channel, json.dumps({"o": self._origin, "k": keys}))
+            self._stats["published"] += 1
+        except Exception as exc:
+            log.warning("tiered cache %s: publish failed: %s", self.namespace, exc)
+
+    def _start_listener(self) -> None:
+        try:
+            ps = self._r.pubsub(ignore_subscribe_messages=True)
+            ps.subscribe(self.channel)
+        except Exception as exc:
+            log.warning("tiered cache %s: pub/sub unavailable, relying on L1 TTL: %s", self.namespace, exc)
+            return
+        self._listener = threading.Thread(
+            target=_listen, args=(weakref.ref(self), ps, self._closed), name=f"cache-inval-{self.namespace}", daemon=True
+        )
+        self._listener.start()
+
+    def _on_message(self, data: Any) -> None:
+        try:
+            msg = json.loads(data)
+        except Exception:
+            return
+        if msg.get("o") == self._origin:
+            return
+        self.invalidate_local(msg.get("k"))
+        self._stats["invalidations"] += 1
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._listener is not None and self._listener is not threading.current_thread():
+            self._listener.join(timeout=2)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"namespace": self.namespace, "l1": self._l1.stats(), **self._stats}
+
+
+def _listen(ref: "weakref.ref[TieredCache]", ps: Any, closed: threading.Event) -> None:
+    # 캐시를 약참조로만 잡아 GC 를 막지 않음; 캐시가 사라지거나 close() 되면 종료
+    try:
+        while not closed.is_set() and ref() is not None:
+            msg = ps.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            if not msg or msg.get("type") != "message":
+                continue
+            cache = ref()
+            if cache is None:
+                return
+            cache._on_message(msg["data"])
+            del cache
+    except Exception as exc:  # 연결 끊김 등: L1 TTL 로 일관성 유지
+        log.warning("cache invalidation listener stopped: %s", exc)
+    finally:
+        try:
+            ps.close()
+        except Exception:
+            pass
+
+
+def redis_from_env(dsn_env: str = "DECISIONOS_REDIS_DSN") -> Any:
+    """바이너리 안전(decode_responses=False) Redis 클라이언트; DSN 이 없거나 redis-py 가 없으면 None."""
+    dsn = os.getenv(dsn_env, "").strip()
+    if not dsn:
+        return None
+    try:
+        import redis  # type: ignore
+
+        return redis.Redis.from_url(dsn)
+    except Exception:
+        return None
+
+
+__all__ = ["TieredCache", "redis_from_env"]
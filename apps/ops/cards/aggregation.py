@@ -1,7 +1,9 @@
 from __future__ import annotations
-import json, os, hashlib, base64
-from collections import Counter, defaultdict
-from typing import Dict, Any, List, Tuple, Optional
+import json, os, hashlib, base64, threading
+from collections import Counter
+from typing import Callable, Dict, Any, List, Tuple, Optional
+
+from .reason_matcher import ReasonGroupMatcher
 
 CAT_PATH = os.environ.get("LABEL_CATALOG_PATH", "configs/ops/label_catalog.json")
 GROUP_PATH = os.environ.get("REASON_GROUPS_PATH", "configs/ops/reason_groups.json")
@@ -10,33 +12,76 @@ def _load(path: str) -> Dict[str, Any]:
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
-def label_catalog_hash() -> str:
-    cat = _load(CAT_PATH)
+
+class _ConfigSnapshot:
+    """설정 파일 한 개의 파싱 결과 + 파생값(해시·팔레트·매처 등) 캐시. (inode, 크기, mtime) 이 바뀌면 다시 읽음."""
+
+    __slots__ = ("stamp", "data", "derived")
+
+    def __init__(self, stamp: Tuple[int, int, int], data: Dict[str, Any]) -> None:
+        self.stamp = stamp
+        self.data = data
+        self.derived: Dict[str, Any] = {}
+
+    def get(self, name: str, build: Callable[[Dict[str, Any]], Any]) -> Any:
+        if name not in self.derived:
+            self.derived[name] = build(self.data)
+        return self.derived[name]
+
+
+_SNAPSHOTS: Dict[str, _ConfigSnapshot] = {}
+_SNAPSHOTS_LOCK = threading.Lock()
+
+def _snapshot(path: str) -> _ConfigSnapshot:
+    st = os.stat(path)  # 없으면 FileNotFoundError (기존 _load 와 동일)
+    stamp = (st.st_ino, st.st_size, st.st_mtime_ns)
+    with _SNAPSHOTS_LOCK:
+        snap = _SNAPSHOTS.get(path)
+    if snap is not None and snap.stamp == stamp:
+        return snap
+    snap = _ConfigSnapshot(stamp, _load(path))
+    with _SNAPSHOTS_LOCK:
+        _SNAPSHOTS[path] = snap
+    return snap
+
+def _catalog_sha(cat: Dict[str, Any]) -> str:
     return hashlib.sha256(json.dumps(cat, sort_keys=True).encode()).hexdigest()
 
-def palette_with_desc() -> Dict[str, Dict[str,str]]:
-    cat = _load(CAT_PATH)
+def _palette(cat: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
     out = {}
     for x in cat.get("labels", []):
         if x["name"].startswith("reason:"):
             out[x["name"]] = {"color": x.get("color"), "description": x.get("description","")}
     return out
 
+def _weights(groups: Dict[str, Any]) -> Dict[str, float]:
+    return {k: float(v) for k, v in groups.get("weights", {}).items()}
+
+def _compile(groups: Dict[str, Any]) -> ReasonGroupMatcher:
+    return ReasonGroupMatcher(groups.get("groups", []))
+
+def label_catalog_hash() -> str:
+    return _snapshot(CAT_PATH).get("sha", _catalog_sha)
+
+def palette_with_desc() -> Dict[str, Dict[str,str]]:
+    pal = _snapshot(CAT_PATH).get("palette", _palette)
+    return {k: dict(v) for k, v in pal.items()}  # 호출자가 고쳐도 캐시는 그대로
+
 def _group_weights() -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
-    groups = _load(GROUP_PATH)
-    weights = {k: float(v) for k, v in groups.get("weights", {}).items()}
-    return groups.get("groups", []), weights
+    snap = _snapshot(GROUP_PATH)
+    return snap.data.get("groups", []), dict(snap.get("weights", _weights))
+
+def reason_group_matcher() -> ReasonGroupMatcher:
+    """현재 reason_groups.json 리비전으로 컴파일된 매처 (파일이 바뀔 때만 다시 컴파일)."""
+    return _snapshot(GROUP_PATH).get("matcher", _compile)
 
 def aggregate_reasons(reasons: List[str], top: int = 5) -> Dict[str, Any]:
-    groups_cfg, weights = _group_weights()
+    snap = _snapshot(GROUP_PATH)
+    weights = dict(snap.get("weights", _weights))
+    matcher = snap.get("matcher", _compile)
     hits = Counter(reasons)
-    # 그룹 카운트
-    grp_counts = defaultdict(int)
-    for g in groups_cfg:
-        gname = g["name"]
-        match = set(g["match"])
-        cnt = sum(hits[r] for r in hits if r in match or any(r.startswith(m.rstrip("*")) for m in match))
-        grp_counts[gname] += cnt
+    # 그룹 카운트: reason 별로 매처를 한 번씩만 조회
+    grp_counts = matcher.count(hits)
     # 가중치 점수
     weighted = {g: grp_counts[g] * float(weights.get(g, 1.0)) for g in grp_counts}
     # Top N
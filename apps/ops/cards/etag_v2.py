@@ -15,7 +15,8 @@ def build_cards_etag_key(
     label_catalog_path: Optional[str] = None,
     group_weights_path: Optional[str] = None,
     seasonal_thresholds_path: Optional[str] = None,
-    data_revision_token: Optional[str] = None
+    data_revision_token: Optional[str] = None,
+    events_revision: Optional[str] = None
 ) -> Dict[str, Any]:
     # 파일 경로 기본값(존재하지 않으면 None)
     label_catalog_path = label_catalog_path or _env("LABEL_CATALOG_PATH", "configs/ops/label_catalog.json")
@@ -34,6 +35,8 @@ def build_cards_etag_key(
             "group_weights": sha256_file(group_weights_path),
             "seasonal_thresholds": sha256_file(seasonal_thresholds_path),
             "data_revision": data_revision_token or _env("CARDS_DATA_REV", ""),
+            # 이벤트 저장소 high-watermark(events.reason_events_revision): 이벤트를 읽지 않고도 데이터 변경 반영
+            "events": events_revision or "",
         },
     }
 
@@ -1,9 +1,13 @@
 from __future__ import annotations
-import os, json
-from typing import Iterable, Dict, Any, List
+import os, json, hashlib, sqlite3, threading
+from typing import Iterable, Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 
 EV_PATH = os.environ.get("REASON_EVENTS_PATH", "var/evidence/reasons.jsonl")
+INDEX_SUFFIX = ".idx.sqlite"
+
+_FP_HEAD = 4096  # 재작성 감지용: 파일 앞부분 지문
+_FP_TAIL = 64    # 재작성 감지용: 마지막 인덱싱 오프셋 직전 바이트 지문
 
 def _parse_ts(s: str) -> datetime:
     # ISO8601 지원(Z 포함). tz 미지정 시 UTC 가정.
@@ -16,10 +20,176 @@ def _parse_ts(s: str) -> datetime:
         dt = datetime.fromisoformat(s.split(".")[0])
         return dt.replace(tzinfo=timezone.utc)
 
-def load_reason_events(start: datetime, end: datetime, path: str = EV_PATH) -> List[str]:
-    reasons: List[str] = []
+def _epoch(dt: datetime) -> float:
+    return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+
+def _parse_line(raw: bytes) -> Optional[Tuple[float, str, str]]:
+    """JSONL 한 줄 → (epoch, ts 원문, reason). 빈 줄/깨진 줄은 None."""
+    if not raw.strip():
+        return None
+    try:
+        obj = json.loads(raw)
+        ts_raw, reason = obj["ts"], obj["reason"]
+        return _epoch(_parse_ts(ts_raw)), ts_raw, reason
+    except Exception:
+        return None
+
+def _index_enabled() -> bool:
+    return os.environ.get("DECISIONOS_REASON_INDEX", "1") != "0"
+
+
+class ReasonEventIndex:
+    """
+    reasons.jsonl 의 ts 인덱스 사이드카(``<path>.idx.sqlite``).
+
+    - JSONL 은 그대로 원본(append-only)으로 두고, 개행으로 끝난 줄만
+      ``events(ts REAL, ts_raw, reason)`` 테이블에 ts 인덱스와 함께 적재
+    - ``meta`` 에 인덱싱된 바이트 오프셋과 inode/지문을 저장해 조회 시
+      새로 추가된 꼬리만 증분 적재 (파일 교체·재작성 감지 시 재구축)
+    - 조회는 ``ts`` 범위 인덱스 스캔이므로 비용이 파일 전체 크기가 아니라 윈도 크기에 비례
+    """
+
+    def __init__(self, path: str, index_path: Optional[str] = None) -> None:
+        self.path = path
+        self.index_path = index_path or path + INDEX_SUFFIX
+        self._lock = threading.Lock()
+        self._stat_key: Optional[Tuple[int, int, int]] = None
+        self._pending = b""
+        self._conn = sqlite3.connect(self.index_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS events(
+              ts REAL NOT NULL,
+              ts_raw TEXT NOT NULL,
+              reason TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts);
+            CREATE TABLE IF NOT EXISTS meta(
+              k TEXT PRIMARY KEY,
+              v TEXT NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+    # -- 증분 적재 -------------------------------------------------------
+    def _meta(self) -> Dict[str, str]:
+        return dict(self._conn.execute("SELECT k, v FROM meta").fetchall())
+
+    @staticmethod
+    def _fingerprint(f, offset: int) -> Tuple[str, str]:
+        f.seek(0)
+        head = hashlib.sha1(f.read(min(offset, _FP_HEAD))).hexdigest()
+        f.seek(max(0, offset - _FP_TAIL))
+        tail = hashlib.sha1(f.read(min(offset, _FP_TAIL))).hexdigest()
+        return head, tail
+
+    def refresh(self, rebuild: bool = False) -> bytes:
+        """JSONL 의 새 줄을 인덱스에 반영. 개행 없는 마지막 조각(기록 중일 수 있음)을 반환."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            with self._lock:
+                self._conn.execute("DELETE FROM events")
+                self._conn.execute("DELETE FROM meta")
+                self._conn.commit()
+                self._stat_key = None
+            return b""
+        stat_key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        with self._lock:
+            if not rebuild and stat_key == self._stat_key:
+                return self._pending
+            with open(self.path, "rb") as f:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    pending = self._ingest(f, st, rebuild)
+                    self._conn.commit()
+                except BaseException:
+                    self._conn.rollback()
+                    raise
+            self._stat_key = stat_key
+            self._pending = pending
+            return pending
+
+    def _ingest(self, f, st: os.stat_result, rebuild: bool) -> bytes:
+        meta = self._meta()
+        offset = int(meta.get("offset", 0))
+        valid = (
+            not rebuild
+            and meta.get("inode") == str(st.st_ino)
+            and offset <= st.st_size
+            and (meta.get("head"), meta.get("tail")) == self._fingerprint(f, offset)
+        )
+        if not valid:
+            self._conn.execute("DELETE FROM events")
+            offset = 0
+
+        f.seek(offset)
+        rows: List[Tuple[float, str, str]] = []
+        pending = b""
+        for line in f:
+            if not line.endswith(b"\n"):
+                pending = line
+                break
+            offset += len(line)
+            row = _parse_line(line)
+            if row is not None:
+                rows.append(row)
+            if len(rows) >= 5000:
+                self._conn.executemany("INSERT INTO events(ts, ts_raw, reason) VALUES (?,?,?)", rows)
+                rows.clear()
+        if rows:
+            self._conn.executemany("INSERT INTO events(ts, ts_raw, reason) VALUES (?,?,?)", rows)
+
+        head, tail = self._fingerprint(f, offset)
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta(k, v) VALUES (?, ?)",
+            [("inode", str(st.st_ino)), ("offset", str(offset)), ("head", head), ("tail", tail)],
+        )
+        return pending
+
+    # -- 조회 ------------------------------------------------------------
+    def query(self, start: datetime, end: datetime) -> List[Tuple[str, str]]:
+        """[start, end) 구간의 (ts 원문, reason) 목록 (파일 순서)."""
+        pending = self.refresh()
+        lo, hi = _epoch(start), _epoch(end)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT ts_raw, reason FROM events WHERE ts >= ? AND ts < ? ORDER BY rowid",
+                (lo, hi),
+            ).fetchall()
+        tail = _parse_line(pending) if pending else None
+        if tail is not None and lo <= tail[0] < hi:
+            rows.append((tail[1], tail[2]))
+        return rows
+
+    def count(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0])
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+
+_INDEXES: Dict[str, ReasonEventIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+def get_reason_index(path: str = EV_PATH) -> ReasonEventIndex:
+    key = os.path.abspath(path)
+    with _INDEXES_LOCK:
+        idx = _INDEXES.get(key)
+        if idx is None:
+            idx = _INDEXES[key] = ReasonEventIndex(path)
+        return idx
+
+def _scan(start: datetime, end: datetime, path: str) -> List[Tuple[str, str]]:
+    rows: List[Tuple[str, str]] = []
     if not os.path.exists(path):
-        return reasons
+        return rows
     with open(path, "r", encoding="utf-8") as f:
         for line in f:
             if not line.strip():
@@ -27,5 +197,57 @@ def load_reason_events(start: datetime, end: datetime, path: str = EV_PATH) -> L
             obj = json.loads(line)
             ts = _parse_ts(obj["ts"])
             if ts >= start and ts < end:
-                reasons.append(obj["reason"])
-    return reasons
+                rows.append((obj["ts"], obj["reason"]))
+    return rows
+
+def _query(start: datetime, end: datetime, path: str) -> List[Tuple[str, str]]:
+    if _index_enabled() and os.path.exists(path):
+        try:
+            return get_reason_index(path).query(start, end)
+        except (OSError, sqlite3.Error):
+            pass  # 사이드카를 만들 수 없는 경로(읽기 전용 등) → 전체 스캔
+    return _scan(start, end, path)
+
+def reason_events_revision(path: str = EV_PATH) -> str:
+    """이벤트 저장소 리비전(high-watermark): inode·크기·mtime 만 보고 이벤트 내용은 읽지 않음.
+
+    append-only 파일이라 새 이벤트가 붙거나 파일이 교체되면 값이 바뀜 → ETag 키 입력용.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return "absent"
+    return f"{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+def load_reason_pairs(start: datetime, end: datetime, path: str = EV_PATH) -> List[Tuple[str, str]]:
+    """[start, end) 구간의 (ts 원문, reason) 목록 — 합계와 버킷 집계를 한 번의 조회로 처리할 때 사용."""
+    return _query(start, end, path)
+
+def load_reason_events(start: datetime, end: datetime, path: str = EV_PATH) -> List[str]:
+    return [reason for _, reason in _query(start, end, path)]
+
+def load_reason_rows(start: datetime, end: datetime, path: str = EV_PATH) -> List[Dict[str, Any]]:
+    """버킷 집계용 ``{"ts", "reason"}`` 행 (ts 는 원문 문자열)."""
+    return [{"ts": ts_raw, "reason": reason} for ts_raw, reason in _query(start, end, path) if ts_raw and reason]
+
+def append_reason_event(reason: str, ts: Optional[str] = None, path: str = EV_PATH, **fields: Any) -> Dict[str, Any]:
+    """JSONL 에 이벤트 한 줄을 추가하고 인덱스를 갱신."""
+    ts = ts or datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    rec: Dict[str, Any] = {"ts": ts, "reason": reason, **fields}
+    d = os.path.dirname(path)
+    if d:
+        os.makedirs(d, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    if _index_enabled():
+        try:
+            get_reason_index(path).refresh()
+        except (OSError, sqlite3.Error):
+            pass
+    return rec
+
+def build_reason_index(path: str = EV_PATH, rebuild: bool = False) -> int:
+    """기존 JSONL 을 인덱스로 변환(마이그레이션). 인덱싱된 이벤트 수 반환."""
+    idx = get_reason_index(path)
+    idx.refresh(rebuild=rebuild)
+    return idx.count()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Tuple
+
+# reason_groups.json 의 match 패턴 의미(기존 aggregate_reasons 와 동일):
+#   패턴 끝의 '*' 를 떼어낸 문자열이 reason 의 접두사이면 매치.
+#   '*' 가 없는 패턴도 같은 규칙(완전 일치 ⊂ 접두사 일치)이고, "*" 만 있으면 모든 reason 에 매치.
+
+
+class _Node:
+    __slots__ = ("children", "entries")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node"] = {}
+        self.entries: List[int] = []  # 이 노드에서 끝나는 패턴을 가진 그룹 항목 인덱스
+
+
+class ReasonGroupMatcher:
+    """
+    그룹 설정을 한 번 컴파일한 reason → 그룹 매처.
+
+    - 모든 패턴을 접두사 트라이에 넣고, reason 을 한 글자씩 따라가며 지나는 노드의 그룹을 모음
+      → 비용이 그룹·패턴 수가 아니라 ``len(reason)`` 에 비례
+    - 이미 본 reason 은 완전 일치 dict(``_resolved``)에서 바로 반환
+    - 설정에 같은 이름의 그룹 항목이 여러 개면 항목마다 따로 집계(기존 동작)
+    """
+
+    _RESOLVED_MAX = 65536
+
+    def __init__(self, groups_cfg: List[Dict[str, Any]]) -> None:
+        self.names: List[str] = [g["name"] for g in groups_cfg]
+        self._root = _Node()
+        for i, g in enumerate(groups_cfg):
+            for pattern in g.get("match", []):
+                node = self._root
+                for ch in pattern.rstrip("*"):
+                    node = node.children.setdefault(ch, _Node())
+                if i not in node.entries:
+                    node.entries.append(i)
+        self._resolved: Dict[str, Tuple[int, ...]] = {}
+
+    def entries_for(self, reason: str) -> Tuple[int, ...]:
+        """reason 에 매치되는 그룹 항목 인덱스(설정 순서, 중복 없음)."""
+        hit = self._resolved.get(reason)
+        if hit is not None:
+            return hit
+        node = self._root
+        found = set(node.entries)
+        for ch in reason:
+            node = node.children.get(ch)
+            if node is None:
+                break
+            found.update(node.entries)
+        out = tuple(sorted(found))
+        if len(self._resolved) >= self._RESOLVED_MAX:
+            self._resolved.clear()
+        self._resolved[reason] = out
+        return out
+
+    def groups_for(self, reason: str) -> List[str]:
+        return [self.names[i] for i in self.entries_for(reason)]
+
+    def count(self, hits: Dict[str, int]) -> Dict[str, int]:
+        """reason 별 건수 → 그룹별 합계. 매치가 없는 그룹도 0 으로 포함(설정 순서)."""
+        out: Dict[str, int] = {name: 0 for name in self.names}
+        for reason, n in hits.items():
+            for i in self.entries_for(reason):
+                out[self.names[i]] += n
+        return out
@@ -7,6 +7,8 @@ from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+from apps.obs.evidence.reason_summary import load_summary, summary_signature
+
 
 def _collect_paths_and_meta(root: Path) -> Tuple[List[str], str | None, str]:
     if not root.exists():
@@ -88,26 +90,55 @@ def _extract_timestamp(evidence_obj: Dict[str, Any]) -> dt.datetime | None:
 
 
 def get_index_signature(evidence_dir: str = "var/evidence") -> Tuple[str, str | None]:
+    # 인덱서가 관리하는 요약 사이드카가 유효하면 리비전 카운터만 사용 (index.json 재해시 없음)
+    summary = load_summary(Path(evidence_dir) / "index.json")
+    if summary is not None:
+        return summary_signature(summary), summary.get("last_updated")
     _, last_updated, signature = _collect_paths_and_meta(Path(evidence_dir))
     return signature, last_updated
 
 
+def _daily_from_summary(summary: Dict[str, Any], cutoff: dt.datetime) -> Dict[str, Counter]:
+    """일별 카운터 병합: 윈도 안에 통째로 들어오는 날은 일 집계를, 경계 날만 파일별 행을 사용."""
+    cutoff_ts = cutoff.timestamp()
+    daily: Dict[str, Counter] = defaultdict(Counter)
+    partial = set()
+    for day, agg in (summary.get("by_day") or {}).items():
+        if agg["min_ts"] >= cutoff_ts:
+            if agg["codes"]:
+                daily[day].update(agg["codes"])
+        elif agg["max_ts"] >= cutoff_ts:
+            partial.add(day)
+    if partial:
+        for row in (summary.get("rows") or {}).values():
+            if row["day"] in partial and row["ts"] >= cutoff_ts and row["codes"]:
+                daily[row["day"]].update(row["codes"])
+    return daily
+
+
 def aggregate_reason_trend(evidence_dir: str = "var/evidence", days: int = 7) -> Dict[str, Any]:
     root_path = Path(evidence_dir)
-    paths, last_updated, signature = _collect_paths_and_meta(root_path)
     cutoff = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=days)
-    daily: Dict[str, Counter] = defaultdict(Counter)
     total = Counter()
 
-    for path in paths:
-        payload = _load_json(path)
-        ts = _extract_timestamp(payload)
-        if not ts or ts < cutoff:
-            continue
-        day = ts.date().isoformat()
-        for code in _extract_reason_codes(payload):
-            daily[day][code] += 1
-            total[code] += 1
+    summary = load_summary(root_path / "index.json")
+    if summary is not None:
+        last_updated, signature = summary.get("last_updated"), summary_signature(summary)
+        daily = _daily_from_summary(summary, cutoff)
+        for day in sorted(daily):
+            total.update(daily[day])
+    else:
+        paths, last_updated, signature = _collect_paths_and_meta(root_path)
+        daily = defaultdict(Counter)
+        for path in paths:
+            payload = _load_json(path)
+            ts = _extract_timestamp(payload)
+            if not ts or ts < cutoff:
+                continue
+            day = ts.date().isoformat()
+            for code in _extract_reason_codes(payload):
+                daily[day][code] += 1
+                total[code] += 1
 
     return {
         "window_days": days,
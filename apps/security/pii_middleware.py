@@ -1,92 +1,122 @@
 from __future__ import annotations
 
-import json
 import os
-from typing import Iterable
-
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from typing import Iterable, List, Optional, Tuple
 
 from apps.common.pii import build_masker
-
-
-class PIIMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, *, response_fields: Iterable[str] | None = None) -> None:
-        super().__init__(app)
+from apps.common.pii.masker import PIIMasker
+from apps.common.pii.stream import DEFAULT_MAX_BUFFER, JSONStreamMasker
+
+
+def _header(headers: Iterable[Tuple[bytes, bytes]], name: bytes) -> str:
+    for k, v in headers:
+        if k.lower() == name:
+            return v.decode("latin-1")
+    return ""
+
+
+class PIIMiddleware:
+    """요청/응답 JSON 바디 PII 마스킹 (pure ASGI).
+
+    - ``BaseHTTPMiddleware`` 의 태스크 홉과 본문 전체 ``json.loads``/``json.dumps`` 없이
+      ``JSONStreamMasker`` 로 바디 청크를 받는 즉시 마스킹해 흘려보낸다
+    - 한 번에 도착한 바디는 후보 패턴이 없으면 원본 바이트 그대로 통과
+    - 청크 경계에 걸친 문자열 보관 상한: ``DECISIONOS_PII_MAX_BUFFER_BYTES`` (기본 1MiB,
+      초과 문자열은 통째로 마스크 토큰으로 대체)
+    """
+
+    def __init__(
+        self,
+        app,
+        *,
+        response_fields: Iterable[str] | None = None,
+        max_buffer_bytes: Optional[int] = None,
+    ) -> None:
+        self.app = app
         self.enabled = os.getenv("DECISIONOS_PII_ENABLE", "0") == "1"
         self.response_fields = {f.strip() for f in (response_fields or []) if f.strip()}
-        self.masker = build_masker()
-
-    def _redact_payload(self, payload):
-        if not self.response_fields:
-            return self.masker.mask_event(payload)
-
-        def walk(obj):
-            if isinstance(obj, dict):
-                return {
-                    k: (self.masker.mask_event(v) if k in self.response_fields else walk(v))
-                    for k, v in obj.items()
-                }
-            if isinstance(obj, list):
-                return [walk(v) for v in obj]
-            if isinstance(obj, str):
-                return self.masker.mask_text(obj)
-            return obj
-
-        return walk(payload)
-
-    async def _mask_request_body(self, request: Request) -> None:
-        """JSON 바디를 마스킹 후 다시 주입한다."""
-        try:
-            raw = await request.body()
-            if not raw:
-                return
-            data = json.loads(raw.decode("utf-8"))
-            masked = self._redact_payload(data)
-            new_body = json.dumps(masked).encode("utf-8")
-        except Exception:
-            return
+        self.max_buffer_bytes = int(
+            max_buffer_bytes or os.getenv("DECISIONOS_PII_MAX_BUFFER_BYTES", str(DEFAULT_MAX_BUFFER))
+        )
+
+    @property
+    def masker(self) -> PIIMasker:
+        return build_masker()
 
-        async def receive() -> dict:
-            return {"type": "http.request", "body": new_body, "more_body": False}
-
-        request._receive = receive  # type: ignore[attr-defined]
-
-    async def dispatch(self, request, call_next):
-        if not self.enabled:
-            return await call_next(request)
-
-        await self._mask_request_body(request)
-        response = await call_next(request)
-
-        content_type = response.headers.get("content-type", "")
-        if "application/json" not in content_type.lower():
-            return response
-
-        body = b""
-        async for chunk in response.body_iterator:
-            body += chunk
-        if not body:
-            return response
-
-        try:
-            payload = json.loads(body.decode())
-        except Exception:
-            return Response(
-                content=body,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.media_type,
-            )
-
-        masked = self._redact_payload(payload)
-        new_body = json.dumps(masked).encode()
-        headers = dict(response.headers)
-        headers.pop("content-length", None)
-        return Response(
-            content=new_body,
-            status_code=response.status_code,
-            media_type="application/json",
-            headers=headers,
+    def _stream_masker(self) -> JSONStreamMasker:
+        return JSONStreamMasker(
+            self.masker, response_fields=self.response_fields, max_buffer=self.max_buffer_bytes
         )
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        req_type = _header(scope.get("headers", []), b"content-type").lower()
+        if not req_type or "json" in req_type:
+            receive = self._wrap_receive(receive)
+        await self.app(scope, receive, self._wrap_send(send))
+
+    def _wrap_receive(self, receive):
+        stream: Optional[JSONStreamMasker] = None
+        started = False
+
+        async def masked_receive():
+            nonlocal stream, started
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+            body = message.get("body", b"")
+            more = message.get("more_body", False)
+            if not started and not more:
+                masked = self._stream_masker().mask_once(body) if body else body
+            else:
+                stream = stream or self._stream_masker()
+                masked = stream.feed(body, final=not more)
+            started = True
+            if masked is body:
+                return message
+            return {**message, "body": masked}
+
+        return masked_receive
+
+    def _wrap_send(self, send):
+        stream: Optional[JSONStreamMasker] = None
+        pending_start: Optional[dict] = None
+        active = False
+
+        async def masked_send(message) -> None:
+            nonlocal stream, pending_start, active
+            if message["type"] == "http.response.start":
+                ctype = _header(message.get("headers", []), b"content-type").lower()
+                active = "application/json" in ctype
+                if not active:
+                    await send(message)
+                    return
+                pending_start = message  # 본문 길이가 바뀔 수 있으므로 첫 바디까지 보류
+                return
+            if message["type"] != "http.response.body" or not active:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more = message.get("more_body", False)
+            if pending_start is not None:
+                start, pending_start = pending_start, None
+                headers: List[Tuple[bytes, bytes]] = [
+                    (k, v) for k, v in start.get("headers", []) if k.lower() != b"content-length"
+                ]
+                if not more:
+                    masked = self._stream_masker().mask_once(body) if body else body
+                    headers.append((b"content-length", str(len(masked)).encode("latin-1")))
+                    await send({**start, "headers": headers})
+                    await send({**message, "body": masked})
+                    return
+                await send({**start, "headers": headers})
+                stream = self._stream_masker()
+            elif stream is None:  # 시작 메시지 없이 온 바디 (ASGI 위반) 도 마스킹은 거침
+                stream = self._stream_masker()
+            await send({**message, "body": stream.feed(body, final=not more)})
+
+        return masked_send
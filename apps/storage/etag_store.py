@@ -42,24 +42,29 @@ class InMemoryETagStore(ETagStore):
         return True
 
 class RedisETagStore(ETagStore):
+    """Redis + process-local L1 (TieredCache, namespace "etag_kv"); values stay plain strings in Redis."""
+
     def __init__(self, dsn: str):
         if not redis:
             raise RuntimeError("redis not available")
-        self._r = redis.Redis.from_url(dsn, decode_responses=True)
+        from apps.common.compress import CompressionPolicy
+        from apps.ops.cache.tiered import TieredCache
+
+        self._r = redis.Redis.from_url(dsn)
+        self._cache = TieredCache("etag_kv", self._r, default_ttl=None, policy=CompressionPolicy(codec="none"), serializer="text")
 
     def get(self, key: str) -> Optional[str]:
-        return self._r.get(key)
+        return self._cache.get(key)
 
     def set(self, key: str, etag: str, ttl: Optional[int]=None) -> None:
-        if ttl:
-            self._r.setex(key, ttl, etag)
-        else:
-            self._r.set(key, etag)
+        self._cache.set(key, etag, ttl)
 
     def compare_and_set(self, key: str, old: Optional[str], new: str, ttl: Optional[int]=None) -> bool:
         with self._r.pipeline() as p:
             p.watch(key)
             cur = p.get(key)
+            if isinstance(cur, bytes):
+                cur = cur.decode("utf-8")
             if cur != (old if old is not None else cur):
                 p.reset()
                 return False
@@ -69,7 +74,9 @@ class RedisETagStore(ETagStore):
             else:
                 p.set(key, new)
             p.execute()
-            return True
+        # written under WATCH, bypassing the tiered cache: drop stale L1 copies everywhere
+        self._cache.evict(key)
+        return True
 
 def load_store_from_env() -> ETagStore:
     backend = os.getenv("DECISIONOS_ETAG_BACKEND", "memory").lower()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Evidence 무결성 해시 벤치마크: 전체 문자열 ``json.dumps`` vs 스트리밍 해시.
+
+다중 MB evidence(``perf``/``judges``/``canary`` 블록 포함)에 대해
+처리량(MB/s)과 tracemalloc 최대 할당량을 비교하고, digest 가 동일한지 확인한다.
+
+    python scripts/bench/bench_canonical_hash.py --size-mb 8
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from apps.common.canonical_json import canonical_sha256  # noqa: E402
+
+
+def legacy_sha256(obj: Any) -> str:
+    payload = json.dumps(obj, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def build_evidence(size_mb: float) -> Dict[str, Any]:
+    judges = []
+    i = 0
+    approx = 0
+    while approx < size_mb * 1024 * 1024:
+        judge = {
+            "id": f"judge-{i}",
+            "decision": "pass" if i % 7 else "fail",
+            "reasons": [f"reason.code_{i % 13}", "지연.초과"],
+            "meta": {"latency_ms": i * 0.37, "region": "ap-northeast-2", "tags": list(range(i % 20))},
+        }
+        judges.append(judge)
+        approx += 220
+        i += 1
+    return {
+        "meta": {"tenant": "bench", "generated_at": "2025-01-01T00:00:00Z"},
+        "witness": {"csv_sha256": "abc"},
+        "usage": {"cpu_percent": 40},
+        "rating": {},
+        "quota": {},
+        "budget": {"level": "ok"},
+        "anomaly": {"is_spike": False},
+        "perf": {"latency_ms": {"p50": 80, "p95": 420, "p99": 900}, "samples": [x * 0.5 for x in range(20000)]},
+        "judges": judges,
+        "canary": {"windows": [{"idx": w, "pass": True, "p95": 400 + w} for w in range(500)]},
+    }
+
+
+def _measure(fn: Callable[[Any], str], obj: Any, size_bytes: int, repeat: int) -> Dict[str, Any]:
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    digest = fn(obj)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(obj)
+    elapsed = (time.perf_counter() - start) / repeat
+    return {
+        "digest": digest,
+        "peak_alloc_mb": round(peak / (1024 * 1024), 2),
+        "seconds": round(elapsed, 4),
+        "mb_per_sec": round(size_bytes / (1024 * 1024) / elapsed, 1),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Canonical JSON hash benchmark")
+    ap.add_argument("--size-mb", type=float, default=8.0)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    evidence = build_evidence(args.size_mb)
+    size_bytes = len(json.dumps(evidence, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+    report: Dict[str, Any] = {"payload_mb": round(size_bytes / (1024 * 1024), 2)}
+    report["legacy"] = _measure(legacy_sha256, evidence, size_bytes, args.repeat)
+    report["streaming"] = _measure(canonical_sha256, evidence, size_bytes, args.repeat)
+    report["identical"] = report["legacy"]["digest"] == report["streaming"]["digest"]
+    print(json.dumps(report, indent=2))
+    return 0 if report["identical"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
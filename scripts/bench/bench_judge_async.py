@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Judge ``/judge`` 동시성 부하 벤치마크 (p50/p99).
+
+동기 경로(``DECISIONOS_JUDGE_OFFLOAD=0`` 과 동일, 루프 위 인라인 실행)와
+오프로드 경로(워커 풀 + async replay store)를 같은 부하로 비교한다.
+``--store-delay-ms`` 로 느린 SQLite/Redis 커밋을 흉내낼 수 있다.
+
+    python scripts/bench/bench_judge_async.py --requests 2000 --concurrency 64
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from typing import Any, Dict, List
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault("DECISIONOS_JUDGE_KEYS", '[{"key_id":"k1","secret":"bench-secret","state":"active"}]')
+os.environ.setdefault("DECISIONOS_ALLOW_SCOPES", "judge:run")
+
+import httpx  # noqa: E402
+
+from apps.judge.crypto import hmac_sign  # noqa: E402
+from apps.judge.offload import JudgeOffload  # noqa: E402
+from apps.judge.replay_plugins import ReplayStoreABC, SQLiteReplayStore  # noqa: E402
+from apps.judge.server import create_app  # noqa: E402
+
+
+class SlowStore(ReplayStoreABC):
+    """동기 커밋 지연을 흉내내는 replay store (fsync 대용)."""
+
+    def __init__(self, inner: ReplayStoreABC, delay_ms: float) -> None:
+        self._inner = inner
+        self._delay = delay_ms / 1000.0
+
+    def seen_or_insert(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        time.sleep(self._delay)
+        return self._inner.seen_or_insert(key_id, nonce, ts_epoch)
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+def _payload() -> Dict[str, Any]:
+    evidence = {
+        "meta": {"tenant": "bench"},
+        "perf_judge": {
+            "latency_ms": {"p50": 100, "p95": 800, "p99": 1200},
+            "availability": 0.999,
+            "error_rate": 0.001,
+            "signature_error_rate": 0.0001,
+        },
+    }
+    slo = {
+        "latency": {"max_p95_ms": 1000, "max_p99_ms": 2000},
+        "judge_infra": {"latency": {"max_p95_ms": 900, "max_p99_ms": 1500}},
+    }
+    return {"evidence": evidence, "slo": slo}
+
+
+def _pct(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * (len(ordered) - 1)))]
+
+
+async def _drive(app: Any, requests: int, concurrency: int) -> Dict[str, Any]:
+    payload = _payload()
+    body = json.dumps(payload)
+    signature = hmac_sign(payload, b"bench-secret")
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    sem = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def one() -> None:
+            headers = {
+                "Content-Type": "application/json",
+                "X-Key-Id": "k1",
+                "X-DecisionOS-Signature": signature,
+                "X-DecisionOS-Nonce": uuid.uuid4().hex,
+                "X-DecisionOS-Timestamp": str(int(time.time())),
+            }
+            async with sem:
+                start = time.perf_counter()
+                res = await client.post("/judge", content=body, headers=headers)
+                latencies.append((time.perf_counter() - start) * 1000)
+                statuses[res.status_code] = statuses.get(res.status_code, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+    return {
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(_pct(latencies, 0.50), 2),
+        "p99_ms": round(_pct(latencies, 0.99), 2),
+        "statuses": statuses,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Judge async path load benchmark")
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--concurrency", type=int, default=64)
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--store-delay-ms", type=float, default=2.0)
+    args = ap.parse_args(argv)
+
+    report: Dict[str, Any] = {"requests": args.requests, "concurrency": args.concurrency}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, enabled in (("inline", False), ("offload", True)):
+            store: ReplayStoreABC = SQLiteReplayStore(os.path.join(tmp, f"{name}.sqlite"))
+            if args.store_delay_ms > 0:
+                store = SlowStore(store, args.store_delay_ms)
+            offload = JudgeOffload(max_workers=args.workers, enabled=enabled)
+            app = create_app(replay_store=store, offload=offload)
+            try:
+                report[name] = asyncio.run(_drive(app, args.requests, args.concurrency))
+            finally:
+                offload.shutdown()
+                store.close()
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""``DECISIONOS_PII_ENABLE=1`` 상태의 Judge ``/judge`` 처리량 벤치마크.
+
+이전 방식(``BaseHTTPMiddleware`` + 본문 전체 ``json.loads``/walk/``json.dumps``)과
+현재 pure-ASGI 스트리밍 ``PIIMiddleware`` 를 같은 부하로 비교한다.
+
+    python scripts/bench/bench_pii_middleware.py --requests 2000 --concurrency 32
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from typing import Any, Dict, List
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ["DECISIONOS_PII_ENABLE"] = "1"
+os.environ.setdefault("DECISIONOS_JUDGE_KEYS", '[{"key_id":"k1","secret":"bench-secret","state":"active"}]')
+os.environ.setdefault("DECISIONOS_ALLOW_SCOPES", "judge:run")
+
+import httpx  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.responses import Response  # noqa: E402
+
+import apps.judge.server as judge_server  # noqa: E402
+from apps.common.pii import build_masker  # noqa: E402
+from apps.judge.crypto import hmac_sign  # noqa: E402
+from apps.judge.replay_plugins import SQLiteReplayStore  # noqa: E402
+from apps.security.pii_middleware import PIIMiddleware  # noqa: E402
+
+
+class LegacyPIIMiddleware(BaseHTTPMiddleware):
+    """비교용: 이전 PIIMiddleware 의 버퍼링 + 재파싱 경로."""
+
+    def __init__(self, app, *, response_fields=None) -> None:
+        super().__init__(app)
+        self.masker = build_masker()
+
+    async def dispatch(self, request, call_next):
+        raw = await request.body()
+        if raw:
+            try:
+                new_body = json.dumps(self.masker.mask_event(json.loads(raw))).encode()
+
+                async def receive() -> dict:
+                    return {"type": "http.request", "body": new_body, "more_body": False}
+
+                request._receive = receive  # type: ignore[attr-defined]
+            except Exception:
+                pass
+        response = await call_next(request)
+        if "application/json" not in response.headers.get("content-type", "").lower():
+            return response
+        body = b""
+        async for chunk in response.body_iterator:
+            body += chunk
+        headers = dict(response.headers)
+        headers.pop("content-length", None)
+        masked = json.dumps(self.masker.mask_event(json.loads(body))).encode()
+        return Response(content=masked, status_code=response.status_code, headers=headers, media_type="application/json")
+
+
+def _payload() -> Dict[str, Any]:
+    evidence = {
+        "meta": {"tenant": "bench", "notes": ["batch-%d" % i for i in range(50)]},
+        "perf_judge": {
+            "latency_ms": {"p50": 100, "p95": 800, "p99": 1200},
+            "availability": 0.999,
+            "error_rate": 0.001,
+            "signature_error_rate": 0.0001,
+        },
+    }
+    slo = {"latency": {"max_p95_ms": 1000, "max_p99_ms": 2000}}
+    return {"evidence": evidence, "slo": slo}
+
+
+def _pct(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * (len(ordered) - 1)))] if ordered else 0.0
+
+
+async def _drive(app: Any, requests: int, concurrency: int) -> Dict[str, Any]:
+    payload = _payload()
+    body = json.dumps(payload)
+    signature = hmac_sign(payload, b"bench-secret")
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    sem = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def one() -> None:
+            headers = {
+                "Content-Type": "application/json",
+                "X-Key-Id": "k1",
+                "X-DecisionOS-Signature": signature,
+                "X-DecisionOS-Nonce": uuid.uuid4().hex,
+                "X-DecisionOS-Timestamp": str(int(time.time())),
+            }
+            async with sem:
+                start = time.perf_counter()
+                res = await client.post("/judge", content=body, headers=headers)
+                latencies.append((time.perf_counter() - start) * 1000)
+                statuses[res.status_code] = statuses.get(res.status_code, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+    return {
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(_pct(latencies, 0.50), 2),
+        "p99_ms": round(_pct(latencies, 0.99), 2),
+        "statuses": statuses,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Judge throughput with PII masking enabled")
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--concurrency", type=int, default=32)
+    args = ap.parse_args(argv)
+
+    report: Dict[str, Any] = {"requests": args.requests, "concurrency": args.concurrency}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, middleware in (("legacy", LegacyPIIMiddleware), ("streaming", PIIMiddleware)):
+            judge_server.PIIMiddleware = middleware
+            store = SQLiteReplayStore(os.path.join(tmp, f"{name}.sqlite"))
+            try:
+                app = judge_server.create_app(replay_store=store)
+                report[name] = asyncio.run(_drive(app, args.requests, args.concurrency))
+            finally:
+                store.close()
+    judge_server.PIIMiddleware = PIIMiddleware
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Replay store 처리량 벤치마크 (nonces/sec).
+
+기존 per-call commit 방식(legacy)과 group commit ``SQLiteReplayStore`` 를
+동일한 동시성에서 비교한다.
+
+    python scripts/bench/bench_replay_store.py --threads 16 --seconds 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from apps.judge.replay_plugins import TTL_SEC, SQLiteReplayStore  # noqa: E402
+
+
+class LegacySQLiteReplayStore:
+    """기존 구현: 호출마다 INSERT+commit, 전체 DELETE+commit."""
+
+    def __init__(self, path: str) -> None:
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS nonce_log(key_id TEXT NOT NULL, nonce TEXT NOT NULL,"
+            " ts INTEGER NOT NULL, PRIMARY KEY(key_id, nonce))"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def seen_or_insert(self, key_id: str, nonce: str, ts_epoch: int) -> bool:
+        now = int(time.time())
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT INTO nonce_log(key_id, nonce, ts) VALUES (?,?,?)", (key_id, nonce, ts_epoch)
+                )
+                self._conn.commit()
+            except sqlite3.IntegrityError:
+                return True
+            self._conn.execute("DELETE FROM nonce_log WHERE ? - ts > ?", (now, TTL_SEC))
+            self._conn.commit()
+        return False
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _run(store: Any, threads: int, seconds: float) -> Dict[str, Any]:
+    stop = time.monotonic() + seconds
+    counts = [0] * threads
+    errors = [0] * threads
+
+    def worker(idx: int) -> None:
+        ts = int(time.time())
+        while time.monotonic() < stop:
+            if store.seen_or_insert("k1", uuid.uuid4().hex, ts):
+                errors[idx] += 1
+            counts[idx] += 1
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - started
+    total = sum(counts)
+    return {
+        "nonces": total,
+        "false_replays": sum(errors),
+        "seconds": round(elapsed, 3),
+        "nonces_per_sec": round(total / elapsed, 1),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Replay store throughput benchmark")
+    ap.add_argument("--threads", type=int, default=16)
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--batch-max", type=int, default=256)
+    ap.add_argument("--flush-ms", type=float, default=1.0)
+    args = ap.parse_args(argv)
+
+    factories: Dict[str, Callable[[str], Any]] = {
+        "legacy": LegacySQLiteReplayStore,
+        "group_commit": lambda p: SQLiteReplayStore(
+            p, batch_max=args.batch_max, flush_ms=args.flush_ms
+        ),
+    }
+    report: Dict[str, Any] = {"threads": args.threads}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, factory in factories.items():
+            store = factory(os.path.join(tmp, f"{name}.sqlite"))
+            try:
+                report[name] = _run(store, args.threads, args.seconds)
+            finally:
+                store.close()
+    if report["legacy"]["nonces_per_sec"]:
+        report["speedup"] = round(
+            report["group_commit"]["nonces_per_sec"] / report["legacy"]["nonces_per_sec"], 2
+        )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
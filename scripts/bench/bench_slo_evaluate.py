@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""``slo_judge.evaluate`` 처리량 마이크로 벤치마크 (calls/sec).
+
+매 호출 ``SLOSpec.model_validate`` 를 수행하는 비캐시 경로(``compile_slo``)와
+내용 해시 LRU 캐시 경로(``evaluate``)를 대표 evidence 로 비교한다.
+
+    python scripts/bench/bench_slo_evaluate.py --iterations 20000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from apps.judge import slo_judge  # noqa: E402
+
+
+def representative() -> tuple[Dict[str, Any], Dict[str, Any]]:
+    evidence: Dict[str, Any] = {
+        "meta": {"tenant": "bench", "generated_at": "2025-01-01T00:00:00Z"},
+        "witness": {"csv_sha256": "abc", "rows": 1000},
+        "usage": {"cpu_percent": 40, "mem_percent": 55, "qps": 120},
+        "rating": {"subtotal": 12.5},
+        "quota": {"decisions": {"calls": {"action": "allow"}}},
+        "budget": {"level": "ok", "spent": 0.4, "limit": 1.0},
+        "anomaly": {"is_spike": False},
+        "perf": {"latency_ms": {"p50": 80, "p95": 420, "p99": 900}, "error_rate": 0.002, "count": 5000},
+        "perf_judge": {
+            "latency_ms": {"p50": 40, "p95": 300, "p99": 700},
+            "availability": 0.999,
+            "error_rate": 0.001,
+            "signature_error_rate": 0.0,
+            "count": 5000,
+        },
+        "integrity": {},
+    }
+    core = {k: evidence[k] for k in slo_judge.REQUIRED_BLOCKS if k != "integrity"}
+    core["perf"] = evidence["perf"]
+    core["perf_judge"] = evidence["perf_judge"]
+    evidence["integrity"]["signature_sha256"] = slo_judge._recalc_signature(core)
+    slo = {
+        "budget": {"allow_levels": ["ok", "warn"], "max_spent": 1.0},
+        "quota": {"forbid_actions": {"calls": ["deny"]}},
+        "latency": {"max_p95_ms": 1000, "max_p99_ms": 2000, "min_samples": 100},
+        "error": {"max_error_rate": 0.01, "min_samples": 100},
+        "judge_infra": {
+            "latency": {"max_p95_ms": 900, "max_p99_ms": 1500},
+            "availability": {"min_availability": 0.99},
+            "sig": {"max_sig_error_rate": 0.001},
+        },
+        "saturation": {"max_cpu_percent": 90, "max_mem_percent": 90, "max_qps": 1000},
+    }
+    return evidence, slo
+
+
+def _rate(fn: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="slo_judge.evaluate micro-benchmark")
+    ap.add_argument("--iterations", type=int, default=20000)
+    args = ap.parse_args(argv)
+
+    evidence, slo = representative()
+    assert slo_judge.evaluate(evidence, slo) == ("pass", [])
+    uncached = _rate(lambda: slo_judge.compile_slo(slo).evaluate(evidence), args.iterations)
+    slo_judge.clear_slo_cache()
+    cached = _rate(lambda: slo_judge.evaluate(evidence, slo), args.iterations)
+    report = {
+        "iterations": args.iterations,
+        "uncached_calls_per_sec": round(uncached, 1),
+        "cached_calls_per_sec": round(cached, 1),
+        "speedup": round(cached / uncached, 2) if uncached else None,
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
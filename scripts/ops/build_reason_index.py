@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""reasons.jsonl → ts 인덱스 사이드카(<path>.idx.sqlite) 마이그레이션/재구축."""
+import argparse, os, sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from apps.ops.cards.events import EV_PATH, build_reason_index
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--path", default=EV_PATH, help="reason events JSONL (default: REASON_EVENTS_PATH)")
+    ap.add_argument("--rebuild", action="store_true", help="drop and re-ingest the whole file")
+    args = ap.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"[reason-index] not found: {args.path}", file=sys.stderr)
+        return 2
+    n = build_reason_index(args.path, rebuild=args.rebuild)
+    print(f"[reason-index] {args.path} -> {args.path}.idx.sqlite events={n}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""Streaming canonical-JSON hash must match json.dumps(sort_keys=True) byte-for-byte."""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+
+import pytest
+
+from apps.common.canonical_json import canonical_sha256
+
+
+def _legacy(obj):
+    return hashlib.sha256(json.dumps(obj, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+CASES = [
+    {},
+    [],
+    {"b": 1, "a": [1, 2.5, None, True], "한글": "값   \"quoted\""},
+    {"judges": [{"id": i, "reasons": ["r", str(i)], "score": i / 7} for i in range(2000)]},
+    {"nested": {"deep": {"deeper": {"deepest": list(range(1000))}}}},
+    {"tuple": tuple(range(600)), "nan": math.nan, "inf": math.inf},
+    {10: "int-key", 2: {3: "x"}},
+    {"a": {2: "x", 10: "y"}},
+    [[{"z": 1, "y": 2}] * 300] * 3,
+    "plain string",
+    12345,
+]
+
+
+@pytest.mark.parametrize("obj", CASES)
+def test_canonical_sha256_matches_dumps(obj):
+    assert canonical_sha256(obj) == _legacy(obj)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_canonical_sha256_chunk_size_independent(chunk_size):
+    obj = CASES[3]
+    assert canonical_sha256(obj, chunk_size=chunk_size) == _legacy(obj)
+
+
+def test_canonical_sha256_rejects_unserializable_like_dumps():
+    with pytest.raises(TypeError):
+        canonical_sha256({"a": object()})
@@ -0,0 +1,56 @@
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from apps.judge.offload import JudgeOffload
+from apps.judge.replay_plugins import CachedReplayStore, SQLiteReplayStore
+
+pytestmark = [pytest.mark.gate_aj]
+
+_CTX = contextvars.ContextVar("judge_offload_ctx", default=None)
+
+
+def test_offload_runs_off_loop_and_keeps_context():
+    offload = JudgeOffload(max_workers=2, enabled=True)
+
+    def work():
+        return threading.current_thread().name, _CTX.get()
+
+    async def _run():
+        _CTX.set("tenant-a")
+        return await offload.run(work)
+
+    name, ctx_val = asyncio.run(_run())
+    offload.shutdown()
+    assert name.startswith("judge-offload")
+    assert ctx_val == "tenant-a"
+
+
+def test_offload_disabled_runs_inline():
+    offload = JudgeOffload(enabled=False)
+
+    async def _run():
+        return await offload.run(lambda: threading.current_thread().name)
+
+    assert asyncio.run(_run()) == threading.main_thread().name
+
+
+def test_async_replay_store_detects_replay(tmp_path):
+    store = CachedReplayStore(SQLiteReplayStore(path=str(tmp_path / "replay.sqlite")))
+    offload = JudgeOffload(enabled=True)
+    ts = int(time.time())
+
+    async def _run():
+        first = await asyncio.gather(
+            *(offload.seen_or_insert(store, "k1", "dup", ts) for _ in range(8))
+        )
+        again = await offload.seen_or_insert(store, "k1", "dup", ts)
+        return first, again
+
+    first, again = asyncio.run(_run())
+    store.close()
+    assert sorted(first) == [False] + [True] * 7
+    assert again is True
@@ -94,3 +94,24 @@ def test_readyz_metrics_last_status_updated():
     rm.observe(False)
     snapshot = rm.snapshot()
     assert snapshot["last_status"] == "degraded"
+
+
+@pytest.mark.gate_aj
+def test_readyz_metrics_ring_memory_fixed_and_expires(monkeypatch):
+    """Per-second ring keeps fixed memory and expires whole seconds."""
+    from apps.judge import metrics_readyz
+
+    clock = {"now": 1_000_000.0}
+    monkeypatch.setattr(metrics_readyz.time, "time", lambda: clock["now"])
+    rm = ReadyzMetrics(window_1m=60, window_5m=300)
+    for i in range(10_000):
+        rm.observe(i % 4 != 0)
+    assert len(rm._window_1m._total) == 60
+    assert rm.ratios()["success_ratio_1m"] == 0.75
+    clock["now"] += 61
+    rm.observe(True)
+    ratios = rm.ratios()
+    assert ratios["success_ratio_1m"] == 1.0
+    assert ratios["success_ratio_5m"] == pytest.approx(7501 / 10001)
+    clock["now"] += 10_000
+    assert rm.ratios() == {"success_ratio_1m": 1.0, "success_ratio_5m": 1.0}
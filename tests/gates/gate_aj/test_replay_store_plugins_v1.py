@@ -12,3 +12,123 @@ def test_sqlite_replay_store_roundtrip(tmp_path):
     ts = int(time.time())
     assert store.seen_or_insert("k1", "nonce1", ts) is False
     assert store.seen_or_insert("k1", "nonce1", ts) is True
+
+
+def test_sqlite_replay_store_group_commit_exact_under_concurrency(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    store = SQLiteReplayStore(path=str(tmp_path / "replay.sqlite"), batch_max=32, flush_ms=2)
+    ts = int(time.time())
+    # 각 nonce 를 두 번씩 제출: 정확히 한 번만 신규(False)여야 한다
+    nonces = [f"n{i}" for i in range(200)] * 2
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda n: (n, store.seen_or_insert("k1", n, ts)), nonces))
+    fresh = [n for n, seen in results if not seen]
+    assert sorted(fresh) == sorted(set(nonces))
+    store.close()
+
+
+def test_sqlite_replay_store_sweep_uses_ts_cutoff(tmp_path):
+    from apps.judge.replay_plugins import SKEW_SEC, TTL_SEC
+
+    store = SQLiteReplayStore(path=str(tmp_path / "replay.sqlite"), sweep_interval=3600)
+    now = int(time.time())
+    assert store.seen_or_insert("k1", "old", now - TTL_SEC - 10) is False
+    assert store.seen_or_insert("k1", "fresh", now) is False
+    store.purge_expired()
+    # 수락 가능 구간(TTL+SKEW) 내의 nonce 는 유지되어 재생이 계속 차단된다
+    assert store.seen_or_insert("k1", "old", now - TTL_SEC - 10) is True
+    store._conn.execute("UPDATE nonce_log SET ts = ? WHERE nonce = 'old'", (now - TTL_SEC - SKEW_SEC - 5,))
+    store._conn.commit()
+    store.purge_expired()
+    rows = store._conn.execute("SELECT nonce FROM nonce_log").fetchall()
+    assert rows == [("fresh",)]
+    store.close()
+
+
+class _CountingStore:
+    def __init__(self):
+        self.calls = 0
+        self.seen = set()
+
+    def seen_or_insert(self, key_id, nonce, ts_epoch):
+        self.calls += 1
+        if (key_id, nonce) in self.seen:
+            return True
+        self.seen.add((key_id, nonce))
+        return False
+
+    def purge_expired(self):
+        pass
+
+    def health_check(self):
+        return True, "ok"
+
+
+def test_cached_replay_store_rejects_locally_and_counts():
+    from apps.common.metrics import REG
+    from apps.judge.replay_plugins import CachedReplayStore
+
+    backend = _CountingStore()
+    store = CachedReplayStore(backend, max_entries=64, shards=4)
+    hits = REG.counter("decisionos_replay_cache_hits_total")
+    before = hits.get()
+    ts = int(time.time())
+    assert store.seen_or_insert("k1", "n1", ts) is False
+    assert store.seen_or_insert("k1", "n1", ts) is True
+    assert store.seen_or_insert("k1", "n1", ts) is True
+    assert backend.calls == 1
+    assert hits.get() - before == 2
+    # key_id 가 다르면 별도 nonce
+    assert store.seen_or_insert("k2", "n1", ts) is False
+
+
+def test_cached_replay_store_is_memory_capped():
+    from apps.judge.replay_plugins import CachedReplayStore
+
+    backend = _CountingStore()
+    store = CachedReplayStore(backend, max_entries=16, shards=4)
+    ts = int(time.time())
+    for i in range(100):
+        store.seen_or_insert("k1", f"n{i}", ts)
+    assert len(store) <= 16
+    # 캐시에서 밀려난 nonce 도 backing store 가 재생으로 판정
+    assert store.seen_or_insert("k1", "n0", ts) is True
+
+
+def test_cached_replay_store_does_not_remember_fail_closed_verdicts(tmp_path):
+    import asyncio
+
+    from apps.judge.replay_plugins import CachedReplayStore, ReplayStoreABC, ReplayStoreError, SQLiteReplayStore
+
+    class _FlakyStore(ReplayStoreABC):
+        down = True
+
+        def __init__(self):
+            self.inner = _CountingStore()
+
+        def seen_or_insert(self, key_id, nonce, ts_epoch):
+            try:
+                return self.check_nonce(key_id, nonce, ts_epoch)
+            except ReplayStoreError:
+                return True
+
+        def check_nonce(self, key_id, nonce, ts_epoch):
+            if self.down:
+                raise ReplayStoreError("backend down")
+            return self.inner.seen_or_insert(key_id, nonce, ts_epoch)
+
+    backend = _FlakyStore()
+    store = CachedReplayStore(backend, max_entries=64, shards=4)
+    ts = int(time.time())
+    assert store.seen_or_insert("k1", "n1", ts) is True  # 장애: fail-closed
+    assert asyncio.run(store.aseen_or_insert("k1", "n1", ts)) is True
+    backend.down = False
+    assert store.seen_or_insert("k1", "n1", ts) is False  # 복구 후 재시도는 신규
+    assert store.seen_or_insert("k1", "n1", ts) is True
+
+    sqlite_store = SQLiteReplayStore(path=str(tmp_path / "replay.sqlite"))
+    sqlite_store.close()
+    assert sqlite_store.seen_or_insert("k1", "n2", ts) is True
+    with pytest.raises(ReplayStoreError):
+        sqlite_store.check_nonce("k1", "n2", ts)
@@ -0,0 +1,65 @@
+"""
+Gate AJ — compiled SLO spec cache
+"""
+import pytest
+
+from apps.common.metrics import REG
+from apps.judge import slo_judge
+
+pytestmark = [pytest.mark.gate_aj]
+
+
+def _evidence():
+    return {
+        "meta": {}, "witness": {"csv_sha256": "x"}, "usage": {"cpu_percent": 95.0}, "rating": {},
+        "quota": {}, "budget": {"level": "ok"}, "anomaly": {}, "integrity": {"signature_sha256": "abc"},
+    }
+
+
+def test_compiled_slo_skips_absent_blocks(monkeypatch):
+    called = []
+    monkeypatch.setattr(slo_judge, "_evaluate_canary", lambda *a: called.append("canary"))
+    compiled = slo_judge.compile_slo({"integrity": {"require_signature": False}})
+    compiled.evaluate(_evidence())
+    assert called == []
+    names = [getattr(c, "func", c).__name__ for c in compiled.checks]
+    assert "_evaluate_infra" not in names
+    assert "_evaluate_drift" not in names
+
+
+def test_cache_hits_and_same_verdict_as_fresh_compile():
+    slo_judge.clear_slo_cache()
+    hits = REG.counter("decisionos_slo_cache_hits_total")
+    misses = REG.counter("decisionos_slo_cache_misses_total")
+    h0, m0 = hits.get(), misses.get()
+    slo = {"version": "v1", "saturation": {"max_cpu_percent": 90.0, "fail_closed": True}}
+    first = slo_judge.evaluate(_evidence(), slo)
+    # 키 순서가 달라도 같은 내용이면 같은 캐시 엔트리
+    second = slo_judge.evaluate(_evidence(), {"saturation": {"fail_closed": True, "max_cpu_percent": 90.0}, "version": "v1"})
+    assert first == second == slo_judge.compile_slo(slo).evaluate(_evidence())
+    assert misses.get() - m0 == 1
+    assert hits.get() - h0 == 1
+
+
+def test_cache_is_bounded_lru(monkeypatch):
+    monkeypatch.setattr(slo_judge, "_CACHE_SIZE", 4)
+    slo_judge.clear_slo_cache()
+    for i in range(10):
+        slo_judge.evaluate(_evidence(), {"budget": {"max_spent": float(i)}})
+    assert len(slo_judge._CACHE) == 4
+
+
+def test_parse_error_is_cached_and_reported():
+    slo_judge.clear_slo_cache()
+    verdict, reasons = slo_judge.evaluate(_evidence(), {"unknown_block": 1})
+    assert verdict == "fail"
+    assert reasons[0].startswith("slo-parse:")
+    assert slo_judge.evaluate(_evidence(), {"unknown_block": 1}) == (verdict, reasons)
+
+
+def test_unhashable_budget_level_is_forbidden_not_error():
+    slo_judge.clear_slo_cache()
+    evidence = {**_evidence(), "budget": {"level": ["ok"]}}
+    verdict, reasons = slo_judge.evaluate(evidence, {"budget": {"allow_levels": ["ok", "warn"]}})
+    assert verdict == "fail"
+    assert "budget.level_forbidden:['ok']" in reasons
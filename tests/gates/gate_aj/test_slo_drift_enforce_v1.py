@@ -170,3 +170,50 @@ def test_drift_pass(tmp_path):
 
     assert decision == "pass", f"Expected pass but got {decision}, reasons: {reasons}"
     assert not any("drift." in r for r in reasons)
+
+
+def _drift_evidence():
+    return {
+        "meta": {}, "witness": {"csv_sha256": "abc123"}, "usage": {}, "rating": {},
+        "quota": {}, "budget": {"level": "ok"}, "anomaly": {}, "integrity": {"signature_sha256": "def456"},
+    }
+
+
+def test_drift_state_cache_reloads_only_on_change(tmp_path):
+    """drift 파일은 변경 시에만 다시 파싱된다"""
+    import os
+
+    from apps.judge.drift_state import DriftStateCache
+
+    drift_path = tmp_path / "posterior_drift.json"
+    drift_path.write_text(json.dumps({"severity": "info", "abs_diff": 0.01, "kl": 0.1}), encoding="utf-8")
+    cache = DriftStateCache()
+    first = cache.get(str(drift_path))
+    assert cache.get(str(drift_path)) is first
+    assert cache.loads == 1
+    with pytest.raises(TypeError):
+        first.raw["severity"] = "critical"
+
+    drift_path.write_text(json.dumps({"severity": "critical", "abs_diff": 0.3, "kl": 0.1}), encoding="utf-8")
+    st = os.stat(drift_path)
+    os.utime(drift_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cache.get(str(drift_path)).severity == "critical"
+    assert cache.loads == 2
+
+
+def test_drift_source_missing_and_unreadable_fail_closed(tmp_path):
+    """캐시 경로에서도 missing/unreadable 은 fail-closed"""
+    from apps.judge.slo_judge import evaluate
+
+    drift_path = tmp_path / "posterior_drift.json"
+    slo = {"version": "v1", "drift": {"source": str(drift_path)}}
+    decision, reasons = evaluate(_drift_evidence(), slo)
+    assert decision == "fail" and "drift.source_missing" in reasons
+
+    drift_path.write_text("{not json", encoding="utf-8")
+    decision, reasons = evaluate(_drift_evidence(), slo)
+    assert decision == "fail" and "drift.source_unreadable" in reasons
+
+    drift_path.unlink()
+    decision, reasons = evaluate(_drift_evidence(), slo)
+    assert "drift.source_missing" in reasons
@@ -0,0 +1,59 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from apps.ops.cache import etag as etag_mod
+from apps.ops.cards import events as ev
+from apps.ops.cards.etag_v2 import build_cards_etag_key, compute_cards_etag
+
+S = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def _key(rev):
+    return build_cards_etag_key("2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z",
+                                bucket="hour", seasonality="off",
+                                delta_enabled=False, delta_require_same_window=False,
+                                continuity_token=None, events_revision=rev)
+
+
+@pytest.mark.gate_ops
+def test_events_revision_tracks_appends_without_reading(tmp_path):
+    p = str(tmp_path / "reasons.jsonl")
+    assert ev.reason_events_revision(p) == "absent"
+    ev.append_reason_event("reason:a", ts=S.isoformat(), path=p)
+    r1 = ev.reason_events_revision(p)
+    assert ev.reason_events_revision(p) == r1
+    ev.append_reason_event("reason:b", ts=(S + timedelta(minutes=1)).isoformat(), path=p)
+    r2 = ev.reason_events_revision(p)
+    assert r2 != r1
+    assert compute_cards_etag(_key(r1)) != compute_cards_etag(_key(r2))
+    assert compute_cards_etag(_key(r2)) == compute_cards_etag(_key(r2))
+
+
+@pytest.mark.gate_ops
+def test_load_reason_pairs_feeds_totals_and_buckets(tmp_path):
+    p = str(tmp_path / "reasons.jsonl")
+    for i in range(6):
+        ev.append_reason_event(f"reason:r{i % 2}", ts=(S + timedelta(minutes=30 * i)).isoformat(), path=p)
+    pairs = ev.load_reason_pairs(S, S + timedelta(hours=2), p)
+    assert [r for _, r in pairs] == ev.load_reason_events(S, S + timedelta(hours=2), p)
+    assert [{"ts": t, "reason": r} for t, r in pairs] == ev.load_reason_rows(S, S + timedelta(hours=2), p)
+
+
+@pytest.mark.gate_ops
+def test_sha256_file_reuses_digest_until_file_changes(tmp_path, monkeypatch):
+    p = tmp_path / "catalog.json"
+    p.write_text(json.dumps({"v": 1}), encoding="utf-8")
+    reads = []
+    real = etag_mod._sha256_bytes
+    monkeypatch.setattr(etag_mod, "_sha256_bytes", lambda b: reads.append(1) or real(b))
+    h1 = etag_mod.sha256_file(str(p))
+    assert etag_mod.sha256_file(str(p)) == h1 and len(reads) == 1
+    p.write_text(json.dumps({"v": 2}), encoding="utf-8")
+    st = os.stat(p)
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert etag_mod.sha256_file(str(p)) != h1 and len(reads) == 2
+    assert etag_mod.sha256_file(str(tmp_path / "missing.json")) is None
+    assert etag_mod.sha256_file(str(tmp_path)) is None
@@ -90,3 +90,23 @@ def test_redis_roundtrip_if_available():
         assert result == {"v": 1}
     except Exception as e:
         pytest.skip(f"Redis not available: {e}")
+
+@pytest.mark.gate_ops
+def test_redis_store_honours_legacy_prefix_env(monkeypatch):
+    """예전 DECISIONOS_ETAG_PREFIX 만 설정된 배포도 같은 키 공간을 씀"""
+    from types import SimpleNamespace
+
+    from apps.infra.redis_stub import InMemoryRedis
+    from apps.ops.cache import etag_store
+
+    r = InMemoryRedis()
+    monkeypatch.setattr(etag_store, "_try_import_redis", lambda: SimpleNamespace(from_url=lambda url: r))
+    monkeypatch.delenv("DECISIONOS_ETAG_REDIS_PREFIX", raising=False)
+    monkeypatch.setenv("DECISIONOS_ETAG_PREFIX", "legacy:etag:")
+    s = etag_store.RedisETagStore(url="redis://stub")
+    s.put("k", {"v": 1}, ttl_sec=60)
+    assert s.prefix == "legacy:etag"
+    assert r.get("legacy:etag:k") is not None
+
+    monkeypatch.setenv("DECISIONOS_ETAG_REDIS_PREFIX", "dos:new")
+    assert etag_store.RedisETagStore(url="redis://stub").prefix == "dos:new"
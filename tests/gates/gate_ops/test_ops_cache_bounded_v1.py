@@ -0,0 +1,96 @@
+import gc
+import math
+import threading
+import time
+import weakref
+
+import pytest
+
+from apps.ops.cache.lru import BoundedCache, encode_json
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.gate_ops
+def test_lru_eviction_by_entries_and_bytes():
+    c = BoundedCache(max_entries=2, max_bytes=1024, sweep_interval_s=0)
+    c.put("a", {"v": 1})
+    c.put("b", {"v": 2})
+    assert c.get("a") is not None  # a 가 최근 사용
+    c.put("c", {"v": 3})  # b 축출
+    assert c.get("b") is None and "a" in c and "c" in c
+
+    small = BoundedCache(max_entries=100, max_bytes=30, sweep_interval_s=0)
+    small.put("x", {"pad": "x" * 10})
+    small.put("y", {"pad": "y" * 10})  # 바이트 상한 초과 → x 축출
+    assert "x" not in small and "y" in small
+    small.put("huge", {"pad": "z" * 100})  # 상한보다 큰 엔트리는 저장 안 함
+    assert "huge" not in small and "y" in small
+    st = c.stats()
+    assert (st["entries"], st["evictions"], st["hits"], st["misses"]) == (2, 1, 1, 1)
+
+
+@pytest.mark.gate_ops
+def test_ttl_and_clear_expired_with_encoded_body():
+    clock = Clock()
+    c = BoundedCache(default_ttl=10, sweep_interval_s=0, clock=clock)
+    entry = c.put("k", {"b": 1, "a": 2})
+    assert (entry.etag, entry.body) == encode_json({"a": 2, "b": 1})
+    c.put("forever", {"v": 1}, ttl_sec=math.inf)
+    clock.now += 11
+    assert c.clear_expired() == 1
+    assert c.get("k") is None and c.get("forever") is not None
+    assert c.stats()["bytes"] == len(encode_json({"v": 1})[1])
+
+
+@pytest.mark.gate_ops
+def test_concurrent_misses_compute_once():
+    c = BoundedCache(sweep_interval_s=0)
+    calls = []
+    gate = threading.Event()
+
+    def compute():
+        calls.append(1)
+        gate.wait(5)
+        return c.entry({"v": len(calls)}, 60)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(c.get_or_compute("k", compute))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)
+    gate.set()
+    for t in threads:
+        t.join(5)
+    assert len(calls) == 1
+    assert len(results) == 8 and all(r.payload == {"v": 1} for r in results)
+    assert c.stats()["coalesced"] == 7
+
+
+@pytest.mark.gate_ops
+def test_sweeper_removes_expired_entries():
+    c = BoundedCache(default_ttl=0.05, sweep_interval_s=0.05)
+    c.put("k", {"v": 1})
+    deadline = time.time() + 3
+    while len(c) and time.time() < deadline:
+        time.sleep(0.05)
+    assert len(c) == 0 and c.stats()["expirations"] == 1
+
+
+@pytest.mark.gate_ops
+def test_sweeper_does_not_keep_swept_cache_alive():
+    c = BoundedCache(default_ttl=0.01, sweep_interval_s=0.05)
+    c.put("k", {"v": 1})
+    deadline = time.time() + 3
+    while c.stats()["expirations"] == 0 and time.time() < deadline:
+        time.sleep(0.05)
+    ref = weakref.ref(c)
+    del c
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,74 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from apps.ops.cards import events as ev
+
+
+def _w(ts, reason):
+    return json.dumps({"ts": ts.isoformat(), "reason": reason})
+
+
+S = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def _scan_reasons(start, end, path):
+    return [reason for _, reason in ev._scan(start, end, path)]
+
+
+@pytest.mark.gate_ops
+def test_index_matches_full_scan(tmp_path):
+    p = tmp_path / "reasons.jsonl"
+    lines = [_w(S + timedelta(minutes=7 * i), f"reason:r{i % 5}") for i in range(500)]
+    p.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    for hours in (1, 6, 24, 72):
+        start, end = S + timedelta(hours=3), S + timedelta(hours=3 + hours)
+        assert ev.load_reason_events(start, end, str(p)) == _scan_reasons(start, end, str(p))
+    assert os.path.exists(str(p) + ev.INDEX_SUFFIX)
+
+
+@pytest.mark.gate_ops
+def test_incremental_append_and_partial_tail(tmp_path):
+    p = tmp_path / "reasons.jsonl"
+    p.write_text(_w(S, "reason:a") + "\n", encoding="utf-8")
+    win = (S, S + timedelta(hours=1))
+    assert ev.load_reason_events(*win, str(p)) == ["reason:a"]
+
+    ev.append_reason_event("reason:b", ts=(S + timedelta(minutes=5)).isoformat(), path=str(p))
+    assert ev.load_reason_events(*win, str(p)) == ["reason:a", "reason:b"]
+    assert ev.get_reason_index(str(p)).count() == 2
+
+    # 개행 없는 마지막 줄도 조회에는 포함되지만 인덱스에는 아직 적재되지 않음
+    with open(p, "a", encoding="utf-8") as f:
+        f.write(_w(S + timedelta(minutes=9), "reason:c"))
+    assert ev.load_reason_events(*win, str(p)) == ["reason:a", "reason:b", "reason:c"]
+    assert ev.get_reason_index(str(p)).count() == 2
+
+    rows = ev.load_reason_rows(S + timedelta(minutes=4), S + timedelta(minutes=6), str(p))
+    assert rows == [{"ts": (S + timedelta(minutes=5)).isoformat(), "reason": "reason:b"}]
+
+
+@pytest.mark.gate_ops
+def test_rewritten_file_triggers_rebuild(tmp_path):
+    p = tmp_path / "reasons.jsonl"
+    p.write_text(_w(S, "reason:old") + "\n", encoding="utf-8")
+    win = (S, S + timedelta(hours=1))
+    assert ev.load_reason_events(*win, str(p)) == ["reason:old"]
+
+    # 같은 inode 로 더 긴 내용을 덮어써도 지문 불일치로 재구축
+    p.write_text(_w(S, "reason:new") + "\n" + _w(S, "reason:new2") + "\n", encoding="utf-8")
+    assert ev.load_reason_events(*win, str(p)) == ["reason:new", "reason:new2"]
+
+
+@pytest.mark.gate_ops
+def test_build_reason_index_migration(tmp_path, monkeypatch):
+    p = tmp_path / "reasons.jsonl"
+    p.write_text("\n".join(_w(S + timedelta(hours=i), "reason:x") for i in range(10)) + "\n", encoding="utf-8")
+    assert ev.build_reason_index(str(p)) == 10
+    assert ev.build_reason_index(str(p), rebuild=True) == 10
+
+    monkeypatch.setenv("DECISIONOS_REASON_INDEX", "0")
+    assert len(ev.load_reason_events(S, S + timedelta(hours=3), str(p))) == 3
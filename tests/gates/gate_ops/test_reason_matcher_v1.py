@@ -0,0 +1,55 @@
+import json, os, random
+import pytest
+
+import apps.ops.cards.aggregation as agg
+from apps.ops.cards.reason_matcher import ReasonGroupMatcher
+
+GROUPS = [
+    {"name": "Infra", "match": ["reason:infra-*", "reason:net"]},
+    {"name": "Perf", "match": ["reason:perf*"]},
+    {"name": "Canary", "match": ["reason:canary"]},
+    {"name": "All", "match": ["*"]},
+    {"name": "Infra", "match": ["reason:infra-latency"]},
+]
+
+def _legacy_counts(groups_cfg, reasons):
+    hits = {}
+    for r in reasons:
+        hits[r] = hits.get(r, 0) + 1
+    out = {}
+    for g in groups_cfg:
+        match = set(g["match"])
+        cnt = sum(hits[r] for r in hits if r in match or any(r.startswith(m.rstrip("*")) for m in match))
+        out[g["name"]] = out.get(g["name"], 0) + cnt
+    return out
+
+@pytest.mark.gate_ops
+def test_matcher_matches_legacy_loop():
+    pool = ["reason:infra-latency", "reason:infra-error", "reason:infra", "reason:net", "reason:network",
+            "reason:perf", "reason:perf-cpu", "reason:canary", "reason:canary-x", "reason:other", "x", ""]
+    rnd = random.Random(7)
+    reasons = [rnd.choice(pool) for _ in range(500)]
+    m = ReasonGroupMatcher(GROUPS)
+    counts = {}
+    for r in reasons:
+        counts[r] = counts.get(r, 0) + 1
+    assert m.count(counts) == _legacy_counts(GROUPS, reasons)
+    assert m.groups_for("reason:infra-latency") == ["Infra", "All", "Infra"]
+    assert m.groups_for("reason:other") == ["All"]
+
+@pytest.mark.gate_ops
+def test_aggregate_reloads_when_groups_file_changes(tmp_path, monkeypatch):
+    p = tmp_path / "reason_groups.json"
+    p.write_text(json.dumps({"groups": [{"name": "Perf", "match": ["reason:perf*"]}], "weights": {"Perf": 2}}), encoding="utf-8")
+    monkeypatch.setattr(agg, "GROUP_PATH", str(p))
+    out = agg.aggregate_reasons(["reason:perf", "reason:infra-error"])
+    assert out["groups"] == {"Perf": 1} and out["weighted"] == {"Perf": 2.0}
+    m1 = agg.reason_group_matcher()
+    assert agg.reason_group_matcher() is m1  # 같은 리비전 → 재컴파일 없음
+
+    p.write_text(json.dumps({"groups": [{"name": "Infra", "match": ["reason:infra-*"]}], "weights": {}}), encoding="utf-8")
+    st = os.stat(p)
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    out = agg.aggregate_reasons(["reason:perf", "reason:infra-error"])
+    assert out["groups"] == {"Infra": 1} and out["weights"] == {}
+    assert agg.reason_group_matcher() is not m1
@@ -0,0 +1,128 @@
+import json
+import os
+import time
+
+import pytest
+
+from apps.common.compress import CompressionPolicy, is_gzip
+from apps.infra.redis_stub import InMemoryRedis
+from apps.ops.cache.snapshot_store import SnapshotStore
+from apps.ops.cache.tiered import TieredCache
+
+
+def _wait(pred, timeout=3.0):
+    deadline = time.time() + timeout
+    while not pred() and time.time() < deadline:
+        time.sleep(0.02)
+    return pred()
+
+
+@pytest.mark.gate_ops
+def test_l1_serves_repeat_reads_and_pubsub_evicts_peers():
+    r = InMemoryRedis()
+    a = TieredCache("t", r, l1_ttl=60)
+    b = TieredCache("t", r, l1_ttl=60)
+    try:
+        a.set("k", {"v": 1})
+        assert _wait(lambda: b.stats()["invalidations"] == 1)
+        assert b.get("k") == {"v": 1}
+        assert b.get("k") == {"v": 1}
+        assert b.stats()["l2_hits"] == 1  # 두 번째는 L1
+
+        a.set("k", {"v": 2})
+        assert _wait(lambda: b.stats()["invalidations"] == 2)
+        assert b.get("k") == {"v": 2}
+        assert a.stats()["invalidations"] == 0  # 자기 메시지는 무시
+
+        a.delete("k")
+        assert _wait(lambda: b.stats()["invalidations"] == 3)
+        assert b.get("k") is None
+    finally:
+        a.close()
+        b.close()
+
+
+@pytest.mark.gate_ops
+def test_get_many_uses_single_mget_for_l1_misses():
+    r = InMemoryRedis()
+    calls = []
+    orig = r.mget
+    r.mget = lambda keys, *a: calls.append(list(keys)) or orig(keys, *a)
+    c = TieredCache("t", r, key_prefix="p:", l1_ttl=60)
+    try:
+        c.set_many({"a": 1, "b": 2, "c": 3})
+        c.invalidate_local()
+        c.get("a")  # L1 로 다시 올라옴
+        assert c.get_many(["a", "b", "c", "missing"]) == {"a": 1, "b": 2, "c": 3}
+        assert calls == [["p:b", "p:c", "p:missing"]]
+    finally:
+        c.close()
+
+
+@pytest.mark.gate_ops
+def test_namespace_compression_policy_applies_to_l2_values():
+    r = InMemoryRedis()
+    big = {"rows": ["x" * 64] * 64}
+    gz = TieredCache("t", r, key_prefix="gz:", policy=CompressionPolicy(codec="gzip", min_bytes=256))
+    raw = TieredCache("t", r, key_prefix="raw:", policy=CompressionPolicy(codec="none"))
+    try:
+        gz.set_many({"big": big, "small": {"v": 1}})
+        raw.set("big", big)
+        assert is_gzip(r.get("gz:big")) and not is_gzip(r.get("gz:small"))
+        assert not is_gzip(r.get("raw:big"))
+        gz.invalidate_local()
+        assert gz.get("big") == big
+    finally:
+        gz.close()
+        raw.close()
+
+
+@pytest.mark.gate_ops
+def test_l1_only_mode_and_snapshot_store_roundtrip():
+    c = TieredCache("t", None, default_ttl=60)
+    c.set("k", "v")
+    assert c.get("k") == "v" and c.get_many(["k", "x"]) == {"k": "v"}
+    assert c.delete("k") == 1 and c.get("k") is None
+
+    r = InMemoryRedis()
+    s1, s2 = SnapshotStore(redis=r), SnapshotStore(redis=r)
+    try:
+        s1.set("cards:1", "<html>" * 100)
+        body, ts = s2.get("cards:1")
+        assert body == "<html>" * 100 and ts > 0
+        assert s2.get_many(["cards:1", "cards:2"]).keys() == {"cards:1"}
+    finally:
+        s1._cache.close()
+        s2._cache.close()
+
+
+@pytest.mark.gate_ops
+def test_l1_only_snapshot_store_uses_snapshot_bounds_and_counts_oversize(monkeypatch, caplog):
+    monkeypatch.delenv("DECISIONOS_REDIS_DSN", raising=False)
+    monkeypatch.setenv("DECISIONOS_SNAPSHOT_MAX_BYTES", "512")
+    s = SnapshotStore()
+    assert s.stats()["l1"]["max_bytes"] == 512
+    s.set("small", "ok")
+    with caplog.at_level("WARNING", logger="apps.ops.cache.tiered"):
+        s.set("big", os.urandom(1024).hex())  # gzip 정책이어도 512 바이트를 넘도록 비압축성
+    assert s.get("small")[0] == "ok" and s.get("big") is None
+    assert s.stats()["l1_oversize"] == 1
+    assert "exceeds L1 max_bytes" in caplog.text
+
+
+@pytest.mark.gate_ops
+def test_ops_redis_etag_store_keeps_plain_sorted_json(monkeypatch):
+    from types import SimpleNamespace
+
+    from apps.ops.cache import etag_store
+
+    r = InMemoryRedis()
+    monkeypatch.setattr(etag_store, "_try_import_redis", lambda: SimpleNamespace(from_url=lambda url: r))
+    s = etag_store.RedisETagStore(url="redis://stub", prefix="t:etag")
+    try:
+        s.put("k", {"rows": ["x" * 64] * 128}, ttl_sec=60)
+        blob = r.get("t:etag:k")
+        assert not is_gzip(blob)
+        assert list(json.loads(blob)) == ["etag", "exp", "payload"]
+    finally:
+        s._cache.close()
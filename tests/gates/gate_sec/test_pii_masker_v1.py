@@ -17,3 +17,35 @@ def test_mask_event_dict(monkeypatch):
     data = {"message": "call 010-1234-5678"}
     masked = mask_event(data)
     assert masked["message"] != data["message"]
+
+
+def test_build_masker_cached_and_invalidated_on_profile_change(monkeypatch, tmp_path):
+    import json
+
+    from apps.common.pii.masker import build_masker
+
+    prof = tmp_path / "profile.json"
+    prof.write_text(json.dumps({"patterns": {"email": r"(?i)[a-z0-9.]+@[a-z0-9.]+\.[a-z]{2,}"}}), encoding="utf-8")
+    monkeypatch.setenv("DECISIONOS_PII_PROFILE", str(prof))
+    monkeypatch.setenv("DECISIONOS_PII_MASK_TOKEN", "[MASK]")
+    m1 = build_masker()
+    assert build_masker() is m1
+    assert m1.mask_text("a@B.com 010-1234-5678") == "[MASK] 010-1234-5678"
+
+    prof.write_text(json.dumps({"patterns": {"phone": r"01[0-9]-\d{4}-\d{4}"}}), encoding="utf-8")
+    os.utime(prof, ns=(0, 10**18))
+    m2 = build_masker()
+    assert m2 is not m1
+    assert m2.mask_text("a@B.com 010-1234-5678") == "a@B.com [MASK]"
+
+
+def test_mask_event_copy_on_write(monkeypatch):
+    monkeypatch.setenv("DECISIONOS_PII_MASK_TOKEN", "[MASK]")
+    clean = {"n": 1, "tags": ["a", "b"]}
+    data = {"clean": clean, "user": {"email": "x@example.com", "id": 7}, "items": ["ok", "y@example.com"]}
+    masked = mask_event(data)
+    assert masked["user"]["email"] == "[MASK]"
+    assert masked["items"] == ["ok", "[MASK]"]
+    assert masked["clean"] is clean  # 변경 없는 하위 트리는 공유
+    assert data["user"]["email"] == "x@example.com"  # 입력은 변경되지 않음
+    assert mask_event(clean) is clean
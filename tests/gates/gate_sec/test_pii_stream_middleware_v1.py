@@ -0,0 +1,85 @@
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from apps.common.pii.masker import PIIMasker
+from apps.common.pii.patterns import _DEFAULT_PROFILE
+from apps.common.pii.stream import JSONStreamMasker
+from apps.security.pii_middleware import PIIMiddleware
+
+pytestmark = pytest.mark.gate_sec
+
+
+def _masker():
+    return PIIMasker(profile=_DEFAULT_PROFILE, mask_token="[MASK]", allowlist=["safe"])
+
+
+DOC = {
+    "a": "mail x@y.com",
+    "safe": {"e": "z@w.com"},
+    "l": ["010-1234-5678", 1, None, {"safe": "q@q.io"}],
+    "n": 9001011234567,
+    "k\"ey": "esc\"a@b.com\\",
+    "x@y.com": "키는 마스킹하지 않음",
+}
+
+
+def test_stream_masker_matches_mask_event_across_chunk_splits():
+    m = _masker()
+    body = json.dumps(DOC, ensure_ascii=False).encode("utf-8")
+    expected = m.mask_event(DOC)
+    for size in (1, 3, 7, 16, len(body)):
+        sm = JSONStreamMasker(m)
+        out = b"".join(sm.feed(body[i : i + size]) for i in range(0, len(body), size))
+        out += sm.feed(b"", final=True)
+        assert json.loads(out) == expected
+
+
+def test_stream_masker_clean_body_passthrough_and_oversize():
+    m = _masker()
+    clean = json.dumps({"a": "hello", "b": [1, 2, 3]}).encode()
+    assert JSONStreamMasker(m).mask_once(clean) is clean
+
+    body = json.dumps({"a": "x" * 5000 + "a@b.com", "b": "c@d.com", "c": 1}).encode()
+    sm = JSONStreamMasker(m, max_buffer=100)
+    out = b"".join(sm.feed(body[i : i + 64]) for i in range(0, len(body), 64)) + sm.feed(b"", final=True)
+    assert json.loads(out) == {"a": "[MASK]", "b": "[MASK]", "c": 1}
+
+
+def test_stream_masker_anchored_profile_skips_prefilter():
+    m = PIIMasker(profile={"patterns": {"acct": r"^\d{6}$"}}, mask_token="[MASK]")
+    body = json.dumps({"acct": "123456", "memo": "x123456"}).encode()
+    assert m.has_candidates(body.decode())  # 앵커 패턴은 본문 전체 탐색으로 배제 불가
+    assert json.loads(JSONStreamMasker(m).mask_once(body)) == {"acct": "[MASK]", "memo": "x123456"}
+
+
+def _app():
+    app = FastAPI()
+    app.add_middleware(PIIMiddleware, response_fields=[])
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return await request.json()
+
+    @app.get("/stream")
+    def stream():
+        parts = [b'{"items": [', b'"010-1234', b'-5678", ', b'"ok"]}']
+        return StreamingResponse(iter(parts), media_type="application/json")
+
+    return app
+
+
+def test_middleware_masks_request_and_streaming_response(monkeypatch):
+    monkeypatch.setenv("DECISIONOS_PII_ENABLE", "1")
+    monkeypatch.setenv("DECISIONOS_PII_MASK_TOKEN", "[MASK]")
+    client = TestClient(_app())
+
+    resp = client.post("/echo", json={"email": "a@b.com", "n": 1})
+    assert resp.json() == {"email": "[MASK]", "n": 1}
+    assert int(resp.headers["content-length"]) == len(resp.content)
+
+    resp = client.get("/stream")
+    assert resp.json() == {"items": ["[MASK]", "ok"]}
@@ -0,0 +1,82 @@
+import datetime as dt
+import json
+
+import pytest
+
+from apps.obs.evidence import reason_summary
+from apps.obs.evidence.indexer import write_index
+from apps.ops.reports.reason_trend import aggregate_reason_trend, get_index_signature
+
+pytestmark = [pytest.mark.gate_t]
+
+
+def _iso(hours_ago: float) -> str:
+    stamp = dt.datetime.now(dt.timezone.utc) - dt.timedelta(hours=hours_ago)
+    return stamp.isoformat().replace("+00:00", "Z")
+
+
+def _write(path, hours_ago: float, codes) -> None:
+    payload = {
+        "meta": {"generated_at": _iso(hours_ago)},
+        "judges": [{"reasons": [{"code": c} for c in codes]}],
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _shape(trend):
+    return dict(trend["total_top"]), {d: dict(p) for d, p in trend["by_day"].items()}, trend["count_evidence"]
+
+
+def test_sidecar_matches_full_scan(tmp_path):
+    evdir = tmp_path / "evidence"
+    evdir.mkdir()
+    _write(evdir / "evidence-a.json", 1, ["perf.p95_over", "quota.forbidden_action"])
+    _write(evdir / "evidence-b.json", 30, ["perf.p95_over"])
+    _write(evdir / "evidence-c.json", 24 * 3 - 0.5, ["budget.exceeded"])  # 경계 날짜(부분 포함)
+    _write(evdir / "evidence-d.json", 24 * 3 + 0.5, ["budget.exceeded"])  # 윈도 밖
+    _write(evdir / "evidence-e.json", 24 * 10, ["perf.p95_over"])
+    index_path = write_index(str(evdir))
+
+    summary = reason_summary.load_summary(index_path)
+    assert summary is not None and set(summary["rows"]) >= {"evidence-a.json", "evidence-e.json"}
+    fast = aggregate_reason_trend(str(evdir), days=3)
+
+    reason_summary.sidecar_path(index_path).unlink()
+    assert reason_summary.load_summary(index_path) is None
+    slow = aggregate_reason_trend(str(evdir), days=3)
+    assert _shape(fast) == _shape(slow)
+    assert dict(fast["total_top"])["budget.exceeded"] == 1
+
+
+def test_revision_counter_and_incremental_rows(tmp_path, monkeypatch):
+    evdir = tmp_path / "evidence"
+    evdir.mkdir()
+    _write(evdir / "evidence-a.json", 1, ["perf.p95_over"])
+    _write(evdir / "evidence-b.json", 2, ["perf.p95_over"])
+    write_index(str(evdir))
+    sig1, _ = get_index_signature(str(evdir))
+
+    built = []
+    original = reason_summary.build_row
+    monkeypatch.setattr(reason_summary, "build_row", lambda *a: built.append(a[1]) or original(*a))
+    write_index(str(evdir))
+    assert built == [] and get_index_signature(str(evdir))[0] == sig1  # 변화 없음 → 리비전 유지
+
+    _write(evdir / "evidence-b.json", 2, ["quota.forbidden_action"])
+    write_index(str(evdir))
+    assert len(built) == 1  # 바뀐 파일만 다시 읽음
+    sig2, _ = get_index_signature(str(evdir))
+    assert sig2 != sig1
+    assert dict(aggregate_reason_trend(str(evdir), days=1)["total_top"]) == {"perf.p95_over": 1, "quota.forbidden_action": 1}
+
+
+def test_stale_sidecar_falls_back_to_index_hash(tmp_path):
+    evdir = tmp_path / "evidence"
+    evdir.mkdir()
+    _write(evdir / "evidence-a.json", 1, ["perf.p95_over"])
+    index_path = write_index(str(evdir))
+    (evdir / "index.json").write_text(json.dumps({"files": []}), encoding="utf-8")  # 인덱서 밖에서 재작성
+    assert reason_summary.load_summary(index_path) is None
+    sig, _ = get_index_signature(str(evdir))
+    assert len(sig) == 64
+    assert aggregate_reason_trend(str(evdir), days=1)["count_evidence"] == 0
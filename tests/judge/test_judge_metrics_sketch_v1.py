@@ -0,0 +1,73 @@
+# tests/judge/test_judge_metrics_sketch_v1.py
+"""
+JudgeMetrics sketch 모드 (버킷 링 + DDSketch) 검증.
+
+- 백분위가 exact 모드 대비 문서화된 상대 오차 이내
+- 카운터 기반 비율은 exact 모드와 동일
+- 윈도우 밖 버킷은 summary 에서 제외
+"""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from apps.common.quantile import DDSketch
+from apps.judge import metrics as judge_metrics
+from apps.judge.metrics import JudgeMetrics
+
+
+def test_ddsketch_relative_error_bound():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(4.0, 1.2) for _ in range(20000)]
+    sketch = DDSketch(relative_accuracy=0.01)
+    for v in values:
+        sketch.add(v)
+    ordered = sorted(values)
+    for q in (0.5, 0.9, 0.95, 0.99, 0.999):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert abs(sketch.quantile(q) - exact) <= 0.01 * exact + 1e-9
+
+
+def test_ddsketch_merge_equals_single():
+    a, b, both = DDSketch(), DDSketch(), DDSketch()
+    for i in range(1, 500):
+        (a if i % 2 else b).add(float(i))
+        both.add(float(i))
+    a.merge(b)
+    assert a.quantiles([0.5, 0.99]) == both.quantiles([0.5, 0.99])
+    assert a.count == both.count
+
+
+def test_sketch_mode_matches_exact_mode():
+    rng = random.Random(11)
+    sketch = JudgeMetrics(window_seconds=600, mode="sketch")
+    exact = JudgeMetrics(window_seconds=600, mode="exact")
+    for i in range(5000):
+        latency = rng.uniform(5.0, 900.0)
+        status = 500 if i % 97 == 0 else (429 if i % 89 == 0 else 200)
+        sig = i % 53 == 0
+        sketch.observe(latency, status, sig)
+        exact.observe(latency, status, sig)
+    s, e = sketch.summary(), exact.summary()
+    assert s["count"] == e["count"] == 5000
+    for key in ("availability", "error_rate", "signature_error_rate"):
+        assert s[key] == e[key]
+    for p in ("p50", "p95", "p99"):
+        assert s["latency_ms"][p] == pytest.approx(e["latency_ms"][p], rel=0.02)
+
+
+def test_sketch_mode_drops_expired_buckets(monkeypatch):
+    clock = {"now": 1_000_000.0}
+    monkeypatch.setattr(judge_metrics.time, "time", lambda: clock["now"])
+    m = JudgeMetrics(window_seconds=60, mode="sketch", bucket_seconds=10)
+    m.observe(100.0, 200, False)
+    clock["now"] += 30
+    m.observe(200.0, 500, False)
+    assert m.summary()["count"] == 2
+    clock["now"] += 45
+    summary = m.summary()
+    assert summary["count"] == 1
+    assert summary["availability"] == 0.0
+    clock["now"] += 600
+    assert m.summary()["count"] == 0
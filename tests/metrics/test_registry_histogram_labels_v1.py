@@ -0,0 +1,86 @@
+"""Tests for labeled metrics, Histogram and Summary in apps.common.metrics."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from apps.common.metrics import Registry
+
+
+def test_labeled_counter_renders_per_series():
+    reg = Registry()
+    c = reg.counter("http_requests_total", "Requests", labelnames=("route", "status"))
+    c.labels(route="/judge", status="200").inc()
+    c.labels("/judge", "200").inc(2)
+    c.labels(route="/judge", status="401").inc()
+    text = reg.render_text()
+    assert "# TYPE http_requests_total counter" in text
+    assert 'http_requests_total{route="/judge",status="200"} 3' in text
+    assert 'http_requests_total{route="/judge",status="401"} 1' in text
+
+
+def test_labeled_metric_requires_labels():
+    reg = Registry()
+    c = reg.counter("needs_labels_total", labelnames=("route",))
+    with pytest.raises(ValueError):
+        c.inc()
+    with pytest.raises(ValueError):
+        c.labels(status="200")
+
+
+def test_histogram_cumulative_buckets():
+    reg = Registry()
+    h = reg.histogram("latency_seconds", "Latency", buckets=(0.1, 0.5, 1.0))
+    for v in (0.05, 0.1, 0.3, 0.7, 2.0):
+        h.observe(v)
+    text = reg.render_text()
+    assert 'latency_seconds_bucket{le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{le="0.5"} 3' in text
+    assert 'latency_seconds_bucket{le="1.0"} 4' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 5' in text
+    assert "latency_seconds_count 5" in text
+    assert "latency_seconds_sum 3.15" in text
+
+
+def test_summary_quantiles_and_count():
+    reg = Registry()
+    s = reg.summary("payload_bytes", labelnames=("route",), quantiles=(0.5, 0.99))
+    child = s.labels(route="/judge")
+    for v in range(1, 101):
+        child.observe(float(v))
+    values, total, count = child.get()
+    assert count == 100 and total == pytest.approx(5050.0)
+    assert values[0] == pytest.approx(50.0, rel=0.02)
+    text = reg.render_text()
+    assert 'payload_bytes{route="/judge",quantile="0.5"}' in text
+    assert 'payload_bytes_count{route="/judge"} 100' in text
+
+
+def test_striped_counter_concurrent_increments():
+    reg = Registry()
+    c = reg.counter("striped_total")
+
+    def work():
+        for _ in range(5000):
+            c.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert c.get() == 40000
+
+
+def test_render_text_reuses_unchanged_series():
+    reg = Registry()
+    c = reg.counter("cached_total", labelnames=("k",))
+    c.labels(k="a").inc()
+    c.labels(k="b").inc()
+    reg.render_text()
+    cached_a = reg._render_cache[("counter", "cached_total", ("a",))][1]
+    c.labels(k="b").inc()
+    text = reg.render_text()
+    assert reg._render_cache[("counter", "cached_total", ("a",))][1] is cached_a
+    assert 'cached_total{k="b"} 2' in text